@@ -0,0 +1,156 @@
+"""
+AuraQuant Auth Activity Cache
+Keeps hot login/session counters in Redis and flushes them to Postgres in batches
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import redis.asyncio as redis
+from sqlalchemy import case, update
+from sqlalchemy.orm import Session
+
+from models.database import User, UserSession
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 60  # seconds
+FLUSH_BATCH = 1000
+
+DIRTY_USERS_KEY = "auth:dirty_users"
+DIRTY_SESSIONS_KEY = "auth:dirty_sessions"
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+def _apply(db: Session, failed: Dict[uuid.UUID, int], last_login: Dict[uuid.UUID, datetime],
+           activity: Dict[uuid.UUID, datetime]) -> int:
+    """One CASE-based UPDATE per table and a commit; blocking, run in a worker thread"""
+    if failed:
+        values = {"failed_login_attempts": case(failed, value=User.id)}
+        if last_login:
+            values["last_login"] = case(last_login, value=User.id, else_=User.last_login)
+        db.execute(update(User).where(User.id.in_(list(failed))).values(**values))
+    if activity:
+        db.execute(
+            update(UserSession)
+            .where(UserSession.id.in_(list(activity)))
+            .values(last_activity=case(activity, value=UserSession.id))
+        )
+    db.commit()
+    return len(failed) + len(activity)
+
+class AuthActivityCache:
+    """
+    Redis home for failed_login_attempts, last_login and last_activity.
+    The SQL columns are cold storage, updated by flush() rather than per request.
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    @staticmethod
+    def _user_key(user_id: str) -> str:
+        return f"user:{user_id}"
+
+    @staticmethod
+    def _activity_key(session_id: str) -> str:
+        return f"user:sess:{session_id}:last_activity"
+
+    # Request path
+
+    async def incr_failed_login(self, user_id: str) -> int:
+        """Count a failed login and return the running total"""
+        pipe = self.redis.pipeline()
+        pipe.hincrby(self._user_key(user_id), "failed_logins", 1)
+        pipe.sadd(DIRTY_USERS_KEY, user_id)
+        count, _ = await pipe.execute()
+        return int(count)
+
+    async def failed_logins(self, user_id: str) -> int:
+        value = await self.redis.hget(self._user_key(user_id), "failed_logins")
+        return int(value or 0)
+
+    async def record_login(self, user_id: str, when: Optional[datetime] = None):
+        """Reset the failure counter and stamp last_login"""
+        when = when or datetime.now(timezone.utc)
+        pipe = self.redis.pipeline()
+        pipe.hset(self._user_key(user_id), mapping={
+            "failed_logins": 0,
+            "last_login": when.isoformat(),
+        })
+        pipe.sadd(DIRTY_USERS_KEY, user_id)
+        await pipe.execute()
+
+    async def touch_session(self, session_id: str, when: Optional[datetime] = None):
+        """Stamp last_activity for a session"""
+        when = when or datetime.now(timezone.utc)
+        pipe = self.redis.pipeline()
+        pipe.set(self._activity_key(session_id), when.isoformat())
+        pipe.sadd(DIRTY_SESSIONS_KEY, session_id)
+        await pipe.execute()
+
+    async def last_activity(self, session_id: str) -> Optional[datetime]:
+        value = await self.redis.get(self._activity_key(session_id))
+        return datetime.fromisoformat(_decode(value)) if value else None
+
+    # Background flush
+
+    async def flush(self, db: Session) -> int:
+        """Write dirty counters back with one CASE-based UPDATE per table.
+        Popped ids go back into the dirty sets if the write fails."""
+        user_ids = [_decode(u) for u in await self.redis.spop(DIRTY_USERS_KEY, FLUSH_BATCH) or []]
+        session_ids = [_decode(s) for s in await self.redis.spop(DIRTY_SESSIONS_KEY, FLUSH_BATCH) or []]
+        try:
+            return await self._write(db, user_ids, session_ids)
+        except (Exception, asyncio.CancelledError):
+            pipe = self.redis.pipeline()
+            if user_ids:
+                pipe.sadd(DIRTY_USERS_KEY, *user_ids)
+            if session_ids:
+                pipe.sadd(DIRTY_SESSIONS_KEY, *session_ids)
+            await pipe.execute()
+            raise
+
+    async def _write(self, db: Session, user_ids: List[str], session_ids: List[str]) -> int:
+        """Read the counters from Redis, then run the UPDATEs off the event loop"""
+        failed: Dict[uuid.UUID, int] = {}
+        last_login: Dict[uuid.UUID, datetime] = {}
+        if user_ids:
+            pipe = self.redis.pipeline()
+            for user_id in user_ids:
+                pipe.hmget(self._user_key(user_id), "failed_logins", "last_login")
+            rows = await pipe.execute()
+
+            for user_id, (count, login) in zip(user_ids, rows):
+                key = uuid.UUID(user_id)
+                failed[key] = int(count or 0)
+                if login:
+                    last_login[key] = datetime.fromisoformat(_decode(login))
+
+        activity: Dict[uuid.UUID, datetime] = {}
+        if session_ids:
+            stamps = await self.redis.mget([self._activity_key(s) for s in session_ids])
+            activity = {
+                uuid.UUID(sid): datetime.fromisoformat(_decode(ts))
+                for sid, ts in zip(session_ids, stamps) if ts
+            }
+
+        if not failed and not activity:
+            return 0
+        return await asyncio.to_thread(_apply, db, failed, last_login, activity)
+
+    async def flush_with(self, session_factory: Callable[[], Session]) -> int:
+        """One scheduled flush in a fresh session; run every FLUSH_INTERVAL seconds"""
+        db = session_factory()
+        try:
+            return await self.flush(db)
+        except Exception as e:
+            logger.error(f"Auth activity flush failed: {e}")
+            await asyncio.to_thread(db.rollback)
+            return 0
+        finally:
+            await asyncio.to_thread(db.close)
@@ -5,9 +5,10 @@ JWT-based authentication with role-based access control and API key management
 
 import jwt
 import bcrypt
+import hashlib
 import secrets
 import pyotp
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Tuple
 from fastapi import HTTPException, Security, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
@@ -17,7 +18,9 @@ import redis.asyncio as redis
 from dataclasses import dataclass
 import json
 
-from ..models.database import User, UserSession, UserRole, AuditLog
+from models.database import User, UserSession, UserRole, AuditLog, uuid7
+from models import audit
+from .auth_cache import AuthActivityCache
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,10 @@ API_KEY_LENGTH = 64
 MAX_LOGIN_ATTEMPTS = 5
 LOCKOUT_DURATION_MINUTES = 30
 
+def hash_token(token: str) -> bytes:
+    """Session tokens are looked up by their SHA-256 digest, never stored raw"""
+    return hashlib.sha256(token.encode()).digest()
+
 security = HTTPBearer()
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
@@ -50,6 +57,7 @@ class AuthenticationManager:
     def __init__(self, db_session: Session, redis_client: redis.Redis = None):
         self.db = db_session
         self.redis = redis_client
+        self.activity = AuthActivityCache(redis_client) if redis_client else None
         self.pepper = secrets.token_urlsafe(16)  # Additional salt for passwords
         
     # Password Management
@@ -97,7 +105,7 @@ class AuthenticationManager:
             full_name=full_name,
             country=country,
             role=UserRole.VIEWER,  # Default role
-            created_at=datetime.utcnow()
+            created_at=datetime.now(timezone.utc)
         )
         
         # Generate API credentials
@@ -130,7 +138,7 @@ class AuthenticationManager:
             )
         
         # Check if account is locked
-        if user.locked_until and user.locked_until > datetime.utcnow():
+        if user.locked_until and user.locked_until > datetime.now(timezone.utc):
             raise HTTPException(
                 status_code=status.HTTP_423_LOCKED,
                 detail=f"Account locked until {user.locked_until}"
@@ -138,11 +146,15 @@ class AuthenticationManager:
         
         # Verify password
         if not self.verify_password(password, user.password_hash):
-            user.failed_login_attempts += 1
+            if self.activity:
+                failed_attempts = await self.activity.incr_failed_login(str(user.id))
+            else:
+                user.failed_login_attempts += 1
+                failed_attempts = user.failed_login_attempts
             
             # Lock account after max attempts
-            if user.failed_login_attempts >= MAX_LOGIN_ATTEMPTS:
-                user.locked_until = datetime.utcnow() + timedelta(minutes=LOCKOUT_DURATION_MINUTES)
+            if failed_attempts >= MAX_LOGIN_ATTEMPTS:
+                user.locked_until = datetime.now(timezone.utc) + timedelta(minutes=LOCKOUT_DURATION_MINUTES)
                 self.db.commit()
                 
                 await self._audit_log(user.id, "account_locked", "user", user.id,
@@ -153,7 +165,8 @@ class AuthenticationManager:
                     detail="Account locked due to multiple failed login attempts"
                 )
             
-            self.db.commit()
+            if not self.activity:
+                self.db.commit()
             
             await self._audit_log(user.id, "login_failed", "user", user.id,
                                 success=False, error="Invalid password")
@@ -188,28 +201,33 @@ class AuthenticationManager:
             )
         
         # Reset failed attempts on successful login
-        user.failed_login_attempts = 0
-        user.last_login = datetime.utcnow()
+        if self.activity:
+            await self.activity.record_login(str(user.id))
+        else:
+            user.failed_login_attempts = 0
+            user.last_login = datetime.now(timezone.utc)
+        
+        # Generate JWT tokens; the session stores only their digests
+        session_id = uuid7()
+        access_token = self._create_access_token(user, session_id)
+        refresh_token = self._create_refresh_token(user, session_id)
         
         # Create session
         session = UserSession(
+            id=session_id,
             user_id=user.id,
-            token=secrets.token_urlsafe(32),
-            refresh_token=secrets.token_urlsafe(32),
+            token_hash=hash_token(access_token),
+            refresh_token_hash=hash_token(refresh_token),
             ip_address=ip_address,
             user_agent=user_agent,
-            expires_at=datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
-            refresh_expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
-            created_at=datetime.utcnow()
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+            refresh_expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+            created_at=datetime.now(timezone.utc)
         )
         
         self.db.add(session)
         self.db.commit()
         
-        # Generate JWT tokens
-        access_token = self._create_access_token(user, session.id)
-        refresh_token = self._create_refresh_token(user, session.id)
-        
         # Cache session in Redis for fast lookup
         if self.redis:
             await self._cache_session(session, user)
@@ -232,29 +250,29 @@ class AuthenticationManager:
     
     def _create_access_token(self, user: User, session_id: str) -> str:
         """Create JWT access token"""
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         
         payload = {
-            "sub": user.id,
+            "sub": str(user.id),
             "email": user.email,
             "role": user.role.value,
-            "session_id": session_id,
+            "session_id": str(session_id),
             "exp": expire,
-            "iat": datetime.utcnow()
+            "iat": datetime.now(timezone.utc)
         }
         
         return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
     
     def _create_refresh_token(self, user: User, session_id: str) -> str:
         """Create JWT refresh token"""
-        expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
         
         payload = {
-            "sub": user.id,
-            "session_id": session_id,
+            "sub": str(user.id),
+            "session_id": str(session_id),
             "type": "refresh",
             "exp": expire,
-            "iat": datetime.utcnow()
+            "iat": datetime.now(timezone.utc)
         }
         
         return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
@@ -270,16 +288,17 @@ class AuthenticationManager:
             if self.redis:
                 # Check Redis cache first
                 cached = await self.redis.get(f"session:{session_id}")
-                if not cached:
+                if not cached or json.loads(cached).get("token_hash") != hash_token(token).hex():
                     raise HTTPException(
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail="Session expired or invalid"
                     )
+                await self.activity.touch_session(session_id)
             else:
                 # Check database
                 session = self.db.query(UserSession).filter(
-                    UserSession.id == session_id,
-                    UserSession.expires_at > datetime.utcnow()
+                    UserSession.token_hash == hash_token(token),
+                    UserSession.expires_at > datetime.now(timezone.utc)
                 ).first()
                 
                 if not session:
@@ -293,7 +312,7 @@ class AuthenticationManager:
                 email=payload["email"],
                 role=UserRole(payload["role"]),
                 session_id=session_id,
-                exp=datetime.fromtimestamp(payload["exp"])
+                exp=datetime.fromtimestamp(payload["exp"], timezone.utc)
             )
             
         except jwt.ExpiredSignatureError:
@@ -321,8 +340,8 @@ class AuthenticationManager:
             # Get user and session
             user = self.db.query(User).filter(User.id == payload["sub"]).first()
             session = self.db.query(UserSession).filter(
-                UserSession.id == payload["session_id"],
-                UserSession.refresh_expires_at > datetime.utcnow()
+                UserSession.refresh_token_hash == hash_token(refresh_token),
+                UserSession.refresh_expires_at > datetime.now(timezone.utc)
             ).first()
             
             if not user or not session:
@@ -334,9 +353,13 @@ class AuthenticationManager:
             # Create new access token
             new_access_token = self._create_access_token(user, session.id)
             
-            # Update session expiry
-            session.expires_at = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-            session.last_activity = datetime.utcnow()
+            # Rotate the stored access token digest and update session expiry
+            session.token_hash = hash_token(new_access_token)
+            session.expires_at = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            if self.activity:
+                await self.activity.touch_session(str(session.id))
+            else:
+                session.last_activity = datetime.now(timezone.utc)
             self.db.commit()
             
             # Update cache
@@ -384,7 +407,7 @@ class AuthenticationManager:
             await self.redis.setex(
                 f"api_key:{api_key}",
                 300,  # 5 minutes
-                json.dumps({"user_id": user.id})
+                json.dumps({"user_id": str(user.id)})
             )
         
         return user
@@ -548,7 +571,7 @@ class AuthenticationManager:
                 return False
         
         # Check W-8BEN expiry for US trading
-        if user.w8ben_expiry and user.w8ben_expiry < datetime.utcnow():
+        if user.w8ben_expiry and user.w8ben_expiry < datetime.now(timezone.utc):
             logger.warning(f"Login blocked - W-8BEN expired for user: {user.id}")
             return False
         
@@ -577,14 +600,15 @@ class AuthenticationManager:
             return
         
         session_data = {
-            "user_id": user.id,
+            "user_id": str(user.id),
             "email": user.email,
             "role": user.role.value,
-            "session_id": session.id,
+            "session_id": str(session.id),
+            "token_hash": session.token_hash.hex(),
             "expires_at": session.expires_at.isoformat()
         }
         
-        ttl = int((session.expires_at - datetime.utcnow()).total_seconds())
+        ttl = int((session.expires_at - datetime.now(timezone.utc)).total_seconds())
         
         await self.redis.setex(
             f"session:{session.id}",
@@ -598,18 +622,22 @@ class AuthenticationManager:
                         ip_address: Optional[str] = None):
         """Create audit log entry"""
         
-        audit = AuditLog(
-            user_id=user_id,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            success=success,
-            error_message=error,
-            ip_address=ip_address,
-            timestamp=datetime.utcnow()
-        )
+        entry = {
+            "user_id": user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": str(entity_id) if entity_id is not None else None,
+            "success": success,
+            "error_message": error,
+            "ip_address": ip_address,
+            "timestamp": datetime.now(timezone.utc)
+        }
+        
+        # Off the request path when the write-behind worker is running
+        if audit.enqueue(entry):
+            return
         
-        self.db.add(audit)
+        self.db.add(AuditLog(**entry))
         self.db.commit()
 
 # FastAPI Dependencies
@@ -0,0 +1,57 @@
+"""
+AuraQuant Ticker
+One timer task for all of an app's periodic jobs
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Set
+
+class Ticker:
+    """Single timer for all periodic jobs - wakes every RESOLUTION seconds and
+    runs whichever jobs are due. Coroutine jobs run as tasks so a slow one
+    can't delay the others; a job still running when it comes due again is
+    skipped for that round."""
+    RESOLUTION = 0.1
+
+    def __init__(self):
+        self.jobs: List[List[Any]] = []  # [interval, fn, next_due, in-flight task]
+        self._running: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def every(self, seconds: float, fn: Callable[[], Any]):
+        self.jobs.append([seconds, fn, time.monotonic() + seconds, None])
+
+    @property
+    def running(self) -> Set[asyncio.Task]:
+        """Coroutine jobs currently in flight"""
+        return set(self._running)
+
+    def start(self):
+        """Start ticking on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """Stop ticking and wait for in-flight jobs to finish"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def run(self):
+        while True:
+            now = time.monotonic()
+            for job in self.jobs:
+                if now >= job[2]:
+                    job[2] = now + job[0]
+                    if job[3] is not None and not job[3].done():
+                        continue
+                    result = job[1]()
+                    if asyncio.iscoroutine(result):
+                        task = asyncio.create_task(result)
+                        job[3] = task
+                        self._running.add(task)
+                        task.add_done_callback(self._running.discard)
+            await asyncio.sleep(self.RESOLUTION)
@@ -8,7 +8,7 @@ import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import logging
-from sqlalchemy import create_engine
+from ..models.database import create_db_engine
 from influxdb_client import InfluxDBClient
 import redis.asyncio as redis
 
@@ -19,7 +19,7 @@ class DataManager:
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.postgres_engine = create_engine(config["database_url"])
+        self.postgres_engine = create_db_engine(config["database_url"])
         self.influx_client = InfluxDBClient(
             url=config.get("influx_url", "http://localhost:8086"),
             token=config.get("influx_token"),
@@ -7,10 +7,14 @@ import discord
 from discord.ext import commands, tasks
 import asyncio
 import aiohttp
+from array import array
 from typing import Dict, Any, List, Optional
 import json
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
+import math
+import operator
+import os
 from pathlib import Path
 import sys
 
@@ -21,6 +25,23 @@ from core.vault import APIVault
 
 logger = logging.getLogger(__name__)
 
+# Embed colors as raw ints (same values as the discord.Color factories)
+_COLOR_GREEN = 0x2ecc71
+_COLOR_RED = 0xe74c3c
+_COLOR_BLUE = 0x3498db
+_COLOR_ORANGE = 0xe67e22
+_COLOR_GOLD = 0xf1c40f
+_COLOR_PURPLE = 0x9b59b6
+
+# Market alert type -> embed color
+_MARKET_COLORS = {
+    'breakout': _COLOR_GOLD,
+    'momentum': _COLOR_PURPLE,
+    'volume': _COLOR_BLUE,
+    'halt': _COLOR_RED,
+    'news': _COLOR_ORANGE
+}
+
 class AuraQuantDiscordBot:
     """
     Discord bot for AuraQuant trading platform
@@ -35,6 +56,16 @@ class AuraQuantDiscordBot:
     # Your Discord Channel ID
     DEFAULT_CHANNEL_ID = 1407369896089616635
     
+    # Hot state lives in slots; background loops are bound per instance
+    # because tasks.Loop caches itself on the instance via setattr
+    __slots__ = (
+        'vault', 'channel_id', 'bot_token', 'webhook_urls', 'guild_id',
+        '_default_channel_id', '_channel_overrides', 'bot', 'bot_status', 'alert_settings',
+        '_pos_index', '_pos_symbols', '_pos_qty', '_pos_avg', '_pos_upnl',
+        '_help_lines',
+        '_periodic'
+    )
+    
     def __init__(self, vault: APIVault = None, channel_id: int = None):
         # Initialize vault for API credentials
         self.vault = vault or APIVault()
@@ -51,24 +82,20 @@ class AuraQuantDiscordBot:
                 self.guild_id = discord_creds.get('guild_id')
             else:
                 # Use environment variables as fallback
-                import os
                 self.bot_token = os.getenv('DISCORD_BOT_TOKEN', '')
                 self.webhook_urls = []
                 self.guild_id = None
                 logger.warning("Discord credentials not found in vault, using environment variables")
         except Exception as e:
             logger.error(f"Error loading Discord credentials: {e}")
-            import os
             self.bot_token = os.getenv('DISCORD_BOT_TOKEN', '')
+            self.webhook_urls = []
+            self.guild_id = None
         
-        # Channel configuration - use the provided channel ID for all channels
-        self.channels = {
-            'alerts': self.channel_id,
-            'trades': self.channel_id,
-            'performance': self.channel_id,
-            'logs': self.channel_id,
-            'commands': self.channel_id
-        }
+        # Channel configuration - everything goes to the provided channel ID
+        # unless a type ('alerts', 'trades', 'logs', ...) is routed elsewhere
+        self._default_channel_id = int(self.channel_id)
+        self._channel_overrides: Dict[str, int] = {}
         
         # Initialize bot with intents
         intents = discord.Intents.default()
@@ -86,12 +113,18 @@ class AuraQuantDiscordBot:
             'mode': 'V1',  # V1, V2, V3... V∞
             'is_running': False,
             'is_paper': True,
-            'positions': {},
             'balance': 0,
             'daily_pnl': 0,
             'win_rate': 0
         }
         
+        # Open positions, stored column-wise; _pos_index maps symbol -> row
+        self._pos_index: Dict[str, int] = {}
+        self._pos_symbols: List[str] = []
+        self._pos_qty = array('d')
+        self._pos_avg = array('d')
+        self._pos_upnl = array('d')
+        
         # Alert settings
         self.alert_settings = {
             'trade_alerts': True,
@@ -101,14 +134,11 @@ class AuraQuantDiscordBot:
             'emergency_alerts': True
         }
         
-        # Rate limiting
-        self.rate_limits = {
-            'messages_per_minute': 30,
-            'alerts_per_minute': 10,
-            'message_count': 0,
-            'alert_count': 0,
-            'reset_time': datetime.now()
-        }
+        # Rate limiting is left to discord.py, which tracks Discord's
+        # per-route buckets from the X-RateLimit-* headers and waits on 429s
+        
+        # Background task - one 30s loop for presence updates
+        self._periodic = tasks.loop(seconds=30)(self._run_periodic)
         
         # Setup bot commands and events
         self._setup_commands()
@@ -130,23 +160,22 @@ class AuraQuantDiscordBot:
                 )
             )
             
-            # Start background tasks
-            self.update_status.start()
-            self.check_rate_limits.start()
+            # Start background tasks (on_ready fires again after reconnects)
+            if not self._periodic.is_running():
+                self._periodic.start()
             
             # Send startup message
-            if self.channels['logs']:
-                channel = self.bot.get_channel(int(self.channels['logs']))
-                if channel:
-                    embed = discord.Embed(
-                        title="🚀 AuraQuant Bot Started",
-                        description="Trading bot is now online and monitoring markets",
-                        color=discord.Color.green(),
-                        timestamp=datetime.now()
-                    )
-                    embed.add_field(name="Mode", value=self.bot_status['mode'])
-                    embed.add_field(name="Paper Trading", value="Yes" if self.bot_status['is_paper'] else "No")
-                    await channel.send(embed=embed)
+            channel = self.bot.get_channel(self._channel_overrides.get('logs', self._default_channel_id))
+            if channel:
+                embed = discord.Embed(
+                    title="🚀 AuraQuant Bot Started",
+                    description="Trading bot is now online and monitoring markets",
+                    color=_COLOR_GREEN,
+                    timestamp=discord.utils.utcnow()
+                )
+                embed.add_field(name="Mode", value=self.bot_status['mode'])
+                embed.add_field(name="Paper Trading", value="Yes" if self.bot_status['is_paper'] else "No")
+                await channel.send(embed=embed)
         
         @self.bot.event
         async def on_message(message):
@@ -179,8 +208,8 @@ class AuraQuantDiscordBot:
             """Display current bot status"""
             embed = discord.Embed(
                 title="🤖 AuraQuant Bot Status",
-                color=discord.Color.blue() if self.bot_status['is_running'] else discord.Color.red(),
-                timestamp=datetime.now()
+                color=_COLOR_BLUE if self.bot_status['is_running'] else _COLOR_RED,
+                timestamp=discord.utils.utcnow()
             )
             
             embed.add_field(name="Status", value="🟢 Running" if self.bot_status['is_running'] else "🔴 Stopped")
@@ -189,7 +218,7 @@ class AuraQuantDiscordBot:
             embed.add_field(name="Balance", value=f"${self.bot_status['balance']:,.2f}")
             embed.add_field(name="Daily P&L", value=f"${self.bot_status['daily_pnl']:+,.2f}")
             embed.add_field(name="Win Rate", value=f"{self.bot_status['win_rate']:.1f}%")
-            embed.add_field(name="Positions", value=len(self.bot_status['positions']))
+            embed.add_field(name="Positions", value=len(self._pos_symbols))
             
             await ctx.send(embed=embed)
         
@@ -207,8 +236,8 @@ class AuraQuantDiscordBot:
             embed = discord.Embed(
                 title="✅ Bot Started",
                 description=f"Trading bot started in {self.bot_status['mode']} mode",
-                color=discord.Color.green(),
-                timestamp=datetime.now()
+                color=_COLOR_GREEN,
+                timestamp=discord.utils.utcnow()
             )
             await ctx.send(embed=embed)
             
@@ -228,8 +257,8 @@ class AuraQuantDiscordBot:
             embed = discord.Embed(
                 title="🛑 Bot Stopped",
                 description="Trading bot has been stopped",
-                color=discord.Color.red(),
-                timestamp=datetime.now()
+                color=_COLOR_RED,
+                timestamp=discord.utils.utcnow()
             )
             await ctx.send(embed=embed)
             
@@ -242,8 +271,8 @@ class AuraQuantDiscordBot:
             embed = discord.Embed(
                 title="🚨 EMERGENCY STOP ACTIVATED",
                 description="Closing all positions and halting trading",
-                color=discord.Color.red(),
-                timestamp=datetime.now()
+                color=_COLOR_RED,
+                timestamp=discord.utils.utcnow()
             )
             
             # Send to backend to close all positions
@@ -268,8 +297,8 @@ class AuraQuantDiscordBot:
             embed = discord.Embed(
                 title="🔄 Mode Changed",
                 description=f"Trading mode changed from {old_mode} to {mode.upper()}",
-                color=discord.Color.blue(),
-                timestamp=datetime.now()
+                color=_COLOR_BLUE,
+                timestamp=discord.utils.utcnow()
             )
             
             # Mode descriptions
@@ -294,13 +323,13 @@ class AuraQuantDiscordBot:
             self.bot_status['is_paper'] = not self.bot_status['is_paper']
             
             mode = "Paper" if self.bot_status['is_paper'] else "LIVE"
-            color = discord.Color.blue() if self.bot_status['is_paper'] else discord.Color.gold()
+            color = _COLOR_BLUE if self.bot_status['is_paper'] else _COLOR_GOLD
             
             embed = discord.Embed(
                 title=f"💱 Switched to {mode} Trading",
                 description=f"Bot is now in {mode} trading mode",
                 color=color,
-                timestamp=datetime.now()
+                timestamp=discord.utils.utcnow()
             )
             
             if not self.bot_status['is_paper']:
@@ -317,28 +346,29 @@ class AuraQuantDiscordBot:
         @self.bot.command(name='positions', help='Show current positions')
         async def show_positions(ctx):
             """Display current positions"""
-            if not self.bot_status['positions']:
+            count = len(self._pos_symbols)
+            if not count:
                 await ctx.send("📊 No open positions")
                 return
             
             embed = discord.Embed(
                 title="📊 Current Positions",
-                color=discord.Color.blue(),
-                timestamp=datetime.now()
+                color=_COLOR_BLUE,
+                timestamp=discord.utils.utcnow()
             )
             
-            for symbol, position in list(self.bot_status['positions'].items())[:10]:
+            for i in range(min(10, count)):
                 value = f"""
-                Qty: {position.get('quantity', 0)}
-                Avg: ${position.get('avg_price', 0):.2f}
-                P&L: ${position.get('unrealized_pnl', 0):+.2f}
+                Qty: {self._pos_qty[i]:g}
+                Avg: ${self._pos_avg[i]:.2f}
+                P&L: ${self._pos_upnl[i]:+.2f}
                 """
-                embed.add_field(name=symbol, value=value, inline=True)
+                embed.add_field(name=self._pos_symbols[i], value=value, inline=True)
             
-            if len(self.bot_status['positions']) > 10:
+            if count > 10:
                 embed.add_field(
                     name="...",
-                    value=f"And {len(self.bot_status['positions']) - 10} more",
+                    value=f"And {count - 10} more",
                     inline=False
                 )
             
@@ -350,7 +380,7 @@ class AuraQuantDiscordBot:
             """Close a specific position"""
             symbol = symbol.upper()
             
-            if symbol not in self.bot_status['positions']:
+            if symbol not in self._pos_index:
                 await ctx.send(f"❌ No position found for {symbol}")
                 return
             
@@ -358,8 +388,8 @@ class AuraQuantDiscordBot:
             embed = discord.Embed(
                 title=f"📉 Closing Position: {symbol}",
                 description="Order sent to close position",
-                color=discord.Color.orange(),
-                timestamp=datetime.now()
+                color=_COLOR_ORANGE,
+                timestamp=discord.utils.utcnow()
             )
             
             await ctx.send(embed=embed)
@@ -373,8 +403,8 @@ class AuraQuantDiscordBot:
                 # Show current settings
                 embed = discord.Embed(
                     title="🔔 Alert Settings",
-                    color=discord.Color.blue(),
-                    timestamp=datetime.now()
+                    color=_COLOR_BLUE,
+                    timestamp=discord.utils.utcnow()
                 )
                 
                 for key, value in self.alert_settings.items():
@@ -396,8 +426,8 @@ class AuraQuantDiscordBot:
             """Display performance metrics"""
             embed = discord.Embed(
                 title=f"📈 Performance - {period.capitalize()}",
-                color=discord.Color.green() if self.bot_status['daily_pnl'] >= 0 else discord.Color.red(),
-                timestamp=datetime.now()
+                color=_COLOR_GREEN if self.bot_status['daily_pnl'] >= 0 else _COLOR_RED,
+                timestamp=discord.utils.utcnow()
             )
             
             # Mock performance data - would come from backend
@@ -440,8 +470,8 @@ class AuraQuantDiscordBot:
             embed = discord.Embed(
                 title="⚙️ Setting Updated",
                 description=f"{settings_map[setting]} set to {value}",
-                color=discord.Color.blue(),
-                timestamp=datetime.now()
+                color=_COLOR_BLUE,
+                timestamp=discord.utils.utcnow()
             )
             
             await ctx.send(embed=embed)
@@ -458,7 +488,7 @@ class AuraQuantDiscordBot:
                     embed = discord.Embed(
                         title=f"Help: !aq {command}",
                         description=cmd.help or "No description available",
-                        color=discord.Color.blue()
+                        color=_COLOR_BLUE
                     )
                     await ctx.send(embed=embed)
                 else:
@@ -469,34 +499,78 @@ class AuraQuantDiscordBot:
             embed = discord.Embed(
                 title="🤖 AuraQuant Bot Commands",
                 description="All available commands for the trading bot",
-                color=discord.Color.blue()
+                color=_COLOR_BLUE
             )
             
-            command_categories = {
-                "📊 Status": ['status', 'positions', 'performance'],
-                "🎮 Control": ['start', 'stop', 'emergency', 'mode', 'paper'],
-                "💰 Trading": ['close'],
-                "🔔 Alerts": ['alerts'],
-                "⚙️ Settings": ['set'],
-                "❓ Help": ['help']
-            }
-            
-            for category, commands in command_categories.items():
-                command_list = []
-                for cmd_name in commands:
-                    cmd = self.bot.get_command(cmd_name)
-                    if cmd:
-                        command_list.append(f"`!aq {cmd_name}` - {cmd.help}")
-                
-                if command_list:
-                    embed.add_field(
-                        name=category,
-                        value="\n".join(command_list),
-                        inline=False
-                    )
+            for category, command_list in self._help_lines.items():
+                embed.add_field(
+                    name=category,
+                    value="\n".join(command_list),
+                    inline=False
+                )
             
             embed.set_footer(text="Use !aq help <command> for detailed help")
             await ctx.send(embed=embed)
+        
+        # Commands are all registered now - build the help listing once
+        command_categories = {
+            "📊 Status": ['status', 'positions', 'performance'],
+            "🎮 Control": ['start', 'stop', 'emergency', 'mode', 'paper'],
+            "💰 Trading": ['close'],
+            "🔔 Alerts": ['alerts'],
+            "⚙️ Settings": ['set'],
+            "❓ Help": ['help']
+        }
+        
+        self._help_lines: Dict[str, List[str]] = {}
+        for category, names in command_categories.items():
+            command_list = [
+                f"`!aq {name}` - {cmd.help}"
+                for name, cmd in ((name, self.bot.get_command(name)) for name in names)
+                if cmd
+            ]
+            if command_list:
+                self._help_lines[category] = command_list
+    
+    # Position State
+    def update_position(self, symbol: str, quantity: float, avg_price: float, unrealized_pnl: float = 0.0):
+        """Insert, update or (when quantity is 0) remove a position"""
+        symbol = symbol.upper()
+        index = self._pos_index.get(symbol)
+        
+        if not quantity:
+            if index is None:
+                return
+            # Swap-remove to keep the columns contiguous
+            last = len(self._pos_symbols) - 1
+            if index != last:
+                moved = self._pos_symbols[last]
+                self._pos_symbols[index] = moved
+                self._pos_qty[index] = self._pos_qty[last]
+                self._pos_avg[index] = self._pos_avg[last]
+                self._pos_upnl[index] = self._pos_upnl[last]
+                self._pos_index[moved] = index
+            self._pos_symbols.pop()
+            self._pos_qty.pop()
+            self._pos_avg.pop()
+            self._pos_upnl.pop()
+            del self._pos_index[symbol]
+            return
+        
+        if index is None:
+            self._pos_index[symbol] = len(self._pos_symbols)
+            self._pos_symbols.append(symbol)
+            self._pos_qty.append(quantity)
+            self._pos_avg.append(avg_price)
+            self._pos_upnl.append(unrealized_pnl)
+        else:
+            self._pos_qty[index] = quantity
+            self._pos_avg[index] = avg_price
+            self._pos_upnl[index] = unrealized_pnl
+    
+    def total_exposure(self) -> float:
+        """Sum of quantity * average price across open positions"""
+        return math.fsum(map(operator.mul, self._pos_qty, self._pos_avg))
     
     # Alert Methods
     async def send_trade_alert(self, trade_data: Dict[str, Any]):
@@ -504,20 +578,18 @@ class AuraQuantDiscordBot:
         if not self.alert_settings['trade_alerts']:
             return
         
-        if not await self._check_rate_limit('alert'):
-            return
-        
-        channel = self.bot.get_channel(int(self.channels.get('trades', self.channels.get('alerts'))))
+        channel_id = self._channel_overrides.get('trades', self._default_channel_id)
+        channel = self.bot.get_channel(channel_id)
         if not channel:
             return
         
         # Determine color based on trade type
-        color = discord.Color.green() if trade_data['side'] == 'buy' else discord.Color.red()
+        color = _COLOR_GREEN if trade_data['side'] == 'buy' else _COLOR_RED
         
         embed = discord.Embed(
             title=f"{'🟢 BUY' if trade_data['side'] == 'buy' else '🔴 SELL'} {trade_data['symbol']}",
             color=color,
-            timestamp=datetime.now()
+            timestamp=discord.utils.utcnow()
         )
         
         embed.add_field(name="Quantity", value=trade_data['quantity'])
@@ -534,27 +606,16 @@ class AuraQuantDiscordBot:
         if not self.alert_settings['market_alerts']:
             return
         
-        if not await self._check_rate_limit('alert'):
-            return
-        
-        channel = self.bot.get_channel(int(self.channels.get('alerts')))
+        channel_id = self._channel_overrides.get('alerts', self._default_channel_id)
+        channel = self.bot.get_channel(channel_id)
         if not channel:
             return
         
-        # Color based on alert type
-        colors = {
-            'breakout': discord.Color.gold(),
-            'momentum': discord.Color.purple(),
-            'volume': discord.Color.blue(),
-            'halt': discord.Color.red(),
-            'news': discord.Color.orange()
-        }
-        
         embed = discord.Embed(
             title=f"🎯 {alert_data['type'].upper()} Alert: {alert_data['symbol']}",
             description=alert_data['message'],
-            color=colors.get(alert_data['type'], discord.Color.blue()),
-            timestamp=datetime.now()
+            color=_MARKET_COLORS.get(alert_data['type'], _COLOR_BLUE),
+            timestamp=discord.utils.utcnow()
         )
         
         if 'details' in alert_data:
@@ -568,19 +629,22 @@ class AuraQuantDiscordBot:
         if not self.alert_settings['risk_alerts']:
             return
         
-        channel = self.bot.get_channel(int(self.channels.get('alerts')))
+        channel = self.bot.get_channel(self._channel_overrides.get('alerts', self._default_channel_id))
         if not channel:
             return
         
         embed = discord.Embed(
             title="⚠️ Risk Alert",
             description=risk_data['message'],
-            color=discord.Color.orange(),
-            timestamp=datetime.now()
+            color=_COLOR_ORANGE,
+            timestamp=discord.utils.utcnow()
         )
         
         embed.add_field(name="Risk Level", value=risk_data.get('level', 'Medium'))
-        embed.add_field(name="Current Exposure", value=f"${risk_data.get('exposure', 0):,.2f}")
+        exposure = risk_data.get('exposure')
+        if exposure is None:
+            exposure = self.total_exposure()
+        embed.add_field(name="Current Exposure", value=f"${exposure:,.2f}")
         
         if 'action' in risk_data:
             embed.add_field(name="Recommended Action", value=risk_data['action'], inline=False)
@@ -592,61 +656,41 @@ class AuraQuantDiscordBot:
         embed = discord.Embed(
             title="🚨 EMERGENCY ALERT",
             description=message,
-            color=discord.Color.red(),
-            timestamp=datetime.now()
+            color=_COLOR_RED,
+            timestamp=discord.utils.utcnow()
         )
         
-        # Send to all configured channels
-        for channel_id in self.channels.values():
-            if channel_id:
-                channel = self.bot.get_channel(int(channel_id))
-                if channel:
-                    await channel.send(embed=embed)
-                    await channel.send("@everyone")  # Ping everyone for emergency
+        # Send once to each distinct configured channel
+        for channel_id in {self._default_channel_id, *self._channel_overrides.values()}:
+            channel = self.bot.get_channel(channel_id)
+            if channel:
+                # Ping everyone in the same message; allow it explicitly so it isn't suppressed
+                await channel.send(
+                    content="@everyone",
+                    embed=embed,
+                    allowed_mentions=discord.AllowedMentions(everyone=True)
+                )
     
     # Utility Methods
     async def _log_action(self, action: str, user: discord.User):
         """Log action to logs channel"""
-        if not self.channels.get('logs'):
-            return
-        
-        channel = self.bot.get_channel(int(self.channels['logs']))
+        channel = self.bot.get_channel(self._channel_overrides.get('logs', self._default_channel_id))
         if channel:
             embed = discord.Embed(
                 title="📝 Action Log",
                 description=action,
-                color=discord.Color.blue(),
-                timestamp=datetime.now()
+                color=_COLOR_BLUE,
+                timestamp=discord.utils.utcnow()
             )
             embed.add_field(name="User", value=str(user))
             await channel.send(embed=embed)
     
-    async def _check_rate_limit(self, message_type: str) -> bool:
-        """Check if we're within rate limits"""
-        now = datetime.now()
-        
-        # Reset counters if minute has passed
-        if (now - self.rate_limits['reset_time']).seconds >= 60:
-            self.rate_limits['message_count'] = 0
-            self.rate_limits['alert_count'] = 0
-            self.rate_limits['reset_time'] = now
-        
-        if message_type == 'alert':
-            if self.rate_limits['alert_count'] >= self.rate_limits['alerts_per_minute']:
-                logger.warning("Alert rate limit exceeded")
-                return False
-            self.rate_limits['alert_count'] += 1
-        else:
-            if self.rate_limits['message_count'] >= self.rate_limits['messages_per_minute']:
-                logger.warning("Message rate limit exceeded")
-                return False
-            self.rate_limits['message_count'] += 1
-        
-        return True
-    
     # Background Tasks
-    @tasks.loop(seconds=30)
-    async def update_status(self):
+    async def _run_periodic(self):
+        """Update presence every tick"""
+        await self._update_status()
+    
+    async def _update_status(self):
         """Update bot status periodically"""
         try:
             # Get latest status from backend
@@ -667,17 +711,11 @@ class AuraQuantDiscordBot:
         except Exception as e:
             logger.error(f"Error updating status: {e}")
     
-    @tasks.loop(minutes=1)
-    async def check_rate_limits(self):
-        """Reset rate limits every minute"""
-        self.rate_limits['message_count'] = 0
-        self.rate_limits['alert_count'] = 0
-        self.rate_limits['reset_time'] = datetime.now()
-    
     # Webhook Methods
     async def send_webhook_message(self, webhook_url: str, message: Dict[str, Any]):
         """Send message via webhook"""
         async with aiohttp.ClientSession() as session:
+            # discord.py handles the webhook's rate-limit bucket and retries
             webhook = discord.Webhook.from_url(webhook_url, session=session)
             
             if 'embed' in message:
@@ -685,8 +723,8 @@ class AuraQuantDiscordBot:
                 embed = discord.Embed(
                     title=embed_data.get('title', ''),
                     description=embed_data.get('description', ''),
-                    color=embed_data.get('color', discord.Color.blue()),
-                    timestamp=datetime.now()
+                    color=embed_data.get('color', _COLOR_BLUE),
+                    timestamp=discord.utils.utcnow()
                 )
                 
                 for field in embed_data.get('fields', []):
@@ -712,6 +750,7 @@ class AuraQuantDiscordBot:
             logger.error(f"Bot error: {e}")
             raise
         finally:
+            self._periodic.cancel()
             await self.bot.close()
 
 
@@ -816,14 +855,18 @@ class DiscordBotSetup:
 
 # Main execution
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) > 1 and sys.argv[1] == 'setup':
         # Run setup wizard
         setup = DiscordBotSetup()
         setup.setup()
     else:
-        # Run the bot
+        # Run the bot on uvloop when it is installed
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+        
         try:
             bot = AuraQuantDiscordBot()
             asyncio.run(bot.run())
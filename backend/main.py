@@ -5,14 +5,20 @@ FastAPI application with WebSocket support for live trading platform
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from contextlib import asynccontextmanager
 import os
 import asyncio
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 from datetime import datetime
-import json
+import msgspec
+import numpy as np
+import orjson
+from websockets.exceptions import ConnectionClosed
+
+from core.ticker import Ticker
+from notifications.http import close_shared_session
 
 # Setup logging
 logging.basicConfig(
@@ -21,6 +27,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Random source for mock market data
+rng = np.random.default_rng()
+
+# Every periodic job in this app runs from this one timer
+ticker = Ticker()
+
+# Response timestamp shared by all requests, refreshed every tick
+_NOW = {"ts": datetime.utcnow().isoformat()}
+
+def _refresh_timestamp():
+    _NOW["ts"] = datetime.utcnow().isoformat()
+
+ticker.every(Ticker.RESOLUTION, _refresh_timestamp)
+
+# How often the daily_performance materialized view is recomputed
+VIEW_REFRESH_INTERVAL = 300  # seconds
+
+async def _refresh_views(engine):
+    """Recompute daily_performance; a failed refresh is retried next interval"""
+    from models.database import refresh_daily_performance
+    
+    try:
+        await asyncio.to_thread(refresh_daily_performance, engine)
+    except Exception as e:
+        logger.error(f"daily_performance refresh failed: {e}")
+
+async def _start_db_workers() -> Dict[str, Any]:
+    """Schedule the Postgres background jobs on the ticker when DATABASE_URL is set.
+    SQLAlchemy and redis aren't part of the minimal deployment, so they are
+    imported here and the app runs without the jobs if they are missing."""
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        return {}
+    
+    redis_url = os.getenv("REDIS_URL")
+    try:
+        from sqlalchemy.orm import sessionmaker
+        from models import audit
+        from models.database import create_db_engine, create_views
+        
+        engine = create_db_engine(url)
+        
+        # Login counters and session activity live in Redis and are written back in batches
+        redis_client = activity = None
+        if redis_url:
+            import redis.asyncio as redis
+            from auth.auth_cache import AuthActivityCache, FLUSH_INTERVAL
+            
+            redis_client = redis.from_url(redis_url)
+            activity = AuthActivityCache(redis_client)
+    except (ImportError, ValueError) as e:
+        logger.warning(f"DB workers disabled: {e}")
+        return {}
+    
+    try:
+        await asyncio.to_thread(create_views, engine)
+    except Exception as e:
+        logger.error(f"Creating materialized views failed: {e}")
+    
+    audit.start()
+    ticker.every(audit.FLUSH_MAX_WAIT, lambda: audit.flush(engine))
+    ticker.every(VIEW_REFRESH_INTERVAL, lambda: _refresh_views(engine))
+    if activity is not None:
+        session_factory = sessionmaker(bind=engine)
+        ticker.every(FLUSH_INTERVAL, lambda: activity.flush_with(session_factory))
+    return {"engine": engine, "redis": redis_client}
+
+async def _stop_db_workers(state: Dict[str, Any]):
+    """Write out whatever audit rows are still queued and release the connections;
+    call after the ticker has stopped"""
+    if not state:
+        return
+    
+    from models import audit
+    
+    await audit.shutdown(state["engine"])
+    if state["redis"] is not None:
+        await state["redis"].aclose()
+    state["engine"].dispose()
+
 # Import your modules (when ready)
 try:
     from app import create_app
@@ -31,15 +117,21 @@ except ImportError:
     async def lifespan(app: FastAPI):
         # Startup
         logger.info("🚀 AuraQuant Backend Starting...")
+        db_workers = await _start_db_workers()
+        ticker.start()
         yield
         # Shutdown
         logger.info("🛑 AuraQuant Backend Shutting Down...")
+        await ticker.stop()
+        await _stop_db_workers(db_workers)
+        await close_shared_session()
 
     app = FastAPI(
         title="AuraQuant Infinity Trading Platform",
         description="Professional automated trading platform with AI integration",
         version="1.0.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
 
 # Configure CORS for frontend
@@ -59,79 +151,192 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _dump(message: Any) -> str:
+    """Serialize a WebSocket message with orjson (text frame for browser clients)"""
+    return orjson.dumps(message).decode()
+
+class ClientMessage(msgspec.Struct):
+    """Inbound /ws client message"""
+    type: str = ""
+    symbols: List[str] = []
+
+_decode_client_message = msgspec.json.Decoder(ClientMessage).decode
+
+async def _receive_raw(websocket: WebSocket):
+    """Next inbound frame as-is - binary frames skip text decoding; msgspec parses either"""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    return message.get("bytes") or message.get("text") or ""
+
+# Max queued messages folded into one WebSocket frame
+WS_BATCH_MAX = 64
+# Per-client backlog; beyond this the oldest queued message is dropped
+WS_QUEUE_MAX = 256
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.user_connections: Dict[str, WebSocket] = {}
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._relays: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, user_id: str = None):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         if user_id:
             self.user_connections[user_id] = websocket
+        
+        # Each client gets its own outbound queue drained by a relay task
+        queue = asyncio.Queue(maxsize=WS_QUEUE_MAX)
+        self._queues[websocket] = queue
+        self._relays[websocket] = asyncio.create_task(self._relay(websocket, queue))
         logger.info(f"Client {user_id or 'anonymous'} connected")
 
     def disconnect(self, websocket: WebSocket, user_id: str = None):
-        self.active_connections.remove(websocket)
-        if user_id and user_id in self.user_connections:
-            del self.user_connections[user_id]
+        relay = self._evict(websocket)
+        if relay:
+            relay.cancel()
         logger.info(f"Client {user_id or 'anonymous'} disconnected")
 
+    def _evict(self, websocket: WebSocket):
+        """Forget a connection everywhere and return its relay task"""
+        self.active_connections.discard(websocket)
+        for user_id in [u for u, ws in self.user_connections.items() if ws is websocket]:
+            del self.user_connections[user_id]
+        self._queues.pop(websocket, None)
+        return self._relays.pop(websocket, None)
+
+    def _enqueue(self, queue: asyncio.Queue, payload: str):
+        """Queue a frame, dropping the oldest one if the client has fallen behind"""
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(payload)
+            logger.warning("Slow WebSocket client - dropped oldest queued message")
+
+    async def _relay(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's queue, folding bursts into one batch frame"""
+        try:
+            while True:
+                # Queued items are already-serialized JSON, shared across clients
+                frames = [await queue.get()]
+                while not queue.empty() and len(frames) < WS_BATCH_MAX:
+                    frames.append(queue.get_nowait())
+                
+                if len(frames) == 1:
+                    payload = frames[0]
+                else:
+                    payload = '{"type":"batch","items":[' + ','.join(frames) + ']}'
+                await websocket.send_text(payload)
+        except (WebSocketDisconnect, ConnectionClosed, RuntimeError) as e:
+            # Dead socket - drop it so broadcasts stop queueing for it
+            logger.info(f"Evicting closed WebSocket: {e!r}")
+            self._evict(websocket)
+
     async def broadcast(self, message: dict):
         """Send message to all connected clients"""
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+        payload = _dump(message)
+        for queue in self._queues.values():
+            self._enqueue(queue, payload)
+
+    def send(self, websocket: WebSocket, message: dict):
+        """Queue a message for one client; its relay is the socket's only sender"""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            # The relay already evicted this socket
+            raise WebSocketDisconnect(1006)
+        self._enqueue(queue, _dump(message))
 
     async def send_to_user(self, user_id: str, message: dict):
         """Send message to specific user"""
-        if user_id in self.user_connections:
-            try:
-                await self.user_connections[user_id].send_json(message)
-            except:
-                pass
+        websocket = self.user_connections.get(user_id)
+        if websocket in self._queues:
+            self._enqueue(self._queues[websocket], _dump(message))
 
 manager = ConnectionManager()
 
+# Static response bodies, serialized once. Timestamped ones are stored
+# without their closing brace so the cached timestamp can be appended.
+_ROOT_PREFIX = orjson.dumps({
+    "message": "AuraQuant backend is running.",
+    "status": "online",
+    "platform": "AuraQuant Infinity",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/api/health",
+        "auth": "/api/auth/login",
+        "trading": "/api/trading/positions",
+        "bot": "/api/bot/status",
+        "websocket": "/ws"
+    }
+})[:-1]
+
+_HEALTH_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "services": {
+        "api": "operational",
+        "websocket": "operational",
+        "database": "operational"  # Add actual DB check
+    }
+})[:-1]
+
+_POSITIONS_BODY = orjson.dumps({
+    "positions": [
+        {
+            "symbol": "AAPL",
+            "quantity": 100,
+            "entry_price": 175.50,
+            "current_price": 178.25,
+            "pnl": 275.00,
+            "pnl_percent": 1.57
+        },
+        {
+            "symbol": "BTC-USD",
+            "quantity": 0.5,
+            "entry_price": 65000,
+            "current_price": 66500,
+            "pnl": 750.00,
+            "pnl_percent": 2.31
+        }
+    ],
+    "total_pnl": 1025.00,
+    "total_value": 50000.00
+})
+
+_BOT_STATUS_BODY = orjson.dumps({
+    "running": True,
+    "mode": "paper",
+    "version": "V4",
+    "trades_today": 15,
+    "profit_today": 234.56,
+    "active_strategies": ["momentum", "mean_reversion", "breakout"]
+})
+
+def _timestamped(prefix: bytes) -> Response:
+    """Close a pre-serialized body with the cached timestamp"""
+    return Response(
+        prefix + b',"timestamp":"' + _NOW["ts"].encode() + b'"}',
+        media_type="application/json"
+    )
+
 # Health check endpoint
 @app.get("/")
 async def root():
-    return {
-        "message": "AuraQuant backend is running.",
-        "status": "online",
-        "platform": "AuraQuant Infinity",
-        "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat(),
-        "endpoints": {
-            "health": "/api/health",
-            "auth": "/api/auth/login",
-            "trading": "/api/trading/positions",
-            "bot": "/api/bot/status",
-            "websocket": "/ws"
-        }
-    }
+    return _timestamped(_ROOT_PREFIX)
 
 @app.get("/api/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "services": {
-            "api": "operational",
-            "websocket": "operational",
-            "database": "operational"  # Add actual DB check
-        }
-    }
+    return _timestamped(_HEALTH_PREFIX)
 
 # Authentication endpoints
-@app.post("/api/auth/login")
+@app.post("/api/auth/login", response_class=ORJSONResponse)
 async def login(email: str, password: str):
     """Mock login endpoint for demo"""
     # In production, validate against database
-    return {
+    return ORJSONResponse({
         "token": f"demo_token_{datetime.now().timestamp()}",
         "user": {
             "id": "demo_user",
@@ -140,120 +345,100 @@ async def login(email: str, password: str):
             "role": "trader",
             "demo": True
         }
-    }
+    })
 
-@app.post("/api/auth/register")
+@app.post("/api/auth/register", response_class=ORJSONResponse)
 async def register(email: str, password: str, name: str):
     """Mock registration endpoint"""
-    return {
+    return ORJSONResponse({
         "message": "Registration successful",
         "user": {
             "id": f"user_{datetime.now().timestamp()}",
             "email": email,
             "name": name
         }
-    }
+    })
 
 # Trading endpoints
 @app.get("/api/trading/positions")
 async def get_positions():
     """Get current trading positions"""
-    return {
-        "positions": [
-            {
-                "symbol": "AAPL",
-                "quantity": 100,
-                "entry_price": 175.50,
-                "current_price": 178.25,
-                "pnl": 275.00,
-                "pnl_percent": 1.57
-            },
-            {
-                "symbol": "BTC-USD",
-                "quantity": 0.5,
-                "entry_price": 65000,
-                "current_price": 66500,
-                "pnl": 750.00,
-                "pnl_percent": 2.31
-            }
-        ],
-        "total_pnl": 1025.00,
-        "total_value": 50000.00
-    }
+    return Response(_POSITIONS_BODY, media_type="application/json")
 
-@app.post("/api/trading/order")
+@app.post("/api/trading/order", response_class=ORJSONResponse)
 async def place_order(symbol: str, side: str, quantity: float, order_type: str = "market"):
     """Place a trading order"""
-    return {
+    return ORJSONResponse({
         "order_id": f"order_{datetime.now().timestamp()}",
         "symbol": symbol,
         "side": side,
         "quantity": quantity,
         "type": order_type,
         "status": "pending",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+        "timestamp": _NOW["ts"]
+    })
 
 # Bot control endpoints
 @app.get("/api/bot/status")
 async def get_bot_status():
     """Get bot status"""
-    return {
-        "running": True,
-        "mode": "paper",
-        "version": "V4",
-        "trades_today": 15,
-        "profit_today": 234.56,
-        "active_strategies": ["momentum", "mean_reversion", "breakout"]
-    }
+    return Response(_BOT_STATUS_BODY, media_type="application/json")
 
-@app.post("/api/bot/control")
+@app.post("/api/bot/control", response_class=ORJSONResponse)
 async def control_bot(action: str):
     """Control bot operations"""
     if action not in ["start", "stop", "pause", "resume"]:
         raise HTTPException(status_code=400, detail="Invalid action")
     
-    return {
+    return ORJSONResponse({
         "action": action,
         "status": "success",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+        "timestamp": _NOW["ts"]
+    })
 
 # Market data endpoints
-@app.get("/api/market/quotes")
+@app.get("/api/market/quotes", response_class=ORJSONResponse)
 async def get_quotes(symbols: str):
     """Get market quotes for symbols"""
     symbol_list = symbols.split(',')
-    quotes = {}
+    n = len(symbol_list)
     
-    for symbol in symbol_list:
-        # Mock data - replace with real market data
-        import random
-        base_price = random.uniform(100, 200)
-        quotes[symbol] = {
-            "bid": base_price - 0.01,
-            "ask": base_price + 0.01,
-            "last": base_price,
-            "volume": random.randint(1000000, 10000000),
-            "change": random.uniform(-5, 5),
-            "change_percent": random.uniform(-2, 2)
+    # Mock data - replace with real market data (one batch draw per field)
+    base_prices = rng.uniform(100, 200, n)
+    bids = (base_prices - 0.01).tolist()
+    asks = (base_prices + 0.01).tolist()
+    volumes = rng.integers(1000000, 10000000, n, endpoint=True).tolist()
+    changes = rng.uniform(-5, 5, n).tolist()
+    change_pcts = rng.uniform(-2, 2, n).tolist()
+    
+    quotes = {
+        symbol: {
+            "bid": bid,
+            "ask": ask,
+            "last": last,
+            "volume": volume,
+            "change": change,
+            "change_percent": change_pct
         }
+        for symbol, bid, ask, last, volume, change, change_pct
+        in zip(symbol_list, bids, asks, base_prices.tolist(), volumes, changes, change_pcts)
+    }
     
-    return {"quotes": quotes}
+    return ORJSONResponse({"quotes": quotes})
 
 # Screener endpoint
-@app.get("/api/screener/scan")
+@app.get("/api/screener/scan", response_class=ORJSONResponse)
 async def run_screener(scan_type: str = "momentum"):
     """Run market screener"""
-    return {
+    return ORJSONResponse({
         "scan_type": scan_type,
         "results": [
             {"symbol": "NVDA", "price": 825.50, "change": 5.2, "volume": 45000000, "signal": "strong_buy"},
             {"symbol": "TSLA", "price": 245.30, "change": 3.8, "volume": 38000000, "signal": "buy"},
             {"symbol": "AMD", "price": 165.20, "change": 2.9, "volume": 28000000, "signal": "buy"}
         ],
-        "timestamp": datetime.utcnow().isoformat()
-    }
+        "timestamp": _NOW["ts"]
+    })
 
 # WebSocket endpoint for real-time data
 @app.websocket("/ws")
@@ -262,32 +447,35 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             # Wait for messages from client
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            data = await _receive_raw(websocket)
+            message = _decode_client_message(data)
             
             # Handle different message types
-            if message.get("type") == "subscribe":
+            if message.type == "subscribe":
                 # Subscribe to market data
-                symbols = message.get("symbols", [])
-                await websocket.send_json({
+                symbols = message.symbols
+                manager.send(websocket, {
                     "type": "subscription_confirmed",
                     "symbols": symbols
                 })
                 
-                # Start sending mock market data
+                # Start sending mock market data - the envelope is built once
+                # and its quotes are overwritten in place each tick
+                n = len(symbols)
+                quotes = [{"price": 0.0, "change": 0.0} for _ in symbols]
+                market_data = {
+                    "type": "market_data",
+                    "data": dict(zip(symbols, quotes)),
+                    "timestamp": ""
+                }
                 while True:
-                    import random
-                    market_data = {
-                        "type": "market_data",
-                        "data": {
-                            symbol: {
-                                "price": random.uniform(100, 200),
-                                "change": random.uniform(-5, 5)
-                            } for symbol in symbols
-                        },
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                    await websocket.send_json(market_data)
+                    prices = rng.uniform(100, 200, n).tolist()
+                    changes = rng.uniform(-5, 5, n).tolist()
+                    for quote, price, change in zip(quotes, prices, changes):
+                        quote["price"] = price
+                        quote["change"] = change
+                    market_data["timestamp"] = _NOW["ts"]
+                    manager.send(websocket, market_data)
                     await asyncio.sleep(5)  # Send updates every 5 seconds
             
     except WebSocketDisconnect:
@@ -297,7 +485,7 @@ async def websocket_endpoint(websocket: WebSocket):
         manager.disconnect(websocket)
 
 # Webhook endpoints
-@app.post("/api/webhooks/tradingview")
+@app.post("/api/webhooks/tradingview", response_class=ORJSONResponse)
 async def tradingview_webhook(payload: dict):
     """Receive TradingView alerts"""
     logger.info(f"TradingView webhook received: {payload}")
@@ -306,12 +494,12 @@ async def tradingview_webhook(payload: dict):
     await manager.broadcast({
         "type": "tradingview_alert",
         "data": payload,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _NOW["ts"]
     })
     
-    return {"status": "received"}
+    return ORJSONResponse({"status": "received"})
 
-@app.post("/api/webhooks/broker")
+@app.post("/api/webhooks/broker", response_class=ORJSONResponse)
 async def broker_webhook(payload: dict):
     """Receive broker notifications"""
     logger.info(f"Broker webhook received: {payload}")
@@ -320,16 +508,16 @@ async def broker_webhook(payload: dict):
     await manager.broadcast({
         "type": "broker_update",
         "data": payload,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _NOW["ts"]
     })
     
-    return {"status": "received"}
+    return ORJSONResponse({"status": "received"})
 
 # AI endpoints
-@app.post("/api/ai/analyze")
+@app.post("/api/ai/analyze", response_class=ORJSONResponse)
 async def ai_analyze(symbol: str, timeframe: str = "1h"):
     """AI market analysis"""
-    return {
+    return ORJSONResponse({
         "symbol": symbol,
         "timeframe": timeframe,
         "analysis": {
@@ -342,8 +530,8 @@ async def ai_analyze(symbol: str, timeframe: str = "1h"):
             "stop_loss": 172.00,
             "take_profit": 182.00
         },
-        "timestamp": datetime.utcnow().isoformat()
-    }
+        "timestamp": _NOW["ts"]
+    })
 
 # Error handlers
 @app.exception_handler(404)
@@ -367,5 +555,6 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=port,
+        ws_per_message_deflate=False,
         reload=os.environ.get("ENVIRONMENT") == "development"
     )
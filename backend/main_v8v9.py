@@ -7,22 +7,28 @@ V9+ = DORMANT learning (locked until Wayne unlocks)
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from contextlib import asynccontextmanager
+from functools import lru_cache
 import os
-import json
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from pydantic import BaseModel, Field
 import jwt
 import hashlib
-import pymongo
-from pymongo import MongoClient
+import msgspec
+from motor.motor_asyncio import AsyncIOMotorClient
+import orjson
+from websockets.exceptions import ConnectionClosed
 from dotenv import load_dotenv
 import uvicorn
 
+from core.ticker import Ticker
+
 # Load V8/V9 configuration
 load_dotenv('.env.v8v9')
 
@@ -50,13 +56,61 @@ class V8V9Config:
         self.admin_email = os.getenv('ADMIN_EMAIL', 'wayne@auraquant.com')
         self.paper_trading = int(os.getenv('PAPER_TRADING', '1'))
         self.gradual_capital = os.getenv('GRADUAL_CAPITAL_SWITCH', 'true').lower() == 'true'
+        # Read once - these are looked up on every request
+        self.jwt_secret = os.getenv('JWT_SECRET')
+        self.ws_enabled = os.getenv('WS_ENABLED') == 'true'
+        self.coll_trades = os.getenv('DB_COLLECTION_TRADES', 'trades')
+        self.coll_v9_learning = os.getenv('DB_COLLECTION_V9_LEARNING', 'v9_learning_data')
 
 config = V8V9Config()
 
+ticker = Ticker()
+
+# Response timestamp shared by all requests, refreshed every tick.
+# Persisted records (trades, V9 learning) keep exact timestamps.
+_NOW = {"ts": datetime.now(timezone.utc).isoformat()}
+
+def _refresh_timestamp():
+    _NOW["ts"] = datetime.now(timezone.utc).isoformat()
+
+ticker.every(Ticker.RESOLUTION, _refresh_timestamp)
+
 # MongoDB connection
 client = None
 db = None
 
+# Write-behind tasks, referenced until done so they aren't garbage collected
+_background_writes: Set[asyncio.Task] = set()
+
+def _write_behind(coro):
+    """Run a DB write without holding up the response"""
+    task = asyncio.create_task(coro)
+    _background_writes.add(task)
+    task.add_done_callback(_write_done)
+
+def _write_done(task: asyncio.Task):
+    _background_writes.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background DB write failed: {task.exception()}")
+
+# V9 learning signals waiting for the next bulk insert
+_v9_buffer: List[Dict[str, Any]] = []
+V9_FLUSH_INTERVAL = 0.1  # seconds
+
+async def _flush_v9_buffer():
+    """Insert all buffered V9 learning signals in one round-trip"""
+    global _v9_buffer
+    if not _v9_buffer or db is None:
+        return
+    
+    batch, _v9_buffer = _v9_buffer, []
+    try:
+        await db[config.coll_v9_learning].insert_many(batch, ordered=False)
+    except Exception as e:
+        logger.error(f"V9 learning flush failed ({len(batch)} signals): {e}")
+
+ticker.every(V9_FLUSH_INTERVAL, _flush_v9_buffer)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
@@ -71,17 +125,25 @@ async def lifespan(app: FastAPI):
     # Connect to MongoDB
     try:
         mongo_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/auraquant_v8v9')
-        client = MongoClient(mongo_uri)
-        db = client[os.getenv('DB_NAME', 'auraquant_v8v9')]
-        await client.admin.command('ping')
+        client = AsyncIOMotorClient(mongo_uri)
+        database = client[os.getenv('DB_NAME', 'auraquant_v8v9')]
+        await database.command('ping')
+        db = database
         logger.info("✅ MongoDB connected successfully")
     except Exception as e:
+        db = None
         logger.error(f"❌ MongoDB connection failed: {e}")
     
+    ticker.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down AuraQuant V8/V9")
+    # Let in-flight jobs and write-behind inserts finish before closing the client
+    await ticker.stop()
+    await _flush_v9_buffer()
+    await asyncio.gather(*_background_writes, return_exceptions=True)
     if client:
         client.close()
 
@@ -89,7 +151,8 @@ app = FastAPI(
     title="AuraQuant V8/V9 Sovereign Quantum Infinity",
     description="SUPER FINAL Trading Platform - V8 Active, V9+ Dormant",
     version="8.9.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -121,41 +184,144 @@ class TradingSignal(BaseModel):
     price: Optional[float] = None
     mode: str = Field("V8", description="V8|V9")
 
+def _dump(message: Any) -> str:
+    """Serialize a WebSocket message with orjson (text frame for browser clients)"""
+    return orjson.dumps(message).decode()
+
+class AdminCmd(msgspec.Struct):
+    """Inbound /ws/admin command"""
+    type: str = ""
+    params: Dict[str, Any] = {}
+
+_decode_admin_cmd = msgspec.json.Decoder(AdminCmd).decode
+
+async def _receive_raw(websocket: WebSocket):
+    """Next inbound frame as-is - binary frames skip text decoding; msgspec parses either"""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    return message.get("bytes") or message.get("text") or ""
+
+# Max queued messages folded into one WebSocket frame
+WS_BATCH_MAX = 64
+# Per-client backlog; beyond this the oldest queued message is dropped
+WS_QUEUE_MAX = 256
+
 # WebSocket manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.admin_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self.admin_connections: Set[WebSocket] = set()
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._relays: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, is_admin: bool = False):
         await websocket.accept()
         if is_admin:
-            self.admin_connections.append(websocket)
+            self.admin_connections.add(websocket)
         else:
-            self.active_connections.append(websocket)
+            self.active_connections.add(websocket)
+        
+        # Each client gets its own outbound queue drained by a relay task
+        queue = asyncio.Queue(maxsize=WS_QUEUE_MAX)
+        self._queues[websocket] = queue
+        self._relays[websocket] = asyncio.create_task(self._relay(websocket, queue))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if websocket in self.admin_connections:
-            self.admin_connections.remove(websocket)
+        relay = self._evict(websocket)
+        if relay:
+            relay.cancel()
+
+    def _evict(self, websocket: WebSocket):
+        """Forget a connection everywhere and return its relay task"""
+        self.active_connections.discard(websocket)
+        self.admin_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        return self._relays.pop(websocket, None)
+
+    def _enqueue(self, queue: asyncio.Queue, payload: str):
+        """Queue a frame, dropping the oldest one if the client has fallen behind"""
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(payload)
+            logger.warning("Slow WebSocket client - dropped oldest queued message")
+
+    async def _relay(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's queue, folding bursts into one batch frame"""
+        try:
+            while True:
+                # Queued items are already-serialized JSON, shared across clients
+                frames = [await queue.get()]
+                while not queue.empty() and len(frames) < WS_BATCH_MAX:
+                    frames.append(queue.get_nowait())
+                
+                if len(frames) == 1:
+                    payload = frames[0]
+                else:
+                    payload = '{"type":"batch","items":[' + ','.join(frames) + ']}'
+                await websocket.send_text(payload)
+        except (WebSocketDisconnect, ConnectionClosed, RuntimeError) as e:
+            # Dead socket - drop it so broadcasts stop queueing for it
+            logger.info(f"Evicting closed WebSocket: {e!r}")
+            self._evict(websocket)
 
     async def broadcast(self, message: dict, admin_only: bool = False):
         connections = self.admin_connections if admin_only else self.active_connections
+        payload = _dump(message)
         for connection in connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+            self._enqueue(self._queues[connection], payload)
 
 manager = ConnectionManager()
 
+HEARTBEAT_INTERVAL = 30  # seconds
+
+def _heartbeat() -> dict:
+    return {
+        "type": "heartbeat",
+        "v8_status": "active" if config.v8_active else "inactive",
+        "v9_status": "locked" if config.v9_locked else "unlocked",
+        "timestamp": _NOW["ts"]
+    }
+
+async def _send_heartbeat():
+    """One beat for every /ws client - serialized once and fanned out"""
+    await manager.broadcast(_heartbeat())
+
+ticker.every(HEARTBEAT_INTERVAL, _send_heartbeat)
+
 # Authentication helpers
+
+# Verified tokens -> (payload, cache expiry on the monotonic clock)
+_token_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+TOKEN_CACHE_TTL = 300  # seconds
+TOKEN_CACHE_MAX = 256
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode a JWT, reusing the result for repeat requests with the same bearer"""
+    now = time.monotonic()
+    cached = _token_cache.get(token)
+    if cached and cached[1] > now:
+        return cached[0]
+    
+    payload = jwt.decode(token, config.jwt_secret, algorithms=['HS256'])
+    
+    # Never cache past the token's own expiry
+    expires = now + TOKEN_CACHE_TTL
+    if 'exp' in payload:
+        expires = min(expires, now + payload['exp'] - time.time())
+    
+    if len(_token_cache) >= TOKEN_CACHE_MAX:
+        _token_cache.clear()
+    _token_cache[token] = (payload, expires)
+    return payload
+
 def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify admin JWT token"""
     token = credentials.credentials
     try:
-        payload = jwt.decode(token, os.getenv('JWT_SECRET'), algorithms=['HS256'])
+        payload = _decode_token(token)
         if payload.get('email') != config.admin_email:
             raise HTTPException(status_code=403, detail="Not authorized as admin")
         return payload
@@ -166,38 +332,58 @@ def verify_god_phrase(phrase: str) -> bool:
     """Verify the god phrase for V9 unlock"""
     return phrase == config.god_phrase
 
-# API Routes
-
-@app.get("/")
-async def root():
-    """Root endpoint with system status"""
-    return {
+# Pre-serialized status bodies (without the closing brace), one per
+# combination of the flags they report - admin overrides can flip them
+@lru_cache(maxsize=16)
+def _root_prefix(v8_active: bool, v9_locked: bool, paper_trading: bool) -> bytes:
+    return orjson.dumps({
         "platform": "AuraQuant V8/V9 Sovereign Quantum Infinity",
         "status": "operational",
-        "v8_mode": "ACTIVE" if config.v8_active else "INACTIVE",
-        "v9_mode": "DORMANT_LOCKED" if config.v9_locked else "UNLOCKED",
-        "paper_trading": bool(config.paper_trading),
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+        "v8_mode": "ACTIVE" if v8_active else "INACTIVE",
+        "v9_mode": "DORMANT_LOCKED" if v9_locked else "UNLOCKED",
+        "paper_trading": paper_trading
+    })[:-1]
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for deployment verification"""
+@lru_cache(maxsize=16)
+def _health_prefix(db_ok: bool, v8_active: bool, v9_dormant: bool, ws_enabled: bool) -> bytes:
     checks = {
         "server": "ok",
-        "mongodb": "ok" if db else "failed",
-        "v8_engine": "active" if config.v8_active else "inactive",
-        "v9_engine": "dormant" if config.v9_dormant else "inactive",
-        "websocket": "enabled" if os.getenv('WS_ENABLED') == 'true' else "disabled"
+        "mongodb": "ok" if db_ok else "failed",
+        "v8_engine": "active" if v8_active else "inactive",
+        "v9_engine": "dormant" if v9_dormant else "inactive",
+        "websocket": "enabled" if ws_enabled else "disabled"
     }
     
     all_ok = all(v in ["ok", "active", "dormant", "enabled"] for v in checks.values())
     
-    return {
+    return orjson.dumps({
         "status": "healthy" if all_ok else "degraded",
-        "checks": checks,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+        "checks": checks
+    })[:-1]
+
+def _timestamped(prefix: bytes) -> Response:
+    """Close a pre-serialized body with the cached timestamp"""
+    return Response(
+        prefix + b',"timestamp":"' + _NOW["ts"].encode() + b'"}',
+        media_type="application/json"
+    )
+
+# API Routes
+
+@app.get("/")
+async def root():
+    """Root endpoint with system status"""
+    return _timestamped(_root_prefix(config.v8_active, config.v9_locked, bool(config.paper_trading)))
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint for deployment verification"""
+    return _timestamped(_health_prefix(
+        db is not None,
+        config.v8_active,
+        config.v9_dormant,
+        config.ws_enabled
+    ))
 
 @app.post("/admin/unlock-v9")
 async def unlock_v9(
@@ -232,7 +418,7 @@ async def unlock_v9(
         "event": "v9_unlocked",
         "admin": admin['email'],
         "capital_percentage": request.gradual_percentage,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _NOW["ts"]
     }, admin_only=True)
     
     return {
@@ -240,7 +426,7 @@ async def unlock_v9(
         "message": "V9+ mode unlocked",
         "capital_switch": capital_message,
         "gradual_mode": config.gradual_capital,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _NOW["ts"]
     }
 
 @app.post("/admin/override")
@@ -285,7 +471,7 @@ async def admin_override(
     else:
         raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
     
-    response["timestamp"] = datetime.now(timezone.utc).isoformat()
+    response["timestamp"] = _NOW["ts"]
     return response
 
 @app.post("/trading/signal")
@@ -300,9 +486,9 @@ async def receive_trading_signal(
     """
     # Check which mode should process
     if signal.mode == "V9" and config.v9_locked:
-        # V9 is dormant - only store for learning
-        if db:
-            db[os.getenv('DB_COLLECTION_V9_LEARNING')].insert_one({
+        # V9 is dormant - only store for learning (flushed in bulk)
+        if db is not None:
+            _v9_buffer.append({
                 "signal": signal.dict(),
                 "timestamp": datetime.now(timezone.utc),
                 "status": "learning_only",
@@ -324,9 +510,10 @@ async def receive_trading_signal(
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
-        # Store in database
-        if db:
-            db[os.getenv('DB_COLLECTION_TRADES')].insert_one(trade_result)
+        # Store in database in the background
+        # (insert a copy - the driver adds an ObjectId _id that can't be broadcast)
+        if db is not None:
+            _write_behind(db[config.coll_trades].insert_one(dict(trade_result)))
         
         # Broadcast to connections
         await manager.broadcast(trade_result)
@@ -340,15 +527,11 @@ async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
     await manager.connect(websocket)
     try:
+        # First heartbeat right away; later ones come from the ticker
+        await websocket.send_text(_dump(_heartbeat()))
         while True:
-            # Send heartbeat
-            await websocket.send_json({
-                "type": "heartbeat",
-                "v8_status": "active" if config.v8_active else "inactive",
-                "v9_status": "locked" if config.v9_locked else "unlocked",
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
-            await asyncio.sleep(30)  # Heartbeat interval
+            # Nothing to handle from the client - just wait for it to disconnect
+            await _receive_raw(websocket)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
@@ -359,17 +542,17 @@ async def admin_websocket(websocket: WebSocket):
     await manager.connect(websocket, is_admin=True)
     try:
         while True:
-            data = await websocket.receive_text()
+            data = await _receive_raw(websocket)
             # Process admin commands via WebSocket
-            command = json.loads(data)
+            command = _decode_admin_cmd(data)
             logger.info(f"Admin WebSocket command: {command}")
             
             # Echo back with status
-            await websocket.send_json({
-                "command_received": command,
+            await websocket.send_text(_dump({
+                "command_received": msgspec.structs.asdict(command),
                 "status": "processed",
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
+                "timestamp": _NOW["ts"]
+            }))
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
@@ -380,7 +563,7 @@ async def deployment_checklist():
         "backend_render_deployed": False,  # Will be true when on Render
         "frontend_cloudflare_deployed": False,  # Will be true when on Cloudflare
         "mongodb_connected": db is not None,
-        "websockets_verified": os.getenv('WS_ENABLED') == 'true',
+        "websockets_verified": config.ws_enabled,
         "all_policies_loaded": True,  # V8/V9 policies are loaded
         "paper_trading_enabled": bool(config.paper_trading),
         "v8_mode_active": config.v8_active,
@@ -399,7 +582,7 @@ async def deployment_checklist():
         "ready_for_deployment": ready,
         "checklist": checklist,
         "message": "System ready for deployment" if ready else "Complete checklist items before deployment",
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _NOW["ts"]
     }
 
 if __name__ == "__main__":
@@ -414,6 +597,7 @@ if __name__ == "__main__":
         "main_v8v9:app",
         host=host,
         port=port,
+        ws_per_message_deflate=False,
         reload=True if os.getenv('ENVIRONMENT') == 'development' else False,
         log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+AuraQuant Audit Write-Behind
+Queues AuditLog rows in-process and flushes them to Postgres in COPY batches
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+AUDIT_Q: asyncio.Queue = asyncio.Queue(maxsize=10000)
+FLUSH_MAX_ROWS = 500
+FLUSH_MAX_WAIT = 0.1  # seconds
+
+AUDIT_COPY_COLUMNS = (
+    'user_id', 'action', 'entity_type', 'entity_id',
+    'old_values', 'new_values', 'ip_address', 'user_agent',
+    'success', 'error_message', 'timestamp',
+)
+_JSON_COLUMNS = ('old_values', 'new_values')
+
+_worker_running = False
+
+def enqueue(entry: Dict[str, Any]) -> bool:
+    """Queue an audit row. Returns False if it must be written synchronously instead."""
+    if not _worker_running:
+        return False
+    try:
+        AUDIT_Q.put_nowait(entry)
+        return True
+    except asyncio.QueueFull:
+        logger.warning("Audit queue full, writing entry synchronously")
+        return False
+
+def _encode(batch: List[Dict[str, Any]]) -> io.StringIO:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for entry in batch:
+        row = []
+        for col in AUDIT_COPY_COLUMNS:
+            value = entry.get(col)
+            if value is not None and col in _JSON_COLUMNS:
+                value = json.dumps(value, default=str)
+            row.append(value)
+        writer.writerow(row)
+    buf.seek(0)
+    return buf
+
+def _copy_batch(engine, batch: List[Dict[str, Any]]):
+    conn = engine.raw_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.copy_expert(
+                f"COPY audit_logs ({', '.join(AUDIT_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                _encode(batch),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+async def _write(engine, batch: List[Dict[str, Any]]):
+    try:
+        await asyncio.to_thread(_copy_batch, engine, batch)
+    except Exception as e:
+        logger.error(f"Audit flush of {len(batch)} rows failed: {e}")
+
+def start():
+    """Send enqueue()d rows to the queue; call once flush() is scheduled"""
+    global _worker_running
+    _worker_running = True
+
+async def flush(engine):
+    """Write everything queued, in COPY batches of up to 500 rows.
+    Schedule it every FLUSH_MAX_WAIT seconds, e.g. on the app's Ticker."""
+    while not AUDIT_Q.empty():
+        batch = []
+        while len(batch) < FLUSH_MAX_ROWS and not AUDIT_Q.empty():
+            batch.append(AUDIT_Q.get_nowait())
+        await _write(engine, batch)
+
+async def shutdown(engine):
+    """Stop queueing and flush whatever is left; call from the app's shutdown hook
+    after its scheduled flushes have stopped"""
+    global _worker_running
+    _worker_running = False
+    await flush(engine)
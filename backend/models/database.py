@@ -4,20 +4,39 @@ SQLAlchemy models for trades, positions, users, bot configurations, and audit tr
 """
 
 from sqlalchemy import (
-    Column, String, Integer, Float, Decimal, Boolean, DateTime, 
-    Text, JSON, ForeignKey, Index, UniqueConstraint, CheckConstraint,
-    Enum as SQLEnum, TIMESTAMP
+    Column, String, Integer, BigInteger, Float, Numeric, Boolean, Date, DateTime, 
+    Text, LargeBinary, ForeignKey, Index, UniqueConstraint, CheckConstraint,
+    SmallInteger, TIMESTAMP, text
 )
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.dialects.postgresql import JSONB, UUID, insert as pg_insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, backref
-from sqlalchemy.sql import func
-from datetime import datetime
-from decimal import Decimal as DecimalType
+from sqlalchemy.orm import relationship, backref, selectinload
+from sqlalchemy.types import TypeDecorator
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+import csv
 import enum
+import io
+import os
+import time
 import uuid
 
 Base = declarative_base()
 
+def utcnow() -> datetime:
+    """Timezone-aware UTC now; all timestamp columns are TIMESTAMPTZ."""
+    return datetime.now(timezone.utc)
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7) so new keys land at the right edge of the B-tree."""
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    rand_a = (rand >> 62) & 0xFFF
+    rand_b = rand & ((1 << 62) - 1)
+    value = (ts_ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
+
 # Enums for various states and types
 
 class OrderStatus(enum.Enum):
@@ -72,19 +91,45 @@ class AlertSeverity(enum.Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
+class EnumInt(TypeDecorator):
+    """Store an enum as SMALLINT using the member's declaration index.
+
+    Codes follow declaration order, so new members must be appended.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls):
+        super().__init__()
+        self.enum_cls = enum_cls
+        self._members = list(enum_cls)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_cls):
+            value = self.enum_cls(value)
+        return self._codes[value]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self._members[value]
+
 # User and Authentication Models
 
 class User(Base):
+    """bot_configs load eagerly (selectin); the other collections never lazy load, use
+    User.load_full() or selectinload(). Pass noload(...) where a list view needs no children."""
     __tablename__ = 'users'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     username = Column(String(100), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), default=UserRole.VIEWER, nullable=False)
+    password_hash = Column(String(100), nullable=False)  # bcrypt, 60 chars
+    role = Column(EnumInt(UserRole), default=UserRole.VIEWER, nullable=False)
     
     # Profile
-    full_name = Column(String(255))
+    full_name = Column(String(100))
     phone = Column(String(50))
     country = Column(String(2))  # ISO country code
     timezone = Column(String(50), default='Australia/Perth')
@@ -93,52 +138,64 @@ class User(Base):
     two_factor_enabled = Column(Boolean, default=False)
     two_factor_secret = Column(String(255))
     api_key = Column(String(64), unique=True, index=True)
-    api_secret_hash = Column(String(255))
+    api_secret_hash = Column(String(100))  # bcrypt, 60 chars
     
     # Compliance
     kyc_verified = Column(Boolean, default=False)
-    kyc_date = Column(DateTime)
+    kyc_date = Column(DateTime(timezone=True))
     tax_id = Column(String(100))
-    w8ben_status = Column(String(50))
-    w8ben_expiry = Column(DateTime)
+    w8ben_expiry = Column(DateTime(timezone=True))
     
     # Status
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
-    last_login = Column(DateTime)
+    last_login = Column(DateTime(timezone=True))
     failed_login_attempts = Column(Integer, default=0)
-    locked_until = Column(DateTime)
+    locked_until = Column(DateTime(timezone=True))
     
     # Timestamps
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    
-    # Relationships
-    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
-    bot_configs = relationship("BotConfiguration", back_populates="user")
-    trades = relationship("Trade", back_populates="user")
-    positions = relationship("Position", back_populates="user")
-    alerts = relationship("Alert", back_populates="user")
-    audit_logs = relationship("AuditLog", back_populates="user")
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    
+    # Relationships (raise_on_sql: load collections explicitly with selectinload/joinedload).
+    # passive_deletes leaves deleting a user to the FKs' ON DELETE actions, so the
+    # ORM never has to load these collections first.
+    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan",
+                            lazy='raise_on_sql', passive_deletes=True)
+    bot_configs = relationship("BotConfiguration", back_populates="user", lazy='selectin')
+    trades = relationship("Trade", back_populates="user", lazy='raise_on_sql', passive_deletes=True)
+    positions = relationship("Position", back_populates="user", lazy='raise_on_sql', passive_deletes=True)
+    alerts = relationship("Alert", back_populates="user", lazy='raise_on_sql', passive_deletes=True)
+    audit_logs = relationship("AuditLog", back_populates="user", lazy='raise_on_sql', passive_deletes=True)
+
+    @classmethod
+    def load_full(cls, session, user_id: str) -> Optional['User']:
+        """Fetch a user with trades and positions in one query per collection
+        (bot_configs is selectin-loaded with every User)."""
+        return session.get(cls, user_id, options=[
+            selectinload(cls.trades),
+            selectinload(cls.positions),
+        ])
 
 class UserSession(Base):
     __tablename__ = 'user_sessions'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     
-    token = Column(String(500), unique=True, nullable=False, index=True)
-    refresh_token = Column(String(500), unique=True, index=True)
+    # SHA-256 digests only; the client holds the raw tokens
+    token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
+    refresh_token_hash = Column(LargeBinary(32), unique=True, index=True)
     
     ip_address = Column(String(45))
     user_agent = Column(String(500))
     device_id = Column(String(100))
     
-    expires_at = Column(DateTime, nullable=False)
-    refresh_expires_at = Column(DateTime)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    refresh_expires_at = Column(DateTime(timezone=True))
     
-    created_at = Column(DateTime, default=func.now())
-    last_activity = Column(DateTime, default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    last_activity = Column(DateTime(timezone=True), default=utcnow)
     
     user = relationship("User", back_populates="sessions")
 
@@ -146,103 +203,122 @@ class UserSession(Base):
 
 class BotConfiguration(Base):
     __tablename__ = 'bot_configurations'
+    __table_args__ = (
+        Index('idx_bot_jurisdictions_gin', 'jurisdictions', postgresql_using='gin'),
+        Index('idx_bot_enabled_strategies_gin', 'enabled_strategies', postgresql_using='gin'),
+    )
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     name = Column(String(100), nullable=False)
     
     # Mode and Status
-    trading_mode = Column(SQLEnum(TradingMode), default=TradingMode.PAPER, nullable=False)
-    bot_status = Column(SQLEnum(BotStatus), default=BotStatus.STOPPED, nullable=False)
+    trading_mode = Column(EnumInt(TradingMode), default=TradingMode.PAPER, nullable=False)
+    bot_status = Column(EnumInt(BotStatus), default=BotStatus.STOPPED, nullable=False)
     bot_version = Column(String(20), default='V1')
     
     # Risk Management (from Infinity specs)
-    per_trade_var = Column(Decimal(10, 6), default=DecimalType('0.001'))  # 0.10%
-    max_daily_loss = Column(Decimal(10, 6), default=DecimalType('0.005'))  # 0.50%
-    rolling_drawdown_stop = Column(Decimal(10, 6), default=DecimalType('0.0125'))  # 1.25%
-    symbol_risk_cap = Column(Decimal(10, 6), default=DecimalType('0.10'))  # 10%
-    venue_risk_cap = Column(Decimal(10, 6), default=DecimalType('0.35'))  # 35%
-    slippage_p95_threshold = Column(Decimal(10, 6), default=DecimalType('0.02'))  # 2%
-    min_ev_ratio = Column(Decimal(10, 4), default=DecimalType('2.0'))
+    per_trade_var = Column(Numeric(10, 6), server_default=text("0.001"))  # 0.10%
+    max_daily_loss = Column(Numeric(10, 6), server_default=text("0.005"))  # 0.50%
+    rolling_drawdown_stop = Column(Numeric(10, 6), server_default=text("0.0125"))  # 1.25%
+    symbol_risk_cap = Column(Numeric(10, 6), server_default=text("0.10"))  # 10%
+    venue_risk_cap = Column(Numeric(10, 6), server_default=text("0.35"))  # 35%
+    slippage_p95_threshold = Column(Numeric(10, 6), server_default=text("0.02"))  # 2%
+    min_ev_ratio = Column(Numeric(10, 4), server_default=text("2.0"))
     
     # Capital Management
-    initial_capital = Column(Decimal(20, 8), nullable=False)
-    current_equity = Column(Decimal(20, 8))
-    reserved_capital = Column(Decimal(20, 8), default=DecimalType('0'))
+    initial_capital = Column(Numeric(20, 8), nullable=False)
+    current_equity = Column(Numeric(20, 8))
+    reserved_capital = Column(Numeric(20, 8), server_default=text("0"))
     
     # Strategy Settings
-    enabled_strategies = Column(JSON, default=list)  # List of strategy IDs
-    strategy_weights = Column(JSON, default=dict)  # Strategy allocation weights
+    enabled_strategies = Column(JSONB, default=list)  # List of strategy IDs
+    strategy_weights = Column(JSONB, default=dict)  # Strategy allocation weights
     
     # Broker Settings
     primary_broker = Column(String(50))
-    broker_accounts = Column(JSON, default=dict)  # Broker account mappings
+    broker_accounts = Column(JSONB, default=dict)  # Broker account mappings
     
     # Compliance Settings
-    jurisdictions = Column(JSON, default=['AU'])  # List of allowed jurisdictions
-    blocked_symbols = Column(JSON, default=list)
+    jurisdictions = Column(JSONB, default=['AU'])  # List of allowed jurisdictions
+    blocked_symbols = Column(JSONB, default=list)
     require_travel_rule = Column(Boolean, default=True)
     
-    # Performance Tracking
-    total_trades = Column(Integer, default=0)
-    winning_trades = Column(Integer, default=0)
-    total_pnl = Column(Decimal(20, 8), default=DecimalType('0'))
-    max_drawdown = Column(Decimal(10, 6), default=DecimalType('0'))
-    sharpe_ratio = Column(Decimal(10, 4))
-    
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    last_active = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    last_active = Column(DateTime(timezone=True))
     
     user = relationship("User", back_populates="bot_configs")
-    strategies = relationship("Strategy", back_populates="bot_config")
+    strategies = relationship("Strategy", back_populates="bot_config", lazy='selectin')
+    metrics = relationship("BotMetrics", uselist=False, back_populates="bot_config")
+
+class BotMetrics(Base):
+    """Per-fill performance counters, kept off the wide bot_configurations row"""
+    __tablename__ = 'bot_metrics'
+    
+    bot_config_id = Column(UUID(as_uuid=True), ForeignKey('bot_configurations.id'), primary_key=True)
+    
+    total_trades = Column(Integer, nullable=False, server_default=text("0"))
+    winning_trades = Column(Integer, nullable=False, server_default=text("0"))
+    total_pnl = Column(Numeric(20, 8), nullable=False, server_default=text("0"))
+    max_drawdown = Column(Numeric(10, 6), server_default=text("0"))
+    sharpe_ratio = Column(Numeric(10, 4))
+    
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    
+    bot_config = relationship("BotConfiguration", back_populates="metrics")
 
 # Trading Models
 
+LIVE_ORDER_STATUSES = (OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIAL)
+LIVE_ORDER_STATUS_CODES = tuple(list(OrderStatus).index(st) for st in LIVE_ORDER_STATUSES)
+
 class Trade(Base):
     __tablename__ = 'trades'
     __table_args__ = (
-        Index('idx_trades_user_time', 'user_id', 'executed_at'),
+        # Unique keys on a partitioned table must include the partition column
+        Index('uq_trades_order_id', 'order_id', text('executed_at DESC'), unique=True),
+        UniqueConstraint('execution_id', 'executed_at', name='uq_trades_execution_id'),
         Index('idx_trades_symbol', 'symbol'),
         Index('idx_trades_strategy', 'strategy_id'),
+        {'postgresql_partition_by': 'RANGE (executed_at)'},
     )
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
-    order_id = Column(String(100), unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    order_id = Column(String(100), nullable=False)
     
-    # Trade Details
+    # Trade Details (price/quantity are BIGINT scaled by PRICE_SCALE, see models/price.py)
     symbol = Column(String(50), nullable=False)
-    side = Column(SQLEnum(OrderSide), nullable=False)
-    quantity = Column(Decimal(20, 8), nullable=False)
-    price = Column(Decimal(20, 8), nullable=False)
+    side = Column(EnumInt(OrderSide), nullable=False)
+    quantity = Column(BigInteger, nullable=False)
+    price = Column(BigInteger, nullable=False)
     
     # Execution Details
-    executed_at = Column(DateTime, nullable=False, index=True)
+    executed_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, index=True)
     venue = Column(String(50), nullable=False)
-    execution_id = Column(String(100), unique=True)
+    execution_id = Column(String(100))
     
     # Costs and Slippage
-    commission = Column(Decimal(20, 8), default=DecimalType('0'))
-    fees = Column(Decimal(20, 8), default=DecimalType('0'))
-    slippage = Column(Decimal(10, 6))  # In basis points
-    spread_cost = Column(Decimal(20, 8))
-    funding_cost = Column(Decimal(20, 8))
-    tax_withheld = Column(Decimal(20, 8))
+    commission = Column(Numeric(20, 8), server_default=text("0"))
+    fees = Column(Numeric(20, 8), server_default=text("0"))
+    slippage = Column(Numeric(10, 6))  # In basis points
+    spread_cost = Column(Numeric(20, 8))
+    funding_cost = Column(Numeric(20, 8))
     
     # P&L
-    realized_pnl = Column(Decimal(20, 8))
-    unrealized_pnl = Column(Decimal(20, 8))
+    realized_pnl = Column(Numeric(20, 8))
+    unrealized_pnl = Column(Numeric(20, 8))
     
     # Risk Metrics
-    position_var = Column(Decimal(20, 8))  # Value at Risk
-    signal_edge = Column(Decimal(10, 6))  # Expected edge
-    ev_after_costs = Column(Decimal(10, 6))  # EV after all costs
+    position_var = Column(Numeric(20, 8))  # Value at Risk
+    signal_edge = Column(Numeric(10, 6))  # Expected edge
+    ev_after_costs = Column(Numeric(10, 6))  # EV after all costs
     
     # Strategy and Signal
-    strategy_id = Column(String(36), ForeignKey('strategies.id'))
-    signal_strength = Column(Decimal(10, 6))
+    strategy_id = Column(UUID(as_uuid=True), ForeignKey('strategies.id', ondelete='SET NULL'))
+    signal_strength = Column(Numeric(10, 6))
     entry_reason = Column(Text)
     
     # Compliance
@@ -255,83 +331,84 @@ class Trade(Base):
     is_canary = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
     
     user = relationship("User", back_populates="trades")
-    strategy = relationship("Strategy", back_populates="trades")
+    strategy = relationship("Strategy", back_populates="trades", lazy='joined')
 
 class Position(Base):
     __tablename__ = 'positions'
     __table_args__ = (
         UniqueConstraint('user_id', 'symbol', 'venue', name='uq_user_symbol_venue'),
-        Index('idx_positions_status', 'status'),
     )
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     
     # Position Details
     symbol = Column(String(50), nullable=False)
     venue = Column(String(50), nullable=False)
-    status = Column(SQLEnum(PositionStatus), default=PositionStatus.OPEN, nullable=False)
+    status = Column(EnumInt(PositionStatus), default=PositionStatus.OPEN, nullable=False)
     
-    # Size and Cost
-    quantity = Column(Decimal(20, 8), nullable=False)
-    average_price = Column(Decimal(20, 8), nullable=False)
-    current_price = Column(Decimal(20, 8))
+    # Size and Cost (scaled by PRICE_SCALE)
+    quantity = Column(BigInteger, nullable=False)
+    average_price = Column(BigInteger, nullable=False)
+    current_price = Column(BigInteger)
     
     # P&L
-    unrealized_pnl = Column(Decimal(20, 8), default=DecimalType('0'))
-    realized_pnl = Column(Decimal(20, 8), default=DecimalType('0'))
-    total_pnl = Column(Decimal(20, 8), default=DecimalType('0'))
+    unrealized_pnl = Column(Numeric(20, 8), server_default=text("0"))
+    realized_pnl = Column(Numeric(20, 8), server_default=text("0"))
+    total_pnl = Column(Numeric(20, 8), server_default=text("0"))
     
     # Risk
-    position_var = Column(Decimal(20, 8))
-    beta = Column(Decimal(10, 4))
+    position_var = Column(Numeric(20, 8))
+    beta = Column(Numeric(10, 4))
     correlation_cluster = Column(String(50))  # e.g., "meme", "defi", "tech"
     
     # Targets
-    stop_loss = Column(Decimal(20, 8))
-    take_profit = Column(Decimal(20, 8))
-    trailing_stop_distance = Column(Decimal(10, 6))
+    stop_loss = Column(Numeric(20, 8))
+    take_profit = Column(Numeric(20, 8))
+    trailing_stop_distance = Column(Numeric(10, 6))
     
     # Timestamps
-    opened_at = Column(DateTime, default=func.now())
-    closed_at = Column(DateTime)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    opened_at = Column(DateTime(timezone=True), default=utcnow)
+    closed_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
     
     user = relationship("User", back_populates="positions")
 
 class Order(Base):
     __tablename__ = 'orders'
     __table_args__ = (
-        Index('idx_orders_user_status', 'user_id', 'status'),
         Index('idx_orders_symbol', 'symbol'),
+        # Router scan: live orders for a venue, oldest first; closed orders never enter this index
+        Index('idx_orders_live_venue_time', 'venue', 'created_at',
+              postgresql_where=text(f"status IN ({', '.join(str(c) for c in LIVE_ORDER_STATUS_CODES)})")),
     )
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     
     # Order Details
     client_order_id = Column(String(100), unique=True, nullable=False, index=True)
     broker_order_id = Column(String(100), unique=True, index=True)
     
     symbol = Column(String(50), nullable=False)
-    side = Column(SQLEnum(OrderSide), nullable=False)
-    order_type = Column(SQLEnum(OrderType), nullable=False)
-    status = Column(SQLEnum(OrderStatus), default=OrderStatus.PENDING, nullable=False)
+    side = Column(EnumInt(OrderSide), nullable=False)
+    order_type = Column(EnumInt(OrderType), nullable=False)
+    status = Column(EnumInt(OrderStatus), default=OrderStatus.PENDING, nullable=False)
     
-    # Quantities and Prices
-    quantity = Column(Decimal(20, 8), nullable=False)
-    filled_quantity = Column(Decimal(20, 8), default=DecimalType('0'))
-    limit_price = Column(Decimal(20, 8))
-    stop_price = Column(Decimal(20, 8))
-    average_fill_price = Column(Decimal(20, 8))
+    # Quantities and Prices (scaled by PRICE_SCALE)
+    quantity = Column(BigInteger, nullable=False)
+    filled_quantity = Column(BigInteger, default=0)
+    limit_price = Column(BigInteger)
+    stop_price = Column(BigInteger)
+    average_fill_price = Column(BigInteger)
     
     # Time in Force
     time_in_force = Column(String(10), default='DAY')  # DAY, GTC, IOC, FOK
-    expire_time = Column(DateTime)
+    expire_time = Column(DateTime(timezone=True))
     
     # Risk Gates Results
     risk_check_passed = Column(Boolean)
@@ -344,23 +421,23 @@ class Order(Base):
     route = Column(String(50))
     
     # Strategy
-    strategy_id = Column(String(36), ForeignKey('strategies.id'))
+    strategy_id = Column(UUID(as_uuid=True), ForeignKey('strategies.id'))
     signal_id = Column(String(100))
     
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
-    submitted_at = Column(DateTime)
-    filled_at = Column(DateTime)
-    cancelled_at = Column(DateTime)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    submitted_at = Column(DateTime(timezone=True))
+    filled_at = Column(DateTime(timezone=True))
+    cancelled_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
 
 # Strategy Models
 
 class Strategy(Base):
     __tablename__ = 'strategies'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    bot_config_id = Column(String(36), ForeignKey('bot_configurations.id'), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    bot_config_id = Column(UUID(as_uuid=True), ForeignKey('bot_configurations.id'), nullable=False)
     
     name = Column(String(100), nullable=False)
     strategy_type = Column(String(50), nullable=False)  # e.g., 'microstructure_thrust'
@@ -371,82 +448,108 @@ class Strategy(Base):
     is_paper_only = Column(Boolean, default=False)
     
     # Parameters
-    parameters = Column(JSON, default=dict)
+    parameters = Column(JSONB, default=dict)
     
     # Risk Limits
-    max_position_size = Column(Decimal(20, 8))
+    max_position_size = Column(Numeric(20, 8))
     max_daily_trades = Column(Integer)
-    min_signal_strength = Column(Decimal(10, 6))
-    
-    # Performance
-    total_trades = Column(Integer, default=0)
-    winning_trades = Column(Integer, default=0)
-    total_pnl = Column(Decimal(20, 8), default=DecimalType('0'))
-    sharpe_ratio = Column(Decimal(10, 4))
-    max_drawdown = Column(Decimal(10, 6))
+    min_signal_strength = Column(Numeric(10, 6))
     
     # Canary Status
     canary_fills = Column(Integer, default=0)
-    canary_p95_slippage = Column(Decimal(10, 6))
     canary_passed = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    last_signal_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    last_signal_at = Column(DateTime(timezone=True))
     
     bot_config = relationship("BotConfiguration", back_populates="strategies")
-    trades = relationship("Trade", back_populates="strategy")
+    # Unbounded; load explicitly (selectinload, or a LIMITed query for recent trades)
+    trades = relationship("Trade", back_populates="strategy", lazy='raise_on_sql', passive_deletes=True)
+    metrics = relationship("StrategyMetrics", uselist=False, back_populates="strategy")
+
+class StrategyMetrics(Base):
+    """Per-fill performance counters for a strategy"""
+    __tablename__ = 'strategy_metrics'
+    
+    strategy_id = Column(UUID(as_uuid=True), ForeignKey('strategies.id'), primary_key=True)
+    
+    total_trades = Column(Integer, nullable=False, server_default=text("0"))
+    winning_trades = Column(Integer, nullable=False, server_default=text("0"))
+    total_pnl = Column(Numeric(20, 8), nullable=False, server_default=text("0"))
+    sharpe_ratio = Column(Numeric(10, 4))
+    max_drawdown = Column(Numeric(10, 6))
+    
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    
+    strategy = relationship("Strategy", back_populates="metrics")
 
 # Market Data Models
 
 class MarketData(Base):
     __tablename__ = 'market_data'
     __table_args__ = (
-        Index('idx_market_data_symbol_time', 'symbol', 'timestamp'),
-        Index('idx_market_data_venue', 'venue'),
+        # Serves "latest N bars for symbol on venue" as an index-only scan
+        Index('idx_market_data_symbol_venue_time', 'symbol', 'venue', text('timestamp DESC'),
+              postgresql_include=['close', 'volume', 'bid', 'ask']),
+        # Rows arrive in timestamp order, so a BRIN index covers range filters at a fraction of B-tree size
+        Index('idx_market_data_ts_brin', 'timestamp', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     symbol = Column(String(50), nullable=False)
     venue = Column(String(50), nullable=False)
-    timestamp = Column(DateTime, nullable=False)
+    timestamp = Column(DateTime(timezone=True), primary_key=True, nullable=False)
     
-    # OHLCV
-    open = Column(Decimal(20, 8))
-    high = Column(Decimal(20, 8))
-    low = Column(Decimal(20, 8))
-    close = Column(Decimal(20, 8), nullable=False)
-    volume = Column(Decimal(20, 8))
+    # OHLCV (prices are scaled by PRICE_SCALE; volume and sizes stay unscaled
+    # NUMERIC, since high-supply tokens trade more than the ~9.2e10 units a
+    # scaled BIGINT can hold)
+    open = Column(BigInteger)
+    high = Column(BigInteger)
+    low = Column(BigInteger)
+    close = Column(BigInteger, nullable=False)
+    volume = Column(Numeric(28, 8))
     
     # Bid/Ask
-    bid = Column(Decimal(20, 8))
-    ask = Column(Decimal(20, 8))
-    bid_size = Column(Decimal(20, 8))
-    ask_size = Column(Decimal(20, 8))
+    bid = Column(BigInteger)
+    ask = Column(BigInteger)
+    bid_size = Column(Numeric(28, 8))
+    ask_size = Column(Numeric(28, 8))
     
     # Market Microstructure
-    spread = Column(Decimal(10, 6))  # In basis points
-    imbalance = Column(Decimal(10, 6))
+    spread = Column(Numeric(10, 6))  # In basis points
+    imbalance = Column(Numeric(10, 6))
     trade_count = Column(Integer)
     
     # Additional Metrics
-    vwap = Column(Decimal(20, 8))
-    twap = Column(Decimal(20, 8))
-    volatility = Column(Decimal(10, 6))
-    
-    created_at = Column(DateTime, default=func.now())
+    vwap = Column(BigInteger)
+    twap = Column(BigInteger)
+    volatility = Column(Numeric(10, 6))
+    
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+
+# Column order used by copy_market_data(); MarketData is written through COPY, the ORM class is for reads
+MARKET_DATA_COPY_COLUMNS = (
+    'symbol', 'venue', 'timestamp',
+    'open', 'high', 'low', 'close', 'volume',
+    'bid', 'ask', 'bid_size', 'ask_size',
+    'spread', 'imbalance', 'trade_count',
+    'vwap', 'twap', 'volatility',
+)
 
 # Compliance and Audit Models
 
 class ComplianceCheck(Base):
     __tablename__ = 'compliance_checks'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
-    order_id = Column(String(36), ForeignKey('orders.id'))
-    trade_id = Column(String(36), ForeignKey('trades.id'))
+    order_id = Column(UUID(as_uuid=True), ForeignKey('orders.id'))
+    trade_id = Column(UUID(as_uuid=True))  # No FK: trades is partitioned on (id, executed_at)
     
     check_type = Column(String(50), nullable=False)  # 'pre_trade', 'post_trade', 'periodic'
     jurisdiction = Column(String(2))
@@ -454,7 +557,7 @@ class ComplianceCheck(Base):
     # Check Results
     passed = Column(Boolean, nullable=False)
     reason = Column(Text)
-    rules_checked = Column(JSON, default=list)
+    rules_checked = Column(JSONB, default=list)
     
     # Specific Checks
     pdt_check = Column(Boolean)
@@ -464,30 +567,36 @@ class ComplianceCheck(Base):
     tax_check = Column(Boolean)
     
     # Risk Scores
-    risk_score = Column(Decimal(10, 4))
-    venue_risk_score = Column(Decimal(10, 4))
-    counterparty_risk_score = Column(Decimal(10, 4))
+    risk_score = Column(Numeric(10, 4))
+    venue_risk_score = Column(Numeric(10, 4))
+    counterparty_risk_score = Column(Numeric(10, 4))
     
-    timestamp = Column(DateTime, default=func.now())
+    timestamp = Column(DateTime(timezone=True), default=utcnow)
 
 class AuditLog(Base):
     __tablename__ = 'audit_logs'
     __table_args__ = (
         Index('idx_audit_logs_user', 'user_id'),
-        Index('idx_audit_logs_timestamp', 'timestamp'),
+        Index('idx_audit_logs_ts_brin', 'timestamp', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
         Index('idx_audit_logs_entity', 'entity_type', 'entity_id'),
+        Index('idx_audit_logs_old_values_gin', 'old_values', postgresql_using='gin',
+              postgresql_ops={'old_values': 'jsonb_path_ops'}),
+        Index('idx_audit_logs_new_values_gin', 'new_values', postgresql_using='gin',
+              postgresql_ops={'new_values': 'jsonb_path_ops'}),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey('users.id'))
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'))
     
     action = Column(String(50), nullable=False)  # 'create', 'update', 'delete', 'login', etc.
     entity_type = Column(String(50))  # 'order', 'trade', 'position', etc.
-    entity_id = Column(String(36))
+    entity_id = Column(String(64))
     
     # Details
-    old_values = Column(JSON)
-    new_values = Column(JSON)
+    old_values = Column(JSONB)
+    new_values = Column(JSONB)
     ip_address = Column(String(45))
     user_agent = Column(String(500))
     
@@ -495,7 +604,7 @@ class AuditLog(Base):
     success = Column(Boolean, default=True)
     error_message = Column(Text)
     
-    timestamp = Column(DateTime, default=func.now(), nullable=False)
+    timestamp = Column(DateTime(timezone=True), default=utcnow, primary_key=True, nullable=False)
     
     user = relationship("User", back_populates="audit_logs")
 
@@ -508,10 +617,10 @@ class Alert(Base):
         Index('idx_alerts_timestamp', 'timestamp'),
     )
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey('users.id'))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'))
     
-    severity = Column(SQLEnum(AlertSeverity), nullable=False)
+    severity = Column(EnumInt(AlertSeverity), nullable=False)
     category = Column(String(50), nullable=False)  # 'risk', 'compliance', 'performance', etc.
     
     title = Column(String(200), nullable=False)
@@ -519,94 +628,115 @@ class Alert(Base):
     
     # Context
     symbol = Column(String(50))
-    strategy_id = Column(String(36))
-    order_id = Column(String(36))
+    strategy_id = Column(UUID(as_uuid=True))
+    order_id = Column(UUID(as_uuid=True))
     
     # Delivery
-    channels = Column(JSON, default=['ui'])  # 'ui', 'email', 'telegram', 'discord'
-    sent_at = Column(DateTime)
-    acknowledged_at = Column(DateTime)
+    channels = Column(JSONB, default=['ui'])  # 'ui', 'email', 'telegram', 'discord'
+    sent_at = Column(DateTime(timezone=True))
+    acknowledged_at = Column(DateTime(timezone=True))
     
     # Auto-resolution
     auto_resolve = Column(Boolean, default=False)
-    resolved_at = Column(DateTime)
+    resolved_at = Column(DateTime(timezone=True))
     resolution = Column(Text)
     
-    timestamp = Column(DateTime, default=func.now(), nullable=False)
+    timestamp = Column(DateTime(timezone=True), default=utcnow, nullable=False)
     
     user = relationship("User", back_populates="alerts")
 
 # Performance Metrics Models
 
-class DailyPerformance(Base):
+# daily_performance is a materialized view over trades, refreshed by refresh_daily_performance().
+# It is mapped on ViewBase so Base.metadata.create_all() never tries to create it as a table.
+ViewBase = declarative_base()
+
+DAILY_PERFORMANCE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS daily_performance AS
+SELECT
+    user_id,
+    (executed_at AT TIME ZONE 'UTC')::date AS date,
+    COUNT(*) AS trades_count,
+    COUNT(*) FILTER (WHERE realized_pnl > 0) AS winning_trades,
+    COUNT(*) FILTER (WHERE realized_pnl < 0) AS losing_trades,
+    COALESCE(SUM(realized_pnl), 0) AS gross_pnl,
+    COALESCE(SUM(realized_pnl), 0) - COALESCE(SUM(fees), 0) AS net_pnl,
+    COALESCE(SUM(fees), 0) AS fees,
+    AVG(slippage) AS average_slippage,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY slippage) AS p95_slippage
+FROM trades
+WHERE is_paper IS NOT TRUE
+GROUP BY 1, 2
+"""
+
+class DailyPerformance(ViewBase):
+    """Read-only daily rollup of trades"""
     __tablename__ = 'daily_performance'
-    __table_args__ = (
-        UniqueConstraint('user_id', 'date', name='uq_user_date'),
-        Index('idx_daily_performance_date', 'date'),
-    )
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
-    date = Column(DateTime, nullable=False)
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    date = Column(Date, primary_key=True)
     
     # P&L
-    gross_pnl = Column(Decimal(20, 8), default=DecimalType('0'))
-    net_pnl = Column(Decimal(20, 8), default=DecimalType('0'))
-    fees = Column(Decimal(20, 8), default=DecimalType('0'))
+    gross_pnl = Column(Numeric(20, 8))
+    net_pnl = Column(Numeric(20, 8))
+    fees = Column(Numeric(20, 8))
     
     # Trading Activity
-    trades_count = Column(Integer, default=0)
-    winning_trades = Column(Integer, default=0)
-    losing_trades = Column(Integer, default=0)
-    
-    # Risk Metrics
-    max_drawdown = Column(Decimal(10, 6))
-    var_breach_count = Column(Integer, default=0)
-    sharpe_ratio = Column(Decimal(10, 4))
+    trades_count = Column(Integer)
+    winning_trades = Column(Integer)
+    losing_trades = Column(Integer)
     
     # Slippage
-    average_slippage = Column(Decimal(10, 6))
-    p95_slippage = Column(Decimal(10, 6))
-    
-    # Capital
-    starting_equity = Column(Decimal(20, 8))
-    ending_equity = Column(Decimal(20, 8))
-    
-    created_at = Column(DateTime, default=func.now())
+    average_slippage = Column(Numeric(10, 6))
+    p95_slippage = Column(Numeric(10, 6))
+
+def create_views(engine) -> None:
+    """Create the materialized views and the unique index CONCURRENTLY refresh needs."""
+    with engine.begin() as conn:
+        conn.execute(text(DAILY_PERFORMANCE_VIEW_SQL))
+        conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_daily_performance_user_date "
+            "ON daily_performance (user_id, date)"
+        ))
+
+def refresh_daily_performance(engine) -> None:
+    """Recompute daily_performance without blocking readers; run every few minutes."""
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY daily_performance"))
 
 # Backtesting Models
 
 class Backtest(Base):
     __tablename__ = 'backtests'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     
     name = Column(String(100), nullable=False)
-    strategy_id = Column(String(36), ForeignKey('strategies.id'))
+    strategy_id = Column(UUID(as_uuid=True), ForeignKey('strategies.id'))
     
     # Period
-    start_date = Column(DateTime, nullable=False)
-    end_date = Column(DateTime, nullable=False)
+    start_date = Column(DateTime(timezone=True), nullable=False)
+    end_date = Column(DateTime(timezone=True), nullable=False)
     
     # Configuration
-    initial_capital = Column(Decimal(20, 8), nullable=False)
-    parameters = Column(JSON, default=dict)
+    initial_capital = Column(Numeric(20, 8), nullable=False)
+    parameters = Column(JSONB, default=dict)
     
     # Results
-    final_equity = Column(Decimal(20, 8))
-    total_return = Column(Decimal(10, 6))
-    sharpe_ratio = Column(Decimal(10, 4))
-    max_drawdown = Column(Decimal(10, 6))
-    win_rate = Column(Decimal(10, 6))
-    profit_factor = Column(Decimal(10, 4))
+    final_equity = Column(Numeric(20, 8))
+    total_return = Column(Numeric(10, 6))
+    sharpe_ratio = Column(Numeric(10, 4))
+    max_drawdown = Column(Numeric(10, 6))
+    win_rate = Column(Numeric(10, 6))
+    profit_factor = Column(Numeric(10, 4))
     
     # Trade Statistics
     total_trades = Column(Integer)
     winning_trades = Column(Integer)
     losing_trades = Column(Integer)
-    average_win = Column(Decimal(20, 8))
-    average_loss = Column(Decimal(20, 8))
+    average_win = Column(Numeric(20, 8))
+    average_loss = Column(Numeric(20, 8))
     
     # Status
     status = Column(String(20), default='pending')  # pending, running, completed, failed
@@ -614,15 +744,15 @@ class Backtest(Base):
     error_message = Column(Text)
     
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
-    completed_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    completed_at = Column(DateTime(timezone=True))
 
 # Venue and Broker Models
 
 class Venue(Base):
     __tablename__ = 'venues'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(50), unique=True, nullable=False)
     venue_type = Column(String(20), nullable=False)  # 'exchange', 'broker', 'otc'
     
@@ -630,19 +760,18 @@ class Venue(Base):
     is_licensed = Column(Boolean, default=True)
     kyc_capable = Column(Boolean, default=True)
     travel_rule_capable = Column(Boolean, default=False)
-    jurisdictions = Column(JSON, default=list)
+    jurisdictions = Column(JSONB, default=list)
     
     # Risk Scoring
-    risk_score = Column(Decimal(10, 4), default=DecimalType('1.0'))
-    uptime_percentage = Column(Decimal(10, 4))
-    withdrawal_reliability = Column(Decimal(10, 4))
+    risk_score = Column(Numeric(10, 4), server_default=text("1.0"))
+    uptime_percentage = Column(Numeric(10, 4))
     has_proof_of_reserves = Column(Boolean, default=False)
     
     # Trading Limits
-    min_order_size = Column(Decimal(20, 8))
-    max_order_size = Column(Decimal(20, 8))
-    maker_fee = Column(Decimal(10, 6))
-    taker_fee = Column(Decimal(10, 6))
+    min_order_size = Column(Numeric(20, 8))
+    max_order_size = Column(Numeric(20, 8))
+    maker_fee = Column(Numeric(10, 6))
+    taker_fee = Column(Numeric(10, 6))
     
     # API Configuration
     api_endpoint = Column(String(500))
@@ -652,12 +781,196 @@ class Venue(Base):
     # Status
     is_active = Column(Boolean, default=True)
     maintenance_mode = Column(Boolean, default=False)
-    last_health_check = Column(DateTime)
+    last_health_check = Column(DateTime(timezone=True))
     
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
 
 # Create indexes for performance
+# These composites also serve (user_id, executed_at) / (user_id, status) lookups via their leading columns
 Index('idx_trades_composite', Trade.user_id, Trade.executed_at, Trade.symbol)
 Index('idx_positions_composite', Position.user_id, Position.status, Position.symbol)
 Index('idx_orders_composite', Order.user_id, Order.status, Order.created_at)
+
+# Time partitioning
+#
+# trades, market_data and audit_logs are range partitioned on their time column.
+# maintain_partitions() is meant to run nightly: it makes sure the current and next
+# partitions exist and vacuums the one that just went cold. Each table also has a
+# DEFAULT partition; Postgres refuses to create a range partition while the default
+# holds rows in that range, so keep partitions created ahead of time.
+
+PARTITIONED_TABLES = {
+    'trades': 'month',
+    'market_data': 'month',
+    'audit_logs': 'week',
+}
+
+def _partition_bounds(period: str, when: datetime):
+    """Return (name suffix, start, end) of the partition containing ``when``."""
+    when = when.astimezone(timezone.utc) if when.tzinfo else when.replace(tzinfo=timezone.utc)
+    day = datetime(when.year, when.month, when.day, tzinfo=timezone.utc)
+    if period == 'week':
+        start = day - timedelta(days=day.weekday())
+        return start.strftime('%Y_%m_%d'), start, start + timedelta(days=7)
+    start = day.replace(day=1)
+    end = (start + timedelta(days=32)).replace(day=1)
+    return start.strftime('%Y_%m'), start, end
+
+def create_partition(conn, table: str, when: datetime) -> str:
+    """Create the partition of ``table`` covering ``when`` if it does not exist."""
+    suffix, start, end = _partition_bounds(PARTITIONED_TABLES[table], when)
+    name = f"{table}_{suffix}"
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+    return name
+
+def _create_initial_partitions(target, connection, **kw):
+    """create_all() only builds the partitioned parent. Add the current and next
+    partitions, plus a DEFAULT one so out-of-range rows never fail to insert."""
+    now = utcnow()
+    _, _, end = _partition_bounds(PARTITIONED_TABLES[target.name], now)
+    create_partition(connection, target.name, now)
+    create_partition(connection, target.name, end)
+    connection.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {target.name}_default PARTITION OF {target.name} DEFAULT"
+    ))
+
+for _table in PARTITIONED_TABLES:
+    event.listen(Base.metadata.tables[_table], 'after_create', _create_initial_partitions)
+
+def maintain_partitions(engine, now: Optional[datetime] = None) -> None:
+    """Pre-create upcoming partitions and VACUUM ANALYZE the previous ones."""
+    now = now or utcnow()
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        for table, period in PARTITIONED_TABLES.items():
+            _, start, end = _partition_bounds(period, now)
+            create_partition(conn, table, now)
+            create_partition(conn, table, end)
+
+            prev_suffix, _, _ = _partition_bounds(period, start - timedelta(days=1))
+            prev = f"{table}_{prev_suffix}"
+            if conn.execute(text("SELECT to_regclass(:name)"), {'name': prev}).scalar():
+                conn.execute(text(f"VACUUM ANALYZE {prev}"))
+
+# Engine and bulk write helpers
+
+BULK_BATCH_SIZE = 500
+
+def create_db_engine(url: str, **kwargs):
+    """Create the engine for these models.
+
+    On psycopg2 the ORM's flush of many pending rows (``session.add_all(trades)``)
+    goes out as multi-row ``INSERT ... VALUES (...), (...)`` pages of 500, and other
+    executemany statements use psycopg2's execute_batch. The pool is sized for
+    write-heavy workers.
+    """
+    if url.startswith(('postgresql://', 'postgresql+psycopg2://')):
+        kwargs.setdefault('executemany_mode', 'values_plus_batch')
+        kwargs.setdefault('insertmanyvalues_page_size', BULK_BATCH_SIZE)
+        kwargs.setdefault('executemany_batch_page_size', BULK_BATCH_SIZE)
+        kwargs.setdefault('pool_size', 20)
+        kwargs.setdefault('max_overflow', 40)
+    kwargs.setdefault('pool_pre_ping', True)
+    return create_engine(url, **kwargs)
+
+def bulk_insert(session, model, rows: List[Dict[str, Any]], batch_size: int = BULK_BATCH_SIZE) -> List[Any]:
+    """Insert many rows through Core in fixed-size batches.
+
+    Bypasses the ORM unit of work so each batch goes out as a single
+    executemany. Missing UUID primary keys are generated up front in one
+    pass instead of through the per-row column default, and defaulted
+    timestamps share one value for the whole call.
+    """
+    pk = model.__table__.primary_key.columns.values()[0]
+    if isinstance(pk.type, UUID):
+        missing = [row for row in rows if row.get(pk.name) is None]
+        for row, new_id in zip(missing, [uuid7() for _ in range(len(missing))]):
+            row[pk.name] = new_id
+
+    ts = utcnow()
+    for col in model.__table__.columns:
+        if isinstance(col.type, DateTime) and col.default is not None and col.default.is_callable:
+            for row in rows:
+                if row.get(col.name) is None:
+                    row[col.name] = ts
+
+    stmt = model.__table__.insert()
+    for start in range(0, len(rows), batch_size):
+        session.execute(stmt, rows[start:start + batch_size])
+
+    return [row.get(pk.name) for row in rows]
+
+def _returning_columns(model):
+    """Primary key plus the timestamp columns the database or defaults fill in."""
+    return [
+        col for col in model.__table__.columns
+        if col.primary_key or (isinstance(col.type, DateTime) and col.default is not None)
+    ]
+
+def insert_returning(session, model, data: Dict[str, Any]):
+    """Insert one row and read back its id and timestamps in the same round trip.
+
+    Use instead of ``session.add(obj); session.flush(); session.refresh(obj)``
+    on fill paths for Trade, Position and Order.
+    """
+    stmt = insert(model).values(**data).returning(*_returning_columns(model))
+    return session.execute(stmt).one()
+
+def insert_many_returning(session, model, rows: List[Dict[str, Any]]):
+    """Batched INSERT ... RETURNING; rows come back in input order."""
+    if not rows:
+        return []
+    stmt = insert(model).returning(*_returning_columns(model), sort_by_parameter_order=True)
+    return session.execute(stmt, rows).all()
+
+def record_fill(session, bot_config_id, pnl, strategy_id=None) -> None:
+    """Bump the bot (and strategy) counters for one fill with narrow upserts."""
+    won = 1 if pnl > 0 else 0
+    now = utcnow()
+    targets = [(BotMetrics, BotMetrics.bot_config_id, bot_config_id)]
+    if strategy_id is not None:
+        targets.append((StrategyMetrics, StrategyMetrics.strategy_id, strategy_id))
+
+    for model, key, key_value in targets:
+        stmt = pg_insert(model).values({
+            key.name: key_value,
+            'total_trades': 1,
+            'winning_trades': won,
+            'total_pnl': pnl,
+            'updated_at': now,
+        })
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=[key],
+            set_={
+                'total_trades': model.total_trades + 1,
+                'winning_trades': model.winning_trades + won,
+                'total_pnl': model.total_pnl + pnl,
+                'updated_at': now,
+            },
+        ))
+
+def copy_market_data(conn, rows: Iterable[Dict[str, Any]]) -> int:
+    """Stream market data rows into Postgres with COPY FROM STDIN.
+
+    ``conn`` is a raw psycopg2 connection (``engine.raw_connection()``). Missing
+    or None fields are written as NULL. Returns the number of rows copied.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    count = 0
+    for row in rows:
+        writer.writerow([row.get(col) for col in MARKET_DATA_COPY_COLUMNS])
+        count += 1
+    if not count:
+        return 0
+
+    buf.seek(0)
+    with conn.cursor() as cur:
+        cur.copy_expert(
+            f"COPY market_data ({', '.join(MARKET_DATA_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buf,
+        )
+    return count
@@ -0,0 +1,34 @@
+-- Store prices and quantities as BIGINT scaled by 1e8 (see models/price.py)
+
+BEGIN;
+
+ALTER TABLE trades
+    ALTER COLUMN quantity TYPE BIGINT USING round(quantity * 100000000)::bigint,
+    ALTER COLUMN price TYPE BIGINT USING round(price * 100000000)::bigint;
+
+ALTER TABLE positions
+    ALTER COLUMN quantity TYPE BIGINT USING round(quantity * 100000000)::bigint,
+    ALTER COLUMN average_price TYPE BIGINT USING round(average_price * 100000000)::bigint,
+    ALTER COLUMN current_price TYPE BIGINT USING round(current_price * 100000000)::bigint;
+
+ALTER TABLE orders
+    ALTER COLUMN quantity TYPE BIGINT USING round(quantity * 100000000)::bigint,
+    ALTER COLUMN filled_quantity TYPE BIGINT USING round(filled_quantity * 100000000)::bigint,
+    ALTER COLUMN limit_price TYPE BIGINT USING round(limit_price * 100000000)::bigint,
+    ALTER COLUMN stop_price TYPE BIGINT USING round(stop_price * 100000000)::bigint,
+    ALTER COLUMN average_fill_price TYPE BIGINT USING round(average_fill_price * 100000000)::bigint;
+
+ALTER TABLE market_data
+    ALTER COLUMN open TYPE BIGINT USING round(open * 100000000)::bigint,
+    ALTER COLUMN high TYPE BIGINT USING round(high * 100000000)::bigint,
+    ALTER COLUMN low TYPE BIGINT USING round(low * 100000000)::bigint,
+    ALTER COLUMN close TYPE BIGINT USING round(close * 100000000)::bigint,
+    ALTER COLUMN volume TYPE BIGINT USING round(volume * 100000000)::bigint,
+    ALTER COLUMN bid TYPE BIGINT USING round(bid * 100000000)::bigint,
+    ALTER COLUMN ask TYPE BIGINT USING round(ask * 100000000)::bigint,
+    ALTER COLUMN bid_size TYPE BIGINT USING round(bid_size * 100000000)::bigint,
+    ALTER COLUMN ask_size TYPE BIGINT USING round(ask_size * 100000000)::bigint,
+    ALTER COLUMN vwap TYPE BIGINT USING round(vwap * 100000000)::bigint,
+    ALTER COLUMN twap TYPE BIGINT USING round(twap * 100000000)::bigint;
+
+COMMIT;
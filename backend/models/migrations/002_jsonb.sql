@@ -0,0 +1,26 @@
+-- Move JSON columns to JSONB and index the ones filtered with @>
+
+BEGIN;
+
+ALTER TABLE bot_configurations
+    ALTER COLUMN enabled_strategies TYPE JSONB USING enabled_strategies::jsonb,
+    ALTER COLUMN strategy_weights TYPE JSONB USING strategy_weights::jsonb,
+    ALTER COLUMN broker_accounts TYPE JSONB USING broker_accounts::jsonb,
+    ALTER COLUMN jurisdictions TYPE JSONB USING jurisdictions::jsonb,
+    ALTER COLUMN blocked_symbols TYPE JSONB USING blocked_symbols::jsonb;
+
+ALTER TABLE strategies ALTER COLUMN parameters TYPE JSONB USING parameters::jsonb;
+ALTER TABLE compliance_checks ALTER COLUMN rules_checked TYPE JSONB USING rules_checked::jsonb;
+ALTER TABLE audit_logs
+    ALTER COLUMN old_values TYPE JSONB USING old_values::jsonb,
+    ALTER COLUMN new_values TYPE JSONB USING new_values::jsonb;
+ALTER TABLE alerts ALTER COLUMN channels TYPE JSONB USING channels::jsonb;
+ALTER TABLE backtests ALTER COLUMN parameters TYPE JSONB USING parameters::jsonb;
+ALTER TABLE venues ALTER COLUMN jurisdictions TYPE JSONB USING jurisdictions::jsonb;
+
+CREATE INDEX idx_bot_jurisdictions_gin ON bot_configurations USING gin (jurisdictions);
+CREATE INDEX idx_bot_enabled_strategies_gin ON bot_configurations USING gin (enabled_strategies);
+CREATE INDEX idx_audit_logs_old_values_gin ON audit_logs USING gin (old_values jsonb_path_ops);
+CREATE INDEX idx_audit_logs_new_values_gin ON audit_logs USING gin (new_values jsonb_path_ops);
+
+COMMIT;
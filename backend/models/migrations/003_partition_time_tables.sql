@@ -0,0 +1,60 @@
+-- Range partition trades / market_data (monthly) and audit_logs (weekly).
+-- Existing rows land in each table's DEFAULT partition; later partitions are
+-- created ahead of time by models.database.maintain_partitions().
+-- The partition keys become TIMESTAMPTZ here, since a key column's type cannot
+-- be changed once the table is partitioned (009 converts the other columns).
+-- Keys and constraints are added, with explicit names, only after the legacy
+-- table is dropped; while it exists its trades_pkey / *_fkey names are taken and
+-- Postgres would pick *_pkey1 / *_fkey1, which later migrations don't know about.
+
+BEGIN;
+
+ALTER TABLE compliance_checks DROP CONSTRAINT IF EXISTS compliance_checks_trade_id_fkey;
+
+-- trades
+ALTER TABLE trades ALTER COLUMN executed_at TYPE timestamptz USING executed_at AT TIME ZONE 'UTC';
+ALTER TABLE trades RENAME TO trades_legacy;
+CREATE TABLE trades (LIKE trades_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (executed_at);
+CREATE TABLE trades_default PARTITION OF trades DEFAULT;
+INSERT INTO trades SELECT * FROM trades_legacy;
+DROP TABLE trades_legacy;
+ALTER TABLE trades ADD CONSTRAINT trades_pkey PRIMARY KEY (id, executed_at);
+ALTER TABLE trades ADD CONSTRAINT uq_trades_order_id UNIQUE (order_id, executed_at);
+ALTER TABLE trades ADD CONSTRAINT uq_trades_execution_id UNIQUE (execution_id, executed_at);
+ALTER TABLE trades ADD CONSTRAINT trades_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE trades ADD CONSTRAINT trades_strategy_id_fkey FOREIGN KEY (strategy_id) REFERENCES strategies (id);
+CREATE INDEX ix_trades_order_id ON trades (order_id);
+CREATE INDEX ix_trades_executed_at ON trades (executed_at);
+CREATE INDEX idx_trades_symbol ON trades (symbol);
+CREATE INDEX idx_trades_strategy ON trades (strategy_id);
+CREATE INDEX idx_trades_composite ON trades (user_id, executed_at, symbol);
+
+-- market_data
+ALTER TABLE market_data ALTER COLUMN timestamp TYPE timestamptz USING timestamp AT TIME ZONE 'UTC';
+ALTER TABLE market_data RENAME TO market_data_legacy;
+CREATE TABLE market_data (LIKE market_data_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (timestamp);
+CREATE TABLE market_data_default PARTITION OF market_data DEFAULT;
+INSERT INTO market_data SELECT * FROM market_data_legacy;
+ALTER SEQUENCE market_data_id_seq OWNED BY market_data.id;
+DROP TABLE market_data_legacy;
+ALTER TABLE market_data ADD CONSTRAINT market_data_pkey PRIMARY KEY (id, timestamp);
+CREATE INDEX idx_market_data_symbol_venue_time ON market_data (symbol, venue, timestamp DESC)
+    INCLUDE (close, volume, bid, ask);
+
+-- audit_logs
+ALTER TABLE audit_logs ALTER COLUMN timestamp TYPE timestamptz USING timestamp AT TIME ZONE 'UTC';
+ALTER TABLE audit_logs RENAME TO audit_logs_legacy;
+CREATE TABLE audit_logs (LIKE audit_logs_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (timestamp);
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+INSERT INTO audit_logs SELECT * FROM audit_logs_legacy;
+ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id;
+DROP TABLE audit_logs_legacy;
+ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, timestamp);
+ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id);
+CREATE INDEX idx_audit_logs_user ON audit_logs (user_id);
+CREATE INDEX idx_audit_logs_timestamp ON audit_logs (timestamp);
+CREATE INDEX idx_audit_logs_entity ON audit_logs (entity_type, entity_id);
+CREATE INDEX idx_audit_logs_old_values_gin ON audit_logs USING gin (old_values jsonb_path_ops);
+CREATE INDEX idx_audit_logs_new_values_gin ON audit_logs USING gin (new_values jsonb_path_ops);
+
+COMMIT;
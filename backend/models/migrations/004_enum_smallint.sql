@@ -0,0 +1,36 @@
+-- Store enum columns as SMALLINT codes (declaration order of the Python enums)
+
+BEGIN;
+
+ALTER TABLE users ALTER COLUMN role TYPE smallint USING
+    CASE role::text WHEN 'ADMIN' THEN 0 WHEN 'TRADER' THEN 1 WHEN 'VIEWER' THEN 2 WHEN 'API' THEN 3 END;
+
+ALTER TABLE bot_configurations
+    ALTER COLUMN trading_mode TYPE smallint USING
+        CASE trading_mode::text WHEN 'PAPER' THEN 0 WHEN 'MICRO' THEN 1 WHEN 'FULL' THEN 2 WHEN 'BLOCKED' THEN 3 END,
+    ALTER COLUMN bot_status TYPE smallint USING
+        CASE bot_status::text WHEN 'STOPPED' THEN 0 WHEN 'STARTING' THEN 1 WHEN 'RUNNING' THEN 2
+            WHEN 'PAUSED' THEN 3 WHEN 'ERROR' THEN 4 WHEN 'EMERGENCY_STOP' THEN 5 END;
+
+ALTER TABLE trades ALTER COLUMN side TYPE smallint USING
+    CASE side::text WHEN 'BUY' THEN 0 WHEN 'SELL' THEN 1 END;
+
+ALTER TABLE positions ALTER COLUMN status TYPE smallint USING
+    CASE status::text WHEN 'OPEN' THEN 0 WHEN 'CLOSED' THEN 1 WHEN 'PARTIAL' THEN 2 END;
+
+ALTER TABLE orders
+    ALTER COLUMN side TYPE smallint USING
+        CASE side::text WHEN 'BUY' THEN 0 WHEN 'SELL' THEN 1 END,
+    ALTER COLUMN order_type TYPE smallint USING
+        CASE order_type::text WHEN 'MARKET' THEN 0 WHEN 'LIMIT' THEN 1 WHEN 'STOP' THEN 2
+            WHEN 'STOP_LIMIT' THEN 3 WHEN 'TRAILING_STOP' THEN 4 WHEN 'ICEBERG' THEN 5 END,
+    ALTER COLUMN status TYPE smallint USING
+        CASE status::text WHEN 'PENDING' THEN 0 WHEN 'SUBMITTED' THEN 1 WHEN 'PARTIAL' THEN 2
+            WHEN 'FILLED' THEN 3 WHEN 'CANCELLED' THEN 4 WHEN 'REJECTED' THEN 5 WHEN 'EXPIRED' THEN 6 END;
+
+ALTER TABLE alerts ALTER COLUMN severity TYPE smallint USING
+    CASE severity::text WHEN 'INFO' THEN 0 WHEN 'WARNING' THEN 1 WHEN 'ERROR' THEN 2 WHEN 'CRITICAL' THEN 3 END;
+
+DROP TYPE IF EXISTS userrole, tradingmode, botstatus, orderside, positionstatus, ordertype, orderstatus, alertseverity;
+
+COMMIT;
@@ -0,0 +1,79 @@
+-- Store ids as native UUID (16 bytes) instead of VARCHAR(36).
+-- Existing values are hyphenated uuid4 strings and cast directly; new rows use uuid7.
+
+BEGIN;
+
+-- Drop every foreign key pointing at a converted key, whatever it is named
+-- (partition clones, conparentid <> 0, go with their parent constraint).
+DO $$
+DECLARE
+    fk record;
+BEGIN
+    FOR fk IN
+        SELECT conrelid::regclass AS tbl, conname
+        FROM pg_constraint
+        WHERE contype = 'f'
+          AND conparentid = 0
+          AND confrelid IN ('users'::regclass, 'bot_configurations'::regclass,
+                            'strategies'::regclass, 'orders'::regclass)
+    LOOP
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', fk.tbl, fk.conname);
+    END LOOP;
+END $$;
+
+ALTER TABLE users ALTER COLUMN id TYPE uuid USING id::uuid;
+ALTER TABLE user_sessions
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid;
+ALTER TABLE bot_configurations
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid;
+ALTER TABLE trades
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid,
+    ALTER COLUMN strategy_id TYPE uuid USING strategy_id::uuid;
+ALTER TABLE positions
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid;
+ALTER TABLE orders
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid,
+    ALTER COLUMN strategy_id TYPE uuid USING strategy_id::uuid;
+ALTER TABLE strategies
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN bot_config_id TYPE uuid USING bot_config_id::uuid;
+ALTER TABLE compliance_checks
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN order_id TYPE uuid USING order_id::uuid,
+    ALTER COLUMN trade_id TYPE uuid USING trade_id::uuid;
+ALTER TABLE audit_logs
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid,
+    ALTER COLUMN entity_id TYPE varchar(64);
+ALTER TABLE alerts
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid,
+    ALTER COLUMN strategy_id TYPE uuid USING strategy_id::uuid,
+    ALTER COLUMN order_id TYPE uuid USING order_id::uuid;
+ALTER TABLE daily_performance ALTER COLUMN user_id TYPE uuid USING user_id::uuid;
+ALTER TABLE backtests
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN user_id TYPE uuid USING user_id::uuid,
+    ALTER COLUMN strategy_id TYPE uuid USING strategy_id::uuid;
+ALTER TABLE venues ALTER COLUMN id TYPE uuid USING id::uuid;
+
+ALTER TABLE user_sessions ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE bot_configurations ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE trades ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE trades ADD FOREIGN KEY (strategy_id) REFERENCES strategies (id);
+ALTER TABLE positions ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE orders ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE orders ADD FOREIGN KEY (strategy_id) REFERENCES strategies (id);
+ALTER TABLE strategies ADD FOREIGN KEY (bot_config_id) REFERENCES bot_configurations (id);
+ALTER TABLE compliance_checks ADD FOREIGN KEY (order_id) REFERENCES orders (id);
+ALTER TABLE audit_logs ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE alerts ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE daily_performance ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE backtests ADD FOREIGN KEY (user_id) REFERENCES users (id);
+ALTER TABLE backtests ADD FOREIGN KEY (strategy_id) REFERENCES strategies (id);
+
+COMMIT;
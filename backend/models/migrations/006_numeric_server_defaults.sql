@@ -0,0 +1,37 @@
+-- Constant numeric defaults are supplied by the database (server_default)
+
+BEGIN;
+
+ALTER TABLE bot_configurations
+    ALTER COLUMN per_trade_var SET DEFAULT 0.001,
+    ALTER COLUMN max_daily_loss SET DEFAULT 0.005,
+    ALTER COLUMN rolling_drawdown_stop SET DEFAULT 0.0125,
+    ALTER COLUMN symbol_risk_cap SET DEFAULT 0.10,
+    ALTER COLUMN venue_risk_cap SET DEFAULT 0.35,
+    ALTER COLUMN slippage_p95_threshold SET DEFAULT 0.02,
+    ALTER COLUMN min_ev_ratio SET DEFAULT 2.0,
+    ALTER COLUMN reserved_capital SET DEFAULT 0,
+    ALTER COLUMN total_pnl SET DEFAULT 0,
+    ALTER COLUMN max_drawdown SET DEFAULT 0;
+
+ALTER TABLE trades
+    ALTER COLUMN commission SET DEFAULT 0,
+    ALTER COLUMN fees SET DEFAULT 0;
+
+ALTER TABLE positions
+    ALTER COLUMN unrealized_pnl SET DEFAULT 0,
+    ALTER COLUMN realized_pnl SET DEFAULT 0,
+    ALTER COLUMN total_pnl SET DEFAULT 0;
+
+ALTER TABLE strategies
+    ALTER COLUMN total_pnl SET DEFAULT 0;
+
+ALTER TABLE daily_performance
+    ALTER COLUMN gross_pnl SET DEFAULT 0,
+    ALTER COLUMN net_pnl SET DEFAULT 0,
+    ALTER COLUMN fees SET DEFAULT 0;
+
+ALTER TABLE venues
+    ALTER COLUMN risk_score SET DEFAULT 1.0;
+
+COMMIT;
@@ -0,0 +1,5 @@
+-- Partial index for the order router's live-order scan (status codes: 0 pending, 1 submitted, 2 partial)
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_live_venue_time
+    ON orders (venue, created_at)
+    WHERE status IN (0, 1, 2);
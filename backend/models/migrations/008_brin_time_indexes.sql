@@ -0,0 +1,17 @@
+-- BRIN indexes for append-only time columns.
+-- Only worthwhile while physical order tracks time; check first:
+--   SELECT tablename, attname, correlation FROM pg_stats
+--   WHERE (tablename, attname) IN (('market_data', 'timestamp'), ('audit_logs', 'timestamp'), ('daily_performance', 'date'));
+-- and keep the B-tree where correlation is below ~0.9.
+
+BEGIN;
+
+CREATE INDEX idx_market_data_ts_brin ON market_data USING brin (timestamp) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_audit_logs_timestamp;
+CREATE INDEX idx_audit_logs_ts_brin ON audit_logs USING brin (timestamp) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_daily_performance_date;
+CREATE INDEX idx_daily_performance_date_brin ON daily_performance USING brin (date) WITH (pages_per_range = 32);
+
+COMMIT;
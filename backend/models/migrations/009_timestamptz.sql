@@ -0,0 +1,79 @@
+-- Store all timestamps as TIMESTAMPTZ; existing naive values were written as UTC.
+-- Partition keys (trades.executed_at, market_data.timestamp, audit_logs.timestamp)
+-- were already converted by 003 before partitioning.
+
+BEGIN;
+
+ALTER TABLE users
+    ALTER COLUMN kyc_date TYPE timestamptz USING kyc_date AT TIME ZONE 'UTC',
+    ALTER COLUMN w8ben_expiry TYPE timestamptz USING w8ben_expiry AT TIME ZONE 'UTC',
+    ALTER COLUMN last_login TYPE timestamptz USING last_login AT TIME ZONE 'UTC',
+    ALTER COLUMN locked_until TYPE timestamptz USING locked_until AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC';
+
+ALTER TABLE user_sessions
+    ALTER COLUMN expires_at TYPE timestamptz USING expires_at AT TIME ZONE 'UTC',
+    ALTER COLUMN refresh_expires_at TYPE timestamptz USING refresh_expires_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN last_activity TYPE timestamptz USING last_activity AT TIME ZONE 'UTC';
+
+ALTER TABLE bot_configurations
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC',
+    ALTER COLUMN last_active TYPE timestamptz USING last_active AT TIME ZONE 'UTC';
+
+ALTER TABLE trades
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC';
+
+ALTER TABLE positions
+    ALTER COLUMN opened_at TYPE timestamptz USING opened_at AT TIME ZONE 'UTC',
+    ALTER COLUMN closed_at TYPE timestamptz USING closed_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC';
+
+ALTER TABLE orders
+    ALTER COLUMN expire_time TYPE timestamptz USING expire_time AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN submitted_at TYPE timestamptz USING submitted_at AT TIME ZONE 'UTC',
+    ALTER COLUMN filled_at TYPE timestamptz USING filled_at AT TIME ZONE 'UTC',
+    ALTER COLUMN cancelled_at TYPE timestamptz USING cancelled_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC';
+
+ALTER TABLE strategies
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC',
+    ALTER COLUMN last_signal_at TYPE timestamptz USING last_signal_at AT TIME ZONE 'UTC';
+
+ALTER TABLE market_data
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC';
+
+ALTER TABLE compliance_checks
+    ALTER COLUMN timestamp TYPE timestamptz USING timestamp AT TIME ZONE 'UTC';
+
+ALTER TABLE alerts
+    ALTER COLUMN sent_at TYPE timestamptz USING sent_at AT TIME ZONE 'UTC',
+    ALTER COLUMN acknowledged_at TYPE timestamptz USING acknowledged_at AT TIME ZONE 'UTC',
+    ALTER COLUMN resolved_at TYPE timestamptz USING resolved_at AT TIME ZONE 'UTC',
+    ALTER COLUMN timestamp TYPE timestamptz USING timestamp AT TIME ZONE 'UTC';
+
+ALTER TABLE daily_performance
+    ALTER COLUMN date TYPE timestamptz USING date AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC';
+
+ALTER TABLE backtests
+    ALTER COLUMN start_date TYPE timestamptz USING start_date AT TIME ZONE 'UTC',
+    ALTER COLUMN end_date TYPE timestamptz USING end_date AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN completed_at TYPE timestamptz USING completed_at AT TIME ZONE 'UTC';
+
+ALTER TABLE venues
+    ALTER COLUMN last_health_check TYPE timestamptz USING last_health_check AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC';
+
+DROP INDEX IF EXISTS ix_trades_order_id;
+ALTER TABLE trades DROP CONSTRAINT IF EXISTS uq_trades_order_id;
+CREATE UNIQUE INDEX uq_trades_order_id ON trades (order_id, executed_at DESC);
+
+COMMIT;
@@ -0,0 +1,49 @@
+-- Move per-fill performance counters off bot_configurations / strategies
+
+BEGIN;
+
+CREATE TABLE bot_metrics (
+    bot_config_id uuid PRIMARY KEY REFERENCES bot_configurations (id),
+    total_trades integer NOT NULL DEFAULT 0,
+    winning_trades integer NOT NULL DEFAULT 0,
+    total_pnl numeric(20, 8) NOT NULL DEFAULT 0,
+    max_drawdown numeric(10, 6) DEFAULT 0,
+    sharpe_ratio numeric(10, 4),
+    updated_at timestamptz
+);
+
+INSERT INTO bot_metrics (bot_config_id, total_trades, winning_trades, total_pnl, max_drawdown, sharpe_ratio, updated_at)
+SELECT id, coalesce(total_trades, 0), coalesce(winning_trades, 0), coalesce(total_pnl, 0),
+       max_drawdown, sharpe_ratio, updated_at
+FROM bot_configurations;
+
+ALTER TABLE bot_configurations
+    DROP COLUMN total_trades,
+    DROP COLUMN winning_trades,
+    DROP COLUMN total_pnl,
+    DROP COLUMN max_drawdown,
+    DROP COLUMN sharpe_ratio;
+
+CREATE TABLE strategy_metrics (
+    strategy_id uuid PRIMARY KEY REFERENCES strategies (id),
+    total_trades integer NOT NULL DEFAULT 0,
+    winning_trades integer NOT NULL DEFAULT 0,
+    total_pnl numeric(20, 8) NOT NULL DEFAULT 0,
+    sharpe_ratio numeric(10, 4),
+    max_drawdown numeric(10, 6),
+    updated_at timestamptz
+);
+
+INSERT INTO strategy_metrics (strategy_id, total_trades, winning_trades, total_pnl, sharpe_ratio, max_drawdown, updated_at)
+SELECT id, coalesce(total_trades, 0), coalesce(winning_trades, 0), coalesce(total_pnl, 0),
+       sharpe_ratio, max_drawdown, updated_at
+FROM strategies;
+
+ALTER TABLE strategies
+    DROP COLUMN total_trades,
+    DROP COLUMN winning_trades,
+    DROP COLUMN total_pnl,
+    DROP COLUMN sharpe_ratio,
+    DROP COLUMN max_drawdown;
+
+COMMIT;
@@ -0,0 +1,8 @@
+-- audit_logs.id becomes BIGSERIAL; rows now arrive through COPY in large batches
+
+BEGIN;
+
+ALTER SEQUENCE audit_logs_id_seq AS bigint;
+ALTER TABLE audit_logs ALTER COLUMN id TYPE bigint;
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Replace raw session tokens with SHA-256 digests of the JWTs handed to clients.
+-- Sessions are looked up by these digests, and existing rows have none, so they
+-- are deleted and every user signs in again; run in a maintenance window.
+
+BEGIN;
+
+DELETE FROM user_sessions;
+
+ALTER TABLE user_sessions
+    DROP COLUMN token,
+    DROP COLUMN refresh_token,
+    ADD COLUMN token_hash bytea NOT NULL,
+    ADD COLUMN refresh_token_hash bytea;
+
+CREATE UNIQUE INDEX ix_user_sessions_token_hash ON user_sessions (token_hash);
+CREATE UNIQUE INDEX ix_user_sessions_refresh_token_hash ON user_sessions (refresh_token_hash);
+
+COMMIT;
@@ -0,0 +1,25 @@
+-- daily_performance becomes a materialized view over trades (see DAILY_PERFORMANCE_VIEW_SQL)
+
+BEGIN;
+
+DROP TABLE IF EXISTS daily_performance;
+
+CREATE MATERIALIZED VIEW daily_performance AS
+SELECT
+    user_id,
+    (executed_at AT TIME ZONE 'UTC')::date AS date,
+    COUNT(*) AS trades_count,
+    COUNT(*) FILTER (WHERE realized_pnl > 0) AS winning_trades,
+    COUNT(*) FILTER (WHERE realized_pnl < 0) AS losing_trades,
+    COALESCE(SUM(realized_pnl), 0) AS gross_pnl,
+    COALESCE(SUM(realized_pnl), 0) - COALESCE(SUM(fees), 0) AS net_pnl,
+    COALESCE(SUM(fees), 0) AS fees,
+    AVG(slippage) AS average_slippage,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY slippage) AS p95_slippage
+FROM trades
+WHERE is_paper IS NOT TRUE
+GROUP BY 1, 2;
+
+CREATE UNIQUE INDEX uq_daily_performance_user_date ON daily_performance (user_id, date);
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Drop columns nothing reads or writes, and narrow over-wide VARCHARs
+
+BEGIN;
+
+ALTER TABLE users
+    DROP COLUMN w8ben_status,
+    ALTER COLUMN full_name TYPE varchar(100),
+    ALTER COLUMN password_hash TYPE varchar(100),
+    ALTER COLUMN api_secret_hash TYPE varchar(100);
+
+ALTER TABLE strategies DROP COLUMN canary_p95_slippage;
+ALTER TABLE trades DROP COLUMN tax_withheld;
+ALTER TABLE venues DROP COLUMN withdrawal_reliability;
+
+COMMIT;
@@ -0,0 +1,20 @@
+-- Let Postgres handle the children of a deleted user or strategy, so the ORM
+-- (passive_deletes) never loads the raise_on_sql collections to do it.
+-- Sessions go with their user; nullable references are cleared. Trades and
+-- positions still block deleting a user that has them.
+
+BEGIN;
+
+ALTER TABLE user_sessions DROP CONSTRAINT IF EXISTS user_sessions_user_id_fkey;
+ALTER TABLE user_sessions ADD FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE;
+
+ALTER TABLE alerts DROP CONSTRAINT IF EXISTS alerts_user_id_fkey;
+ALTER TABLE alerts ADD FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL;
+
+ALTER TABLE audit_logs DROP CONSTRAINT IF EXISTS audit_logs_user_id_fkey;
+ALTER TABLE audit_logs ADD FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL;
+
+ALTER TABLE trades DROP CONSTRAINT IF EXISTS trades_strategy_id_fkey;
+ALTER TABLE trades ADD FOREIGN KEY (strategy_id) REFERENCES strategies (id) ON DELETE SET NULL;
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- market_data volume and bid/ask sizes go back to unscaled NUMERIC: scaled by 1e8,
+-- a BIGINT tops out near 9.2e10 units, which high-supply tokens exceed in a day.
+
+BEGIN;
+
+ALTER TABLE market_data
+    ALTER COLUMN volume TYPE numeric(28, 8) USING volume / 100000000.0,
+    ALTER COLUMN bid_size TYPE numeric(28, 8) USING bid_size / 100000000.0,
+    ALTER COLUMN ask_size TYPE numeric(28, 8) USING ask_size / 100000000.0;
+
+COMMIT;
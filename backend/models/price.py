@@ -0,0 +1,23 @@
+"""
+AuraQuant Fixed-Point Prices
+Prices and quantities are stored as BIGINT scaled by 1e8 (satoshi-style)
+"""
+
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Union
+
+PRICE_SCALE = 10 ** 8
+
+Number = Union[Decimal, int, float, str]
+
+def to_scaled(value: Number) -> int:
+    """Convert a price or quantity to its scaled integer form."""
+    if isinstance(value, int):
+        return value * PRICE_SCALE
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int((value * PRICE_SCALE).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+def from_scaled(value: int) -> Decimal:
+    """Convert a scaled integer back to an exact Decimal."""
+    return Decimal(value) / PRICE_SCALE
@@ -3,55 +3,102 @@ Discord Notification Handler
 Sends trading signals and alerts to Discord channel
 """
 
-import discord
-from discord.ext import commands
+from __future__ import annotations
+
 import asyncio
-import json
 import os
+import random
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-import aiohttp
-from collections import deque
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Union
+import orjson
 import logging
 
+from .http import get_shared_session
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# discord.py is imported when a handler is created
+if TYPE_CHECKING:
+    import discord
+
+# Most outbound Discord requests allowed in flight at once
+MAX_CONCURRENT_SENDS = 10
+
+# Discord accepts up to 10 embeds per webhook call; wait briefly to fill a batch
+WEBHOOK_MAX_EMBEDS = 10
+WEBHOOK_LINGER = 0.05  # seconds
+WEBHOOK_MAX_ATTEMPTS = 3
+
+# Embed colors by action / alert type
+_COLORS = {
+    'buy': 0x00ff00,      # Green
+    'sell': 0xff0000,     # Red
+    'alert': 0xffff00,    # Yellow
+    'info': 0x0099ff,     # Blue
+    'warning': 0xff9900,  # Orange
+    'error': 0xff0000,    # Red
+    'success': 0x00ff00,  # Green
+    'critical': 0xff00ff  # Magenta
+}
+_DEFAULT_COLOR = _COLORS['info']
+
 class DiscordNotificationHandler:
     def __init__(self):
         """Initialize Discord notification handler"""
+        import discord
+        from discord.ext import commands
+        self._discord = discord
+        
         # Load configuration
         self.token = os.getenv('DISCORD_BOT_TOKEN')
         self.channel_id = int(os.getenv('DISCORD_CHANNEL_ID', '1407369896089616635'))
         self.webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
         
+        # Send-only deployments post through the webhook and never open a gateway connection
+        self.send_only = os.getenv('DISCORD_SEND_ONLY', 'false').lower() == 'true'
+        if self.send_only and not self.webhook_url:
+            raise ValueError("DISCORD_SEND_ONLY requires DISCORD_WEBHOOK_URL")
+        
         # Bot settings
         self.bot_name = "AuraQuant Trading Bot"
         self.bot_avatar = "https://i.imgur.com/your-avatar.png"  # Replace with your avatar
         
-        # Message queue
-        self.message_queue = deque(maxlen=100)
+        # Message queue, drained by a background task once the bot is ready
+        self.message_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
         self.is_connected = False
+        self._ready = asyncio.Event()
+        self._drainer: Optional[asyncio.Task] = None
+        self._channel = None
+        self._dropped_count = 0
+        
+        # Bounds in-flight sends so slow responses push back on producers
+        self._send_sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        
+        # Pending webhook embeds, posted together after a short linger
+        self._webhook_buf: List[Dict[str, Any]] = []
+        self._webhook_flush_task: Optional[asyncio.Task] = None
         
         # Discord client
-        intents = discord.Intents.default()
-        intents.message_content = True
-        self.bot = commands.Bot(command_prefix='!', intents=intents)
-        
-        # Setup bot events
-        self.setup_events()
-        
-        # Alert colors
-        self.colors = {
-            'buy': 0x00ff00,      # Green
-            'sell': 0xff0000,     # Red
-            'alert': 0xffff00,    # Yellow
-            'info': 0x0099ff,     # Blue
-            'warning': 0xff9900,  # Orange
-            'error': 0xff0000,    # Red
-            'success': 0x00ff00,  # Green
-            'critical': 0xff00ff  # Magenta
+        self.bot: Optional["commands.Bot"] = None
+        if not self.send_only:
+            intents = discord.Intents.default()
+            intents.message_content = True
+            self.bot = commands.Bot(command_prefix='!', intents=intents)
+            
+            # Setup bot events
+            self.setup_events()
+        
+        # Static parts of the webhook signal payload, built once
+        self._signal_template = {
+            'type': 'rich',
+            'footer': {'icon_url': self.bot_avatar},
+        }
+        self._manual_field = {
+            'name': "⚠️ Action Required",
+            'value': "Manual execution needed on broker platform",
+            'inline': False
         }
         
     def setup_events(self):
@@ -62,23 +109,28 @@ class DiscordNotificationHandler:
             """Called when bot is ready"""
             logger.info(f'{self.bot.user} has connected to Discord!')
             self.is_connected = True
+            self._channel = self.bot.get_channel(self.channel_id)
+            self._ready.set()
             
             # Set bot activity
             await self.bot.change_presence(
-                activity=discord.Activity(
-                    type=discord.ActivityType.watching,
+                activity=self._discord.Activity(
+                    type=self._discord.ActivityType.watching,
                     name="AuraQuant Markets"
                 )
             )
             
-            # Process queued messages
-            await self.process_queue()
+            # Drain queued messages in the background
+            if self._drainer is None or self._drainer.done():
+                self._drainer = asyncio.create_task(self._drain_loop())
             
         @self.bot.event
         async def on_disconnect():
             """Called when bot disconnects"""
             logger.warning('Bot disconnected from Discord')
             self.is_connected = False
+            self._channel = None
+            self._ready.clear()
             
         @self.bot.command(name='status')
         async def status(ctx):
@@ -116,6 +168,10 @@ class DiscordNotificationHandler:
                     
     async def start(self):
         """Start the Discord bot"""
+        if self.send_only:
+            logger.info("Discord send-only mode: using webhook, no gateway connection")
+            return
+            
         try:
             if self.token:
                 await self.bot.start(self.token)
@@ -126,30 +182,51 @@ class DiscordNotificationHandler:
             
     async def stop(self):
         """Stop the Discord bot"""
-        await self.bot.close()
+        if self._drainer is not None:
+            self._drainer.cancel()
+            self._drainer = None
+        if self.bot is not None:
+            await self.bot.close()
+        if self._webhook_flush_task is not None and not self._webhook_flush_task.done():
+            await self._webhook_flush_task
+        
+    def _get_channel(self):
+        """Target channel, looked up once per connection"""
+        if self._channel is None:
+            self._channel = self.bot.get_channel(self.channel_id)
+        return self._channel
         
     async def send_trading_signal(self, signal: Dict[str, Any]):
         """
         Send trading signal to Discord
         
+        Goes out through the webhook when one is configured. The bot channel is
+        the fallback, and is also used for manual signals, which need the
+        reaction buttons only the bot can add.
+        
         Args:
             signal: Trading signal data
         """
         try:
+            if self.send_only or (self.webhook_url and not signal.get('requires_manual', False)):
+                await self.send_webhook(self._signal_to_dict(signal))
+                return
+                
             # Create embed for trading signal
             embed = self.create_signal_embed(signal)
             
             if self.is_connected:
-                channel = self.bot.get_channel(self.channel_id)
+                channel = self._get_channel()
                 if channel:
-                    # Send main signal
-                    message = await channel.send(embed=embed)
-                    
-                    # Add reaction buttons for manual traders
-                    if signal.get('requires_manual', False):
-                        await message.add_reaction('✅')  # Execute
-                        await message.add_reaction('❌')  # Skip
-                        await message.add_reaction('⏰')  # Snooze
+                    async with self._send_sem:
+                        # Send main signal
+                        message = await channel.send(embed=embed)
+                        
+                        # Add reaction buttons for manual traders
+                        if signal.get('requires_manual', False):
+                            await message.add_reaction('✅')  # Execute
+                            await message.add_reaction('❌')  # Skip
+                            await message.add_reaction('⏰')  # Snooze
                         
                     logger.info(f"Signal sent to Discord: {signal.get('symbol')}")
                 else:
@@ -159,106 +236,53 @@ class DiscordNotificationHandler:
                 # Queue message if not connected
                 self.queue_message(embed)
                 
-            # Also send via webhook if available
-            if self.webhook_url:
-                await self.send_webhook(embed)
-                
         except Exception as e:
             logger.error(f"Error sending trading signal: {e}")
             
-    def create_signal_embed(self, signal: Dict[str, Any]) -> discord.Embed:
+    def create_signal_embed(self, signal: Dict[str, Any],
+                            include_timestamp: bool = True) -> discord.Embed:
         """Create Discord embed for trading signal"""
-        
-        # Determine color based on action
-        action = signal.get('action', 'info').lower()
-        color = self.colors.get(action, self.colors['info'])
-        
-        # Create embed
-        embed = discord.Embed(
-            title=f"🎯 {signal.get('action', 'SIGNAL').upper()} Signal - {signal.get('symbol', 'N/A')}",
-            color=color,
-            timestamp=datetime.utcnow()
-        )
-        
-        # Add signal details
-        embed.add_field(
-            name="Entry Price",
-            value=f"${signal.get('entry', 'Market')}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Stop Loss",
-            value=f"${signal.get('stop_loss', 'N/A')}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Take Profit",
-            value=f"${signal.get('take_profit', 'N/A')}",
-            inline=True
-        )
-        
-        # Add additional info
-        if signal.get('confidence'):
-            embed.add_field(
-                name="Confidence",
-                value=f"{signal['confidence']}%",
-                inline=True
-            )
-            
-        if signal.get('timeframe'):
-            embed.add_field(
-                name="Timeframe",
-                value=signal['timeframe'],
-                inline=True
-            )
+        return self._discord.Embed.from_dict(self._signal_to_dict(signal, include_timestamp))
+        
+    def _signal_to_dict(self, signal: Dict[str, Any],
+                        include_timestamp: bool = False) -> Dict[str, Any]:
+        """Build the embed dict for a signal; posted as-is by the webhook, wrapped by create_signal_embed"""
+        get = signal.get
+        action = get('action')
+        symbol = get('symbol', 'N/A')
+        confidence = get('confidence')
+        timeframe = get('timeframe')
+        strategy = get('strategy')
+        message = get('message')
+        risk_reward = get('risk_reward')
+        
+        fields = [
+            {'name': "Entry Price", 'value': f"${get('entry', 'Market')}", 'inline': True},
+            {'name': "Stop Loss", 'value': f"${get('stop_loss', 'N/A')}", 'inline': True},
+            {'name': "Take Profit", 'value': f"${get('take_profit', 'N/A')}", 'inline': True},
+        ]
+        if confidence:
+            fields.append({'name': "Confidence", 'value': f"{confidence}%", 'inline': True})
+        if timeframe:
+            fields.append({'name': "Timeframe", 'value': str(timeframe), 'inline': True})
+        if strategy:
+            fields.append({'name': "Strategy", 'value': str(strategy), 'inline': True})
+        fields.append({'name': "Source", 'value': str(get('source', 'TradingView')), 'inline': False})
+        if message:
+            fields.append({'name': "Notes", 'value': str(message), 'inline': False})
+        if risk_reward:
+            fields.append({'name': "Risk/Reward", 'value': f"1:{risk_reward}", 'inline': True})
+        if get('requires_manual', False):
+            fields.append(self._manual_field)
             
-        if signal.get('strategy'):
-            embed.add_field(
-                name="Strategy",
-                value=signal['strategy'],
-                inline=True
-            )
-            
-        # Add source
-        embed.add_field(
-            name="Source",
-            value=signal.get('source', 'TradingView'),
-            inline=False
-        )
-        
-        # Add message if present
-        if signal.get('message'):
-            embed.add_field(
-                name="Notes",
-                value=signal['message'],
-                inline=False
-            )
-            
-        # Add risk metrics
-        if signal.get('risk_reward'):
-            embed.add_field(
-                name="Risk/Reward",
-                value=f"1:{signal['risk_reward']}",
-                inline=True
-            )
-            
-        # Manual action required
-        if signal.get('requires_manual', False):
-            embed.add_field(
-                name="⚠️ Action Required",
-                value="Manual execution needed on broker platform",
-                inline=False
-            )
-            
-        # Set footer
-        embed.set_footer(
-            text=f"AuraQuant • {signal.get('broker', 'Multi-Broker')}",
-            icon_url=self.bot_avatar
-        )
-        
-        return embed
+        data = self._signal_template.copy()
+        data['title'] = f"🎯 {(action or 'SIGNAL').upper()} Signal - {symbol}"
+        data['color'] = _COLORS.get((action or 'info').lower(), _DEFAULT_COLOR)
+        if include_timestamp:
+            data['timestamp'] = datetime.utcnow().isoformat()
+        data['fields'] = fields
+        data['footer'] = {**self._signal_template['footer'], 'text': f"AuraQuant • {get('broker', 'Multi-Broker')}"}
+        return data
         
     async def send_alert(self, 
                          title: str, 
@@ -275,13 +299,13 @@ class DiscordNotificationHandler:
             fields: Additional fields to include
         """
         try:
-            color = self.colors.get(alert_type, self.colors['info'])
+            color = _COLORS.get(alert_type, _DEFAULT_COLOR)
             
-            embed = discord.Embed(
+            embed = self._discord.Embed(
                 title=title,
                 description=message,
                 color=color,
-                timestamp=datetime.utcnow()
+                timestamp=None if self.send_only else datetime.utcnow()
             )
             
             # Add fields if provided
@@ -291,10 +315,13 @@ class DiscordNotificationHandler:
                     
             embed.set_footer(text="AuraQuant Alert System")
             
-            if self.is_connected:
-                channel = self.bot.get_channel(self.channel_id)
+            if self.send_only:
+                await self.send_webhook(embed)
+            elif self.is_connected:
+                channel = self._get_channel()
                 if channel:
-                    await channel.send(embed=embed)
+                    async with self._send_sem:
+                        await channel.send(embed=embed)
             else:
                 self.queue_message(embed)
                 
@@ -304,10 +331,10 @@ class DiscordNotificationHandler:
     async def send_performance_update(self, stats: Dict[str, Any]):
         """Send daily performance update"""
         
-        embed = discord.Embed(
+        embed = self._discord.Embed(
             title="📊 Daily Performance Report",
-            color=self.colors['info'],
-            timestamp=datetime.utcnow()
+            color=_DEFAULT_COLOR,
+            timestamp=None if self.send_only else datetime.utcnow()
         )
         
         # Add performance metrics
@@ -348,11 +375,12 @@ class DiscordNotificationHandler:
         )
         
         # Add top performers
-        if stats.get('top_performers'):
-            performers = "\n".join([
-                f"{i+1}. {p['symbol']}: +{p['gain']:.2f}%"
-                for i, p in enumerate(stats['top_performers'][:3])
-            ])
+        top_performers = stats.get('top_performers')
+        if top_performers:
+            performers = "\n".join(
+                f"{i}. {p['symbol']}: +{p['gain']:.2f}%"
+                for i, p in enumerate(top_performers[:3], start=1)
+            )
             embed.add_field(
                 name="🏆 Top Performers",
                 value=performers or "N/A",
@@ -361,58 +389,124 @@ class DiscordNotificationHandler:
             
         embed.set_footer(text="AuraQuant Daily Report")
         
-        if self.is_connected:
-            channel = self.bot.get_channel(self.channel_id)
+        if self.send_only:
+            await self.send_webhook(embed)
+        elif self.is_connected:
+            channel = self._get_channel()
             if channel:
-                await channel.send(embed=embed)
+                async with self._send_sem:
+                    await channel.send(embed=embed)
                 
-    async def send_webhook(self, embed: discord.Embed):
-        """Send message via webhook (backup method)"""
+    async def send_webhook(self, embed: Union[discord.Embed, Dict[str, Any]]):
+        """Send message via webhook (backup method); accepts an Embed or its dict form"""
         if not self.webhook_url:
             return
             
+        self._webhook_buf.append(embed if isinstance(embed, dict) else embed.to_dict())
+        if self._webhook_flush_task is None or self._webhook_flush_task.done():
+            self._webhook_flush_task = asyncio.create_task(
+                self._flush_webhooks_after(WEBHOOK_LINGER)
+            )
+            
+    async def _flush_webhooks_after(self, delay: float):
+        """Post buffered webhook embeds in batches once the linger expires"""
+        await asyncio.sleep(delay)
+        while self._webhook_buf:
+            batch = self._webhook_buf[:WEBHOOK_MAX_EMBEDS]
+            del self._webhook_buf[:WEBHOOK_MAX_EMBEDS]
+            await self._post_webhook(batch)
+            
+    async def _post_webhook(self, embeds: List[Dict[str, Any]]):
+        """POST one batch of embeds to the webhook"""
         try:
-            webhook_data = {
-                "embeds": [embed.to_dict()]
-            }
+            webhook_data = orjson.dumps({
+                "embeds": embeds
+            })
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=webhook_data
-                ) as response:
-                    if response.status != 204:
-                        logger.error(f"Webhook failed: {response.status}")
+            session = await get_shared_session()
+            
+            for attempt in range(WEBHOOK_MAX_ATTEMPTS):
+                async with self._send_sem:
+                    async with session.post(
+                        self.webhook_url,
+                        data=webhook_data,
+                        headers={"Content-Type": "application/json"}
+                    ) as response:
+                        status = response.status
+                        retry_after = response.headers.get('Retry-After', '1')
                         
+                if status == 204:
+                    return
+                if attempt + 1 < WEBHOOK_MAX_ATTEMPTS:
+                    # Back off outside the semaphore so other sends keep flowing
+                    if status == 429:
+                        await asyncio.sleep(float(retry_after))
+                        continue
+                    if status >= 500:
+                        await asyncio.sleep(0.25 * 2 ** attempt + random.random() * 0.1)
+                        continue
+                logger.error(f"Webhook failed: {status}")
+                return
+                
         except Exception as e:
             logger.error(f"Webhook error: {e}")
             
     def queue_message(self, embed: discord.Embed):
-        """Queue message for later sending"""
-        self.message_queue.append({
+        """Queue message for later sending (drops the oldest when full)"""
+        msg = {
             'embed': embed,
             'timestamp': datetime.utcnow()
-        })
+        }
+        try:
+            self.message_queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            self.message_queue.get_nowait()
+            self.message_queue.put_nowait(msg)
+            self._dropped_count += 1
+            if self._dropped_count % 10 == 1:
+                logger.warning(
+                    f"Discord queue full, dropped oldest message ({self._dropped_count} dropped so far)"
+                )
         logger.info("Message queued for sending")
         
-    async def process_queue(self):
-        """Process queued messages"""
+    async def _send_one(self, channel, msg: Dict[str, Any]) -> bool:
+        """Send one queued message under the send semaphore; discord.py handles rate limits"""
+        try:
+            async with self._send_sem:
+                await channel.send(embed=msg['embed'])
+            return True
+        except Exception as e:
+            logger.error(f"Error processing queued message: {e}")
+            return False
+            
+    async def _drain_loop(self):
+        """Send queued messages as they arrive while connected"""
+        while True:
+            msg = await self.message_queue.get()
+            await self._ready.wait()
+            
+            channel = self._get_channel()
+            if not channel:
+                logger.error(f"Channel {self.channel_id} not found")
+                continue
+                
+            await self._send_one(channel, msg)
+            
+    async def process_queue(self, max_batch: int = 50):
+        """Send up to max_batch queued messages concurrently"""
         if not self.is_connected:
             return
             
-        channel = self.bot.get_channel(self.channel_id)
+        channel = self._get_channel()
         if not channel:
             return
             
-        processed = 0
-        while self.message_queue and processed < 10:  # Limit to 10 messages at once
-            msg = self.message_queue.popleft()
-            try:
-                await channel.send(embed=msg['embed'])
-                processed += 1
-                await asyncio.sleep(1)  # Rate limiting
-            except Exception as e:
-                logger.error(f"Error processing queued message: {e}")
+        batch = []
+        while len(batch) < max_batch and not self.message_queue.empty():
+            batch.append(self.message_queue.get_nowait())
+            
+        results = await asyncio.gather(*(self._send_one(channel, m) for m in batch))
+        processed = sum(results)
                 
         if processed > 0:
             logger.info(f"Processed {processed} queued messages")
@@ -434,76 +528,57 @@ class DiscordNotificationHandler:
         
     def create_balance_embed(self, balance: Dict[str, Any]) -> discord.Embed:
         """Create balance embed"""
-        
-        embed = discord.Embed(
-            title="💰 Account Balance",
-            color=self.colors['info'],
-            timestamp=datetime.utcnow()
-        )
-        
-        embed.add_field(
-            name="Total Balance",
-            value=f"${balance.get('total', 0):,.2f}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Available",
-            value=f"${balance.get('available', 0):,.2f}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Margin Used",
-            value=f"${balance.get('margin_used', 0):,.2f}",
-            inline=True
-        )
-        
         pnl = balance.get('pnl_today', 0)
         pnl_emoji = "📈" if pnl >= 0 else "📉"
-        embed.add_field(
-            name=f"{pnl_emoji} P&L Today",
-            value=f"${pnl:+,.2f}",
-            inline=False
-        )
         
-        return embed
+        return self._discord.Embed.from_dict({
+            'title': "💰 Account Balance",
+            'color': _DEFAULT_COLOR,
+            'timestamp': datetime.utcnow().isoformat(),
+            'fields': [
+                {'name': "Total Balance", 'value': f"${balance.get('total', 0):,.2f}", 'inline': True},
+                {'name': "Available", 'value': f"${balance.get('available', 0):,.2f}", 'inline': True},
+                {'name': "Margin Used", 'value': f"${balance.get('margin_used', 0):,.2f}", 'inline': True},
+                {'name': f"{pnl_emoji} P&L Today", 'value': f"${pnl:+,.2f}", 'inline': False},
+            ]
+        })
         
     def create_positions_embed(self, positions: List[Dict[str, Any]]) -> discord.Embed:
         """Create positions embed"""
-        
-        embed = discord.Embed(
-            title="📊 Open Positions",
-            color=self.colors['info'],
-            timestamp=datetime.utcnow()
-        )
+        data = {
+            'title': "📊 Open Positions",
+            'color': _DEFAULT_COLOR,
+            'timestamp': datetime.utcnow().isoformat(),
+        }
         
         if not positions:
-            embed.description = "No open positions"
+            data['description'] = "No open positions"
         else:
+            fields = []
             for pos in positions[:10]:  # Limit to 10 positions
                 pnl = pos.get('unrealized_pnl', 0)
                 pnl_emoji = "🟢" if pnl >= 0 else "🔴"
                 
-                embed.add_field(
-                    name=f"{pnl_emoji} {pos['symbol']}",
-                    value=(
+                fields.append({
+                    'name': f"{pnl_emoji} {pos['symbol']}",
+                    'value': (
                         f"Side: {pos['side']}\n"
                         f"Qty: {pos['quantity']}\n"
                         f"Entry: ${pos['entry_price']:.2f}\n"
                         f"P&L: ${pnl:+,.2f}"
                     ),
-                    inline=True
-                )
-                
-        return embed
+                    'inline': True
+                })
+            data['fields'] = fields
+            
+        return self._discord.Embed.from_dict(data)
 
 
 # Singleton instance
 discord_handler = None
 
 async def initialize_discord():
-    """Initialize Discord handler"""
+    """Initialize Discord handler on the caller's running loop (uvloop under the API servers)"""
     global discord_handler
     discord_handler = DiscordNotificationHandler()
     
@@ -552,4 +627,11 @@ if __name__ == "__main__":
         # Keep bot running
         await asyncio.Event().wait()
         
+    # Run on uvloop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+        
     asyncio.run(test())
@@ -0,0 +1,43 @@
+"""
+Shared HTTP Session
+One aiohttp ClientSession for every notification handler in the process
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+# aiohttp is imported when the session is first created
+if TYPE_CHECKING:
+    import aiohttp
+
+_SESSION: Optional[aiohttp.ClientSession] = None
+_LOCK = asyncio.Lock()
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use"""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        return _SESSION
+    async with _LOCK:
+        if _SESSION is None or _SESSION.closed:
+            import aiohttp
+
+            _SESSION = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=10,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=5.0)
+            )
+    return _SESSION
+
+async def close_shared_session():
+    """Close the shared session; call from the app's shutdown hook"""
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
@@ -5,17 +5,192 @@ Sends trading signals and alerts to Telegram
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from collections import ChainMap, deque
+from itertools import islice
+from typing import Dict, Any, Final, Optional, List
 from datetime import datetime
 import os
-from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, ParseMode
+import threading
+from pathlib import Path
+import httpx
+import orjson
+from telegram import Bot, ParseMode
+from telegram.utils.request import Request
 from telegram.ext import Updater, CommandHandler, CallbackQueryHandler, MessageHandler, Filters
 import json
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Long polling: Telegram holds getUpdates open for up to 50s when idle
+POLL_TIMEOUT = 50
+# Only the update types this bot has handlers for
+ALLOWED_UPDATES = ["message", "callback_query"]
+# Dispatcher thread pool for run_async handlers
+DISPATCHER_WORKERS = 16
+
+TELEGRAM_API_URL = "https://api.telegram.org"
+
+# Plain messages and alerts are buffered and sent together
+BATCH_FLUSH_INTERVAL = 3.0  # seconds
+MAX_MESSAGE_LENGTH = 4096   # Telegram's sendMessage limit
+# characters; flush early past this. Kept to a few messages per flush because
+# Telegram allows about 20 messages a minute into one chat
+MAX_BUFFER_SIZE = 4 * MAX_MESSAGE_LENGTH
+# Attempts per API call when Telegram answers 429 Too Many Requests
+MAX_SEND_ATTEMPTS = 5
+BATCH_SEPARATOR = "\n\n---\n\n"
+
+# Pending Bot API calls waiting for the sender task; the oldest is dropped when full
+OUTBOX_SIZE = 1000
+
+START_TEXT: Final[str] = (
+    "🎯 *Welcome to AuraQuant Trading Bot!*\n\n"
+    "I'll send you trading signals and alerts.\n\n"
+    "*Available Commands:*\n"
+    "/help - Show all commands\n"
+    "/status - Check bot status\n"
+    "/balance - View account balance\n"
+    "/positions - View open positions\n"
+    "/signals - View pending signals\n"
+    "/alerts - Manage alerts\n"
+    "/pause - Pause notifications\n"
+    "/resume - Resume notifications\n"
+)
+
+HELP_TEXT: Final[str] = """
+*📚 AuraQuant Bot Commands*
+
+*Trading Commands:*
+/balance - View account balance
+/positions - Show open positions
+/signals - View pending signals
+/execute [id] - Execute a signal
+
+*Alert Management:*
+/alerts - View alert status
+/pause - Pause all alerts
+/resume - Resume alerts
+
+*System Commands:*
+/status - Bot and system status
+/help - Show this help message
+
+*Quick Actions:*
+• React with ✅ to execute signal
+• React with ❌ to dismiss signal
+• React with ⏰ to snooze signal
+"""
+
+# Placeholder figures until the balance comes from the backend
+BALANCE_TEXT: Final[str] = """
+*💰 Account Balance*
+
+*Total Balance:* $10,000.00
+*Available:* $8,500.00
+*In Positions:* $1,500.00
+*Today's P&L:* +$250.00 (+2.5%)
+
+*By Broker:*
+• Binance: $5,000.00
+• NAB: $3,000.00
+• Plus500: $2,000.00
+"""
+
+# Signal message; missing signal keys fall back to _SIGNAL_DEFAULTS
+_SIGNAL_TMPL: Final[str] = """
+{emoji} *{action} Signal*
+
+*Symbol:* {symbol}
+*Price:* ${price:.2f}
+*Strategy:* {strategy}
+*Confidence:* {confidence}%
+*Timeframe:* {timeframe}
+
+*Risk Management:*
+• Stop Loss: ${stop_loss:.2f}
+• Take Profit: ${take_profit:.2f}
+• Risk/Reward: 1:{risk_reward:.1f}
+
+*Source:* {source}
+"""
+
+_SIGNAL_DEFAULTS: Final[Dict[str, Any]] = {
+    'action': 'SIGNAL',
+    'symbol': 'N/A',
+    'price': 0,
+    'strategy': 'Unknown',
+    'confidence': 0,
+    'timeframe': '1H',
+    'stop_loss': 0,
+    'take_profit': 0,
+    'risk_reward': 2,
+    'source': 'TradingView',
+}
+
+# Alert emoji by alert type
+_ALERT_EMOJI: Final[Dict[str, str]] = {
+    'info': 'ℹ️',
+    'warning': '⚠️',
+    'error': '❌',
+    'success': '✅',
+    'critical': '🚨'
+}
+
+# Manual-execution keyboard: (text, callback_data) per button, {id} filled per signal
+_KB_SHAPE: Final = (
+    (("✅ Execute", "execute_{id}"), ("❌ Dismiss", "dismiss_{id}")),
+    (("⏰ Snooze 15m", "snooze_{id}"),),
+)
+
+# Broker platform link row shown under manual-execution signals
+_BROKER_ROWS: Final[Dict[str, List[Dict[str, str]]]] = {
+    'NAB': [{'text': "🏦 Open NAB", 'url': "https://ib.nab.com.au/nabib/index.jsp"}],
+    'Plus500': [{'text': "📈 Open Plus500", 'url': "https://app.plus500.com"}],
+}
+
+STATUS_TEXT: Final[str] = """
+*🟢 System Status*
+
+*Bot Status:* Online ✅
+*Alerts:* {alerts}
+*Pending Signals:* {pending}
+*Open Positions:* {positions}
+*Connected Brokers:*
+• Binance: ✅
+• NAB: Manual Mode
+• Plus500: Manual Mode
+
+*Last Update:* {ts}
+        """
+
+class TelegramAPIError(RuntimeError):
+    """A Bot API call that returned ok=false"""
+    def __init__(self, method: str, error_code: Optional[int], description: Optional[str],
+                 retry_after: Optional[float] = None):
+        super().__init__(f"Telegram {method} failed: {description}")
+        self.error_code = error_code
+        self.description = description or ''
+        self.retry_after = retry_after
+
+def _split_lines(text: str, limit: int) -> List[str]:
+    """Split text into pieces of at most limit characters, breaking between
+    lines; only a single line longer than limit is cut mid-line"""
+    if len(text) <= limit:
+        return [text] if text else []
+    
+    pieces, current = [], ''
+    for line in text.splitlines(keepends=True):
+        if current and len(current) + len(line) > limit:
+            pieces.append(current.rstrip('\n'))
+            current = ''
+        while len(line) > limit:
+            pieces.append(line[:limit])
+            line = line[limit:]
+        current += line
+    if current:
+        pieces.append(current.rstrip('\n'))
+    return pieces
+
 class TelegramNotificationHandler:
     def __init__(self):
         """Initialize Telegram notification handler"""
@@ -23,23 +198,71 @@ class TelegramNotificationHandler:
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN', '8186673555:AAEZx3hK7kOYOXPQMqOw3ciZlXG2BW_WJnI')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID', '6995384125')
         
-        # Initialize bot
-        self.bot = Bot(token=self.bot_token)
-        self.updater = None
+        # Receive updates by webhook instead of polling when a public URL is configured
+        self.webhook_url = os.getenv('TELEGRAM_WEBHOOK_URL')
+        self.use_webhook = bool(self.webhook_url)
+        self.webhook_port = int(os.getenv('TELEGRAM_WEBHOOK_PORT', '8443'))
+        
+        # PTB bot and updater, built on first use (see the bot/updater properties)
+        self._bot: Optional[Bot] = None
+        self._updater: Optional[Updater] = None
+        self._init_lock = threading.RLock()
+        
+        # Outbound Bot API calls share one pooled HTTP/2 client
+        self._api_base = f"{TELEGRAM_API_URL}/bot{self.bot_token}"
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=10
+        )
+        
+        # Outgoing message buffer, flushed by _flush_loop
+        self.batch_flush_interval = BATCH_FLUSH_INTERVAL
+        self.max_buffer_size = MAX_BUFFER_SIZE
+        self._buffer: deque = deque()
+        self._buffer_bytes = 0
+        self._flush_now = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Outbound API calls, posted one after another by _drain_outbox
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self._sender_task: Optional[asyncio.Task] = None
         
         # Trading state
         self.alerts_enabled = True
-        self.pending_signals = []
+        self.pending_signals: deque = deque(maxlen=50)
         self.active_positions = {}
         
-        # Initialize updater for receiving commands
-        self.setup_command_handlers()
+    @property
+    def bot(self) -> Bot:
+        """PTB bot, created on first access"""
+        if self._bot is None:
+            with self._init_lock:
+                if self._bot is None:
+                    # The updater reuses this bot and its connection pool.
+                    # PTB needs workers + 4 connections when a bot is passed to Updater.
+                    request = Request(
+                        con_pool_size=DISPATCHER_WORKERS + 4,
+                        connect_timeout=5,
+                        read_timeout=20
+                    )
+                    self._bot = Bot(token=self.bot_token, request=request)
+        return self._bot
+    
+    @property
+    def updater(self) -> Optional[Updater]:
+        """Updater for receiving commands, created with its handlers on first access"""
+        if self._updater is None:
+            with self._init_lock:
+                if self._updater is None:
+                    self.setup_command_handlers()
+        return self._updater
         
     def setup_command_handlers(self):
         """Setup Telegram command handlers"""
         try:
-            self.updater = Updater(token=self.bot_token, use_context=True)
-            dispatcher = self.updater.dispatcher
+            updater = Updater(bot=self.bot, use_context=True, workers=DISPATCHER_WORKERS)
+            dispatcher = updater.dispatcher
             
             # Command handlers
             dispatcher.add_handler(CommandHandler("start", self.cmd_start))
@@ -51,118 +274,110 @@ class TelegramNotificationHandler:
             dispatcher.add_handler(CommandHandler("pause", self.cmd_pause))
             dispatcher.add_handler(CommandHandler("resume", self.cmd_resume))
             dispatcher.add_handler(CommandHandler("signals", self.cmd_signals))
-            dispatcher.add_handler(CommandHandler("execute", self.cmd_execute))
+            # Order actions run on the worker pool so they never hold up other updates
+            dispatcher.add_handler(CommandHandler("execute", self.cmd_execute, run_async=True))
             
             # Callback query handler for inline buttons
-            dispatcher.add_handler(CallbackQueryHandler(self.button_callback))
+            dispatcher.add_handler(CallbackQueryHandler(self.button_callback, run_async=True))
             
+            self._updater = updater
             logger.info("Telegram command handlers setup complete")
             
         except Exception as e:
-            logger.error(f"Error setting up Telegram handlers: {e}")
+            logger.error("Error setting up Telegram handlers: %s", e, exc_info=True)
     
-    def start(self):
+    async def start(self):
         """Start the Telegram bot"""
         try:
             if self.updater:
-                self.updater.start_polling()
-                logger.info("Telegram bot started and polling for messages")
+                if self.use_webhook:
+                    # The updater's webhook server answers 200 straight away and hands
+                    # the update to the dispatcher queue, so handlers never hold the request
+                    self.updater.start_webhook(
+                        listen="0.0.0.0",
+                        port=self.webhook_port,
+                        url_path=self.bot_token,
+                        webhook_url=f"{self.webhook_url.rstrip('/')}/{self.bot_token}",
+                        allowed_updates=ALLOWED_UPDATES
+                    )
+                    logger.info("Telegram bot started, receiving updates by webhook on port %s", self.webhook_port)
+                else:
+                    self.updater.start_polling(
+                        poll_interval=0.0,
+                        timeout=POLL_TIMEOUT,
+                        read_latency=2.0,
+                        allowed_updates=ALLOWED_UPDATES
+                    )
+                    logger.info("Telegram bot started and polling for messages")
                 
                 # Send startup message
-                self.send_message(
+                await self.send_message(
                     "🚀 *AuraQuant Trading Bot Started*\n\n"
                     "Ready to receive trading signals!\n"
                     "Type /help for available commands.",
                     parse_mode=ParseMode.MARKDOWN
                 )
         except Exception as e:
-            logger.error(f"Error starting Telegram bot: {e}")
+            logger.error("Error starting Telegram bot: %s", e, exc_info=True)
     
-    def stop(self):
+    async def stop(self):
         """Stop the Telegram bot"""
-        if self.updater:
-            self.updater.stop()
+        if self._updater:
+            self._updater.stop()
             logger.info("Telegram bot stopped")
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush_buffer()
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            self._sender_task = None
+        while not self._outbox.empty():
+            await self._send_one(*self._outbox.get_nowait())
+        await self._client.aclose()
+    
+    async def _post(self, method: str, payload: Dict[str, Any], files: Optional[Dict[str, Any]] = None):
+        """Call a Bot API method through the shared client and return its result"""
+        url = f"{self._api_base}/{method}"
+        if files:
+            response = await self._client.post(url, data=payload, files=files)
+        else:
+            response = await self._client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers={"content-type": "application/json"}
+            )
+        
+        data = response.json()
+        if not data.get('ok'):
+            raise TelegramAPIError(
+                method, data.get('error_code'), data.get('description'),
+                (data.get('parameters') or {}).get('retry_after')
+            )
+        return data.get('result')
     
     def cmd_start(self, update, context):
         """Handle /start command"""
-        update.message.reply_text(
-            "🎯 *Welcome to AuraQuant Trading Bot!*\n\n"
-            "I'll send you trading signals and alerts.\n\n"
-            "*Available Commands:*\n"
-            "/help - Show all commands\n"
-            "/status - Check bot status\n"
-            "/balance - View account balance\n"
-            "/positions - View open positions\n"
-            "/signals - View pending signals\n"
-            "/alerts - Manage alerts\n"
-            "/pause - Pause notifications\n"
-            "/resume - Resume notifications\n",
-            parse_mode=ParseMode.MARKDOWN
-        )
+        update.message.reply_text(START_TEXT, parse_mode=ParseMode.MARKDOWN)
     
     def cmd_help(self, update, context):
         """Handle /help command"""
-        help_text = """
-*📚 AuraQuant Bot Commands*
-
-*Trading Commands:*
-/balance - View account balance
-/positions - Show open positions
-/signals - View pending signals
-/execute [id] - Execute a signal
-
-*Alert Management:*
-/alerts - View alert status
-/pause - Pause all alerts
-/resume - Resume alerts
-
-*System Commands:*
-/status - Bot and system status
-/help - Show this help message
-
-*Quick Actions:*
-• React with ✅ to execute signal
-• React with ❌ to dismiss signal
-• React with ⏰ to snooze signal
-        """
-        update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
+        update.message.reply_text(HELP_TEXT, parse_mode=ParseMode.MARKDOWN)
     
     def cmd_status(self, update, context):
         """Handle /status command"""
-        status_text = f"""
-*🟢 System Status*
-
-*Bot Status:* Online ✅
-*Alerts:* {'Enabled ✅' if self.alerts_enabled else 'Paused ⏸️'}
-*Pending Signals:* {len(self.pending_signals)}
-*Open Positions:* {len(self.active_positions)}
-*Connected Brokers:*
-• Binance: ✅
-• NAB: Manual Mode
-• Plus500: Manual Mode
-
-*Last Update:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
+        status_text = STATUS_TEXT.format(
+            alerts='Enabled ✅' if self.alerts_enabled else 'Paused ⏸️',
+            pending=len(self.pending_signals),
+            positions=len(self.active_positions),
+            ts=datetime.now().isoformat(sep=' ', timespec='seconds')
+        )
         update.message.reply_text(status_text, parse_mode=ParseMode.MARKDOWN)
     
     def cmd_balance(self, update, context):
         """Handle /balance command"""
         # TODO: Fetch actual balance from backend
-        balance_text = """
-*💰 Account Balance*
-
-*Total Balance:* $10,000.00
-*Available:* $8,500.00
-*In Positions:* $1,500.00
-*Today's P&L:* +$250.00 (+2.5%)
-
-*By Broker:*
-• Binance: $5,000.00
-• NAB: $3,000.00
-• Plus500: $2,000.00
-        """
-        update.message.reply_text(balance_text, parse_mode=ParseMode.MARKDOWN)
+        update.message.reply_text(BALANCE_TEXT, parse_mode=ParseMode.MARKDOWN)
     
     def cmd_positions(self, update, context):
         """Handle /positions command"""
@@ -187,7 +402,7 @@ class TelegramNotificationHandler:
             return
         
         signals_text = "*📡 Pending Signals*\n\n"
-        for i, signal in enumerate(self.pending_signals[:5], 1):
+        for i, signal in enumerate(islice(self.pending_signals, 5), 1):
             signals_text += f"*{i}. {signal['symbol']} - {signal['action']}*\n"
             signals_text += f"• Price: ${signal.get('price', 0):.2f}\n"
             signals_text += f"• Confidence: {signal.get('confidence', 0)}%\n"
@@ -232,21 +447,29 @@ class TelegramNotificationHandler:
         query = update.callback_query
         query.answer()
         
-        data = query.data
-        if data.startswith("execute_"):
-            signal_id = data.replace("execute_", "")
-            query.edit_message_text(f"✅ Executing signal {signal_id}...")
-            # TODO: Execute signal
-            
-        elif data.startswith("dismiss_"):
-            signal_id = data.replace("dismiss_", "")
-            query.edit_message_text(f"❌ Signal {signal_id} dismissed")
-            
-        elif data.startswith("snooze_"):
-            signal_id = data.replace("snooze_", "")
-            query.edit_message_text(f"⏰ Signal {signal_id} snoozed for 15 minutes")
+        action, _, signal_id = query.data.partition("_")
+        handler = self._CALLBACK_ACTIONS.get(action)
+        if handler:
+            handler(self, query, signal_id)
+    
+    def _on_execute(self, query, signal_id: str):
+        query.edit_message_text(f"✅ Executing signal {signal_id}...")
+        # TODO: Execute signal
+    
+    def _on_dismiss(self, query, signal_id: str):
+        query.edit_message_text(f"❌ Signal {signal_id} dismissed")
     
-    def send_trading_signal(self, signal: Dict[str, Any]):
+    def _on_snooze(self, query, signal_id: str):
+        query.edit_message_text(f"⏰ Signal {signal_id} snoozed for 15 minutes")
+    
+    # Inline button callback_data prefix -> handler
+    _CALLBACK_ACTIONS = {
+        "execute": _on_execute,
+        "dismiss": _on_dismiss,
+        "snooze": _on_snooze,
+    }
+    
+    async def send_trading_signal(self, signal: Dict[str, Any]):
         """
         Send trading signal to Telegram
         
@@ -261,72 +484,42 @@ class TelegramNotificationHandler:
             # Format signal message
             action_emoji = "🟢" if signal.get('action') == 'BUY' else "🔴"
             
-            message = f"""
-{action_emoji} *{signal.get('action', 'SIGNAL')} Signal*
-
-*Symbol:* {signal.get('symbol', 'N/A')}
-*Price:* ${signal.get('price', 0):.2f}
-*Strategy:* {signal.get('strategy', 'Unknown')}
-*Confidence:* {signal.get('confidence', 0)}%
-*Timeframe:* {signal.get('timeframe', '1H')}
-
-*Risk Management:*
-• Stop Loss: ${signal.get('stop_loss', 0):.2f}
-• Take Profit: ${signal.get('take_profit', 0):.2f}
-• Risk/Reward: 1:{signal.get('risk_reward', 2):.1f}
-
-*Source:* {signal.get('source', 'TradingView')}
-"""
+            message = _SIGNAL_TMPL.format_map(ChainMap({'emoji': action_emoji}, signal, _SIGNAL_DEFAULTS))
             
             if signal.get('message'):
                 message += f"\n*Note:* {signal['message']}"
             
             # Add action buttons for manual trading
             if signal.get('requires_manual', False):
-                keyboard = [
-                    [
-                        InlineKeyboardButton("✅ Execute", callback_data=f"execute_{signal.get('id', 'unknown')}"),
-                        InlineKeyboardButton("❌ Dismiss", callback_data=f"dismiss_{signal.get('id', 'unknown')}")
-                    ],
-                    [
-                        InlineKeyboardButton("⏰ Snooze 15m", callback_data=f"snooze_{signal.get('id', 'unknown')}")
-                    ]
-                ]
-                
-                if signal.get('broker') == 'NAB':
-                    keyboard.append([
-                        InlineKeyboardButton("🏦 Open NAB", url="https://ib.nab.com.au/nabib/index.jsp")
-                    ])
-                elif signal.get('broker') == 'Plus500':
-                    keyboard.append([
-                        InlineKeyboardButton("📈 Open Plus500", url="https://app.plus500.com")
-                    ])
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
+                reply_markup = self._make_keyboard(signal.get('id', 'unknown'), signal.get('broker'))
                 
                 message += "\n⚠️ *Manual execution required*"
             else:
                 reply_markup = None
             
-            # Send message
-            self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=ParseMode.MARKDOWN,
-                reply_markup=reply_markup
-            )
+            # Send message (not batched, it may carry a keyboard)
+            self._queue_send(message, parse_mode=ParseMode.MARKDOWN, reply_markup=reply_markup)
             
             # Add to pending signals
             self.pending_signals.append(signal)
-            if len(self.pending_signals) > 50:
-                self.pending_signals = self.pending_signals[-50:]
             
-            logger.info(f"Signal sent to Telegram: {signal.get('symbol')}")
+            logger.info("Signal queued for Telegram: %s", signal.get('symbol'))
             
         except Exception as e:
-            logger.error(f"Error sending trading signal to Telegram: {e}")
+            logger.error("Error sending trading signal to Telegram: %s", e, exc_info=True)
     
-    def send_alert(self, title: str, message: str, alert_type: str = 'info'):
+    def _make_keyboard(self, signal_id: str, broker: Optional[str]) -> Dict[str, Any]:
+        """Inline keyboard for a manual signal, as a Bot API reply_markup dict"""
+        rows = [
+            [{'text': text, 'callback_data': data.format(id=signal_id)} for text, data in row]
+            for row in _KB_SHAPE
+        ]
+        broker_row = _BROKER_ROWS.get(broker)
+        if broker_row:
+            rows.append(broker_row)
+        return {'inline_keyboard': rows}
+    
+    async def send_alert(self, title: str, message: str, alert_type: str = 'info'):
         """
         Send general alert to Telegram
         
@@ -340,133 +533,234 @@ class TelegramNotificationHandler:
                 return
             
             # Choose emoji based on alert type
-            emoji = {
-                'info': 'ℹ️',
-                'warning': '⚠️',
-                'error': '❌',
-                'success': '✅',
-                'critical': '🚨'
-            }.get(alert_type, 'ℹ️')
+            emoji = _ALERT_EMOJI.get(alert_type, 'ℹ️')
             
             alert_message = f"{emoji} *{title}*\n\n{message}"
             
-            self.bot.send_message(
-                chat_id=self.chat_id,
-                text=alert_message,
-                parse_mode=ParseMode.MARKDOWN
-            )
+            await self.send_message(alert_message, parse_mode=ParseMode.MARKDOWN)
             
-            logger.info(f"Alert sent to Telegram: {title}")
+            logger.info("Alert queued for Telegram: %s", title)
             
         except Exception as e:
-            logger.error(f"Error sending alert to Telegram: {e}")
+            logger.error("Error sending alert to Telegram: %s", e, exc_info=True)
     
-    def send_message(self, message: str, parse_mode=None, reply_markup=None):
-        """Send a simple message to Telegram"""
-        try:
-            self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode,
-                reply_markup=reply_markup
+    async def send_message(self, message: str, parse_mode=None, reply_markup=None):
+        """Send a simple message to Telegram; messages without a keyboard are batched"""
+        if reply_markup:
+            self._queue_send(message, parse_mode, reply_markup)
+            return
+        
+        self._buffer.append((parse_mode, message))
+        self._buffer_bytes += len(message)
+        if self._buffer_bytes >= self.max_buffer_size:
+            self._flush_now.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    def _queue_send(self, message: str, parse_mode=None, reply_markup=None, parts: Optional[List[str]] = None):
+        """Hand one sendMessage call to the sender task without waiting for it.
+        parts are the original messages of a batch, resent one by one if the
+        joined text fails to parse."""
+        payload = {'chat_id': self.chat_id, 'text': message}
+        if parse_mode:
+            payload['parse_mode'] = parse_mode
+        if reply_markup:
+            payload['reply_markup'] = (
+                reply_markup.to_dict() if hasattr(reply_markup, 'to_dict') else reply_markup
             )
+        
+        item = ('sendMessage', payload, parts)
+        try:
+            self._outbox.put_nowait(item)
+        except asyncio.QueueFull:
+            self._outbox.get_nowait()
+            self._outbox.put_nowait(item)
+            logger.warning("Telegram outbox full, dropped oldest message")
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._drain_outbox())
+    
+    async def _send_one(self, method: str, payload: Dict[str, Any], parts: Optional[List[str]] = None):
+        try:
+            await self._post_with_retry(method, payload)
+        except TelegramAPIError as e:
+            if e.error_code != 400 or 'parse' not in e.description or 'parse_mode' not in payload:
+                logger.error("Error sending %s to Telegram: %s", method, e)
+                return
+            if parts and len(parts) > 1:
+                # One bad message shouldn't sink the rest of the batch
+                for part in parts:
+                    await self._send_one(method, {**payload, 'text': part})
+                return
+            logger.warning("Telegram could not parse %s text, resending as plain text", method)
+            plain = {k: v for k, v in payload.items() if k != 'parse_mode'}
+            await self._send_one(method, plain)
         except Exception as e:
-            logger.error(f"Error sending message to Telegram: {e}")
+            logger.error("Error sending %s to Telegram: %s", method, e, exc_info=True)
+    
+    async def _post_with_retry(self, method: str, payload: Dict[str, Any]):
+        """_post, waiting out 429 rate limits for as long as Telegram asks"""
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            try:
+                return await self._post(method, payload)
+            except TelegramAPIError as e:
+                if e.error_code != 429 or attempt == MAX_SEND_ATTEMPTS:
+                    raise
+                delay = e.retry_after or 1
+                logger.warning("Telegram rate limited %s, retrying in %ss", method, delay)
+                await asyncio.sleep(delay)
+    
+    async def _drain_outbox(self):
+        """Post queued API calls in order over the shared connection"""
+        while True:
+            method, payload, parts = await self._outbox.get()
+            await self._send_one(method, payload, parts)
     
-    def send_performance_report(self, stats: Dict[str, Any]):
+    async def _flush_loop(self):
+        """Flush the buffer every batch_flush_interval, or early when it grows too large"""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self.batch_flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            self._flush_buffer()
+    
+    def _flush_buffer(self):
+        """Queue buffered messages joined into as few sendMessage calls as fit"""
+        if not self._buffer:
+            return
+        
+        pending = list(self._buffer)
+        self._buffer.clear()
+        self._buffer_bytes = 0
+        
+        # Join consecutive messages that share a parse mode, up to the length limit.
+        # Long messages are split on line boundaries so markup isn't cut mid-entity.
+        chunks = []
+        mode, parts, size = None, [], 0
+        for parse_mode, text in pending:
+            for piece in _split_lines(text, MAX_MESSAGE_LENGTH):
+                if parts and (parse_mode != mode or size + len(BATCH_SEPARATOR) + len(piece) > MAX_MESSAGE_LENGTH):
+                    chunks.append((mode, parts))
+                    parts, size = [], 0
+                if not parts:
+                    mode = parse_mode
+                    size = len(piece)
+                else:
+                    size += len(BATCH_SEPARATOR) + len(piece)
+                parts.append(piece)
+        if parts:
+            chunks.append((mode, parts))
+        
+        for parse_mode, parts in chunks:
+            self._queue_send(BATCH_SEPARATOR.join(parts), parse_mode, parts=parts)
+    
+    async def send_performance_report(self, stats: Dict[str, Any]):
         """Send daily performance report"""
         try:
             pnl = stats.get('pnl_today', 0)
             pnl_emoji = "📈" if pnl >= 0 else "📉"
             
-            report = f"""
-*📊 Daily Performance Report*
-
-{pnl_emoji} *P&L Today:* ${pnl:+,.2f}
-*Win Rate:* {stats.get('win_rate', 0):.1f}%
-*Total Trades:* {stats.get('total_trades', 0)}
-*Account Balance:* ${stats.get('balance', 0):,.2f}
-*Open Positions:* {stats.get('open_positions', 0)}
-
-*Top Performers:*
-"""
-            
-            if stats.get('top_performers'):
-                for i, p in enumerate(stats['top_performers'][:3], 1):
-                    report += f"{i}. {p['symbol']}: +{p['gain']:.2f}%\n"
+            top_performers = stats.get('top_performers') or ()
             
-            report += f"\n*Bot Status:* {'🟢 Active' if stats.get('bot_active') else '🔴 Inactive'}"
+            report = "".join((
+                "\n*📊 Daily Performance Report*\n\n",
+                f"{pnl_emoji} *P&L Today:* ${pnl:+,.2f}\n",
+                f"*Win Rate:* {stats.get('win_rate', 0):.1f}%\n",
+                f"*Total Trades:* {stats.get('total_trades', 0)}\n",
+                f"*Account Balance:* ${stats.get('balance', 0):,.2f}\n",
+                f"*Open Positions:* {stats.get('open_positions', 0)}\n",
+                "\n*Top Performers:*\n",
+                "".join(
+                    f"{i}. {p['symbol']}: +{p['gain']:.2f}%\n"
+                    for i, p in enumerate(top_performers[:3], 1)
+                ),
+                "\n*Bot Status:* ",
+                "🟢 Active" if stats.get('bot_active') else "🔴 Inactive",
+            ))
             
-            self.send_message(report, parse_mode=ParseMode.MARKDOWN)
+            await self.send_message(report, parse_mode=ParseMode.MARKDOWN)
             
         except Exception as e:
-            logger.error(f"Error sending performance report: {e}")
+            logger.error("Error sending performance report: %s", e, exc_info=True)
     
-    def send_image(self, image_path: str, caption: str = None):
+    async def send_image(self, image_path: str, caption: str = None):
         """Send an image to Telegram"""
         try:
-            with open(image_path, 'rb') as photo:
-                self.bot.send_photo(
-                    chat_id=self.chat_id,
-                    photo=photo,
-                    caption=caption
-                )
+            payload = {'chat_id': self.chat_id}
+            if caption:
+                payload['caption'] = caption
+            # Read off the event loop so a large chart doesn't stall other sends
+            photo = await asyncio.to_thread(Path(image_path).read_bytes)
+            await self._post(
+                'sendPhoto',
+                payload,
+                files={'photo': (os.path.basename(image_path), photo)}
+            )
         except Exception as e:
-            logger.error(f"Error sending image to Telegram: {e}")
+            logger.error("Error sending image to Telegram: %s", e, exc_info=True)
 
 
 # Singleton instance
 telegram_handler = None
 
-def initialize_telegram():
+async def _not_initialized(*args, **kwargs):
+    logger.error("Telegram handler not initialized")
+
+# Targets of send_signal/send_alert, rebound by initialize_telegram
+_send_signal_impl = _not_initialized
+_send_alert_impl = _not_initialized
+
+async def initialize_telegram():
     """Initialize Telegram handler"""
-    global telegram_handler
+    global telegram_handler, _send_signal_impl, _send_alert_impl
     telegram_handler = TelegramNotificationHandler()
-    telegram_handler.start()
+    await telegram_handler.start()
+    _send_signal_impl = telegram_handler.send_trading_signal
+    _send_alert_impl = telegram_handler.send_alert
     return telegram_handler
 
-def send_signal(signal: Dict[str, Any]):
+async def send_signal(signal: Dict[str, Any]):
     """Send trading signal to Telegram"""
-    if telegram_handler:
-        telegram_handler.send_trading_signal(signal)
-    else:
-        logger.error("Telegram handler not initialized")
+    await _send_signal_impl(signal)
 
-def send_alert(title: str, message: str, alert_type: str = 'info'):
+async def send_alert(title: str, message: str, alert_type: str = 'info'):
     """Send alert to Telegram"""
-    if telegram_handler:
-        telegram_handler.send_alert(title, message, alert_type)
-    else:
-        logger.error("Telegram handler not initialized")
+    await _send_alert_impl(title, message, alert_type)
 
 
 if __name__ == "__main__":
-    # Test Telegram handler
-    handler = TelegramNotificationHandler()
-    handler.start()
-    
-    # Test signal
-    test_signal = {
-        'id': 'test_001',
-        'symbol': 'AAPL',
-        'action': 'BUY',
-        'price': 150.50,
-        'stop_loss': 148.00,
-        'take_profit': 155.00,
-        'confidence': 85,
-        'timeframe': '1H',
-        'strategy': 'EMA Crossover',
-        'source': 'TradingView',
-        'requires_manual': True,
-        'broker': 'NAB',
-        'risk_reward': 2.5,
-        'message': 'Strong bullish momentum detected'
-    }
+    logging.basicConfig(level=logging.INFO)
     
-    handler.send_trading_signal(test_signal)
-    
-    # Keep bot running
-    try:
-        handler.updater.idle()
-    except KeyboardInterrupt:
-        handler.stop()
+    # Test Telegram handler
+    async def test():
+        handler = TelegramNotificationHandler()
+        await handler.start()
+        
+        # Test signal
+        test_signal = {
+            'id': 'test_001',
+            'symbol': 'AAPL',
+            'action': 'BUY',
+            'price': 150.50,
+            'stop_loss': 148.00,
+            'take_profit': 155.00,
+            'confidence': 85,
+            'timeframe': '1H',
+            'strategy': 'EMA Crossover',
+            'source': 'TradingView',
+            'requires_manual': True,
+            'broker': 'NAB',
+            'risk_reward': 2.5,
+            'message': 'Strong bullish momentum detected'
+        }
+        
+        await handler.send_trading_signal(test_signal)
+        
+        # Keep bot running
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await handler.stop()
+            
+    asyncio.run(test())
@@ -16,6 +16,29 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# API fields mapped onto CryptoScreenerResult names
+_COINGECKO_COLUMNS = {
+    'current_price': 'price',
+    'total_volume': 'volume_24h',
+    'price_change_percentage_24h': 'change_24h',
+}
+_CMC_COLUMNS = {
+    'slug': 'id',
+    'quote_USD_price': 'price',
+    'quote_USD_volume_24h': 'volume_24h',
+    'quote_USD_percent_change_24h': 'change_24h',
+    'quote_USD_market_cap': 'market_cap',
+    'quote_USD_ath': 'ath',
+    'quote_USD_percent_change_from_ath': 'ath_change_percentage',
+    'quote_USD_atl': 'atl',
+    'quote_USD_percent_change_from_atl': 'atl_change_percentage',
+}
+_NUMERIC_COLUMNS = [
+    'price', 'change_24h', 'volume_24h', 'market_cap', 'circulating_supply',
+    'ath', 'ath_change_percentage', 'atl', 'atl_change_percentage',
+]
+_RESULT_COLUMNS = ['id', 'symbol', 'name'] + _NUMERIC_COLUMNS[:5] + ['total_supply'] + _NUMERIC_COLUMNS[5:] + ['score']
+
 @dataclass
 class CryptoScreenerResult:
     id: str
@@ -121,12 +144,8 @@ class CryptoScreener:
         if not data:
             return []
         
-        results = self._process_screener_data(data, config)
-        
-        # Sort by score
-        results.sort(key=lambda x: x.score, reverse=True)
-        
-        return results[:limit]
+        # Sorted by score, best first
+        return self._process_screener_data(data, config, limit)
     
     async def _fetch_coingecko_data(self, config: Dict, limit: int) -> Optional[List[Dict]]:
         """Fetch data from CoinGecko API"""
@@ -201,119 +220,77 @@ class CryptoScreener:
             logger.error(f"Error fetching CoinMarketCap data: {e}")
             return None
     
-    def _process_screener_data(self, data: List[Dict], config: Dict) -> List[CryptoScreenerResult]:
-        """Process raw data from APIs into standardized format"""
-        results = []
+    def _process_screener_data(self, data: List[Dict], config: Dict,
+                               limit: Optional[int] = None) -> List[CryptoScreenerResult]:
+        """Process raw data from APIs into standardized format, best score first"""
+        try:
+            if 'quote' in data[0]: # CoinMarketCap format
+                df = pd.json_normalize(data, sep='_').drop(columns='id', errors='ignore')
+                df = df.rename(columns=_CMC_COLUMNS)
+            else: # CoinGecko format
+                df = pd.DataFrame(data).rename(columns=_COINGECKO_COLUMNS)
+            
+            df = df.reindex(columns=_RESULT_COLUMNS[:-1])
+            df[_NUMERIC_COLUMNS] = df[_NUMERIC_COLUMNS].apply(pd.to_numeric, errors='coerce')
+            
+            mask = (
+                (df.volume_24h >= config.get('min_volume_24h', 0))
+                & (df.change_24h >= config.get('min_change_24h', -100))
+                & (df.change_24h <= config.get('max_change_24h', 10000))
+            )
+            df = df.loc[mask].copy()
+            df[_NUMERIC_COLUMNS] = df[_NUMERIC_COLUMNS].fillna(0)
+            
+            masks = self._signal_masks(df)
+            df['score'] = self._calculate_score(df, masks, config)
+            df = df.nlargest(limit, 'score') if limit else df.sort_values('score', ascending=False)
+            df['total_supply'] = df['total_supply'].astype(object).where(df['total_supply'].notna(), None)
+            signals = self._generate_signals(masks, df.index)
+        except Exception as e:
+            logger.error(f"Error processing crypto data: {e}")
+            return []
         
-        for item in data:
-            try:
-                if 'id' in item: # CoinGecko format
-                    price = item.get('current_price', 0)
-                    change_24h = item.get('price_change_percentage_24h', 0)
-                    volume_24h = item.get('total_volume', 0)
-                    
-                    if volume_24h < config.get('min_volume_24h', 0):
-                        continue
-                    if change_24h < config.get('min_change_24h', -100):
-                        continue
-                    if change_24h > config.get('max_change_24h', 10000):
-                        continue
-                        
-                    result = CryptoScreenerResult(
-                        id=item['id'],
-                        symbol=item['symbol'],
-                        name=item['name'],
-                        price=price,
-                        change_24h=change_24h,
-                        volume_24h=volume_24h,
-                        market_cap=item.get('market_cap', 0),
-                        circulating_supply=item.get('circulating_supply', 0),
-                        total_supply=item.get('total_supply'),
-                        ath=item.get('ath', 0),
-                        ath_change_percentage=item.get('ath_change_percentage', 0),
-                        atl=item.get('atl', 0),
-                        atl_change_percentage=item.get('atl_change_percentage', 0),
-                        score=0.0,
-                        signals=[]
-                    )
-                else: # CoinMarketCap format
-                    quote = item['quote']['USD']
-                    volume_24h = quote.get('volume_24h', 0)
-                    change_24h = quote.get('percent_change_24h', 0)
-                    
-                    if volume_24h < config.get('min_volume_24h', 0):
-                        continue
-                    if change_24h < config.get('min_change_24h', -100):
-                        continue
-                    if change_24h > config.get('max_change_24h', 10000):
-                        continue
-                        
-                    result = CryptoScreenerResult(
-                        id=item['slug'],
-                        symbol=item['symbol'],
-                        name=item['name'],
-                        price=quote.get('price', 0),
-                        change_24h=change_24h,
-                        volume_24h=volume_24h,
-                        market_cap=quote.get('market_cap', 0),
-                        circulating_supply=item.get('circulating_supply', 0),
-                        total_supply=item.get('total_supply'),
-                        ath=quote.get('ath', 0),
-                        ath_change_percentage=quote.get('percent_change_from_ath', 0),
-                        atl=quote.get('atl', 0),
-                        atl_change_percentage=quote.get('percent_change_from_atl', 0),
-                        score=0.0,
-                        signals=[]
-                    )
-                
-                # Generate signals and score
-                result.signals = self._generate_signals(result)
-                result.score = self._calculate_score(result, config)
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error processing crypto item: {e}")
-                continue
-                
-        return results
+        # Only the rows that survived filtering and the limit become results
+        return [
+            CryptoScreenerResult(**row, signals=row_signals)
+            for row, row_signals in zip(df[_RESULT_COLUMNS].to_dict('records'), signals)
+        ]
     
-    def _generate_signals(self, data: CryptoScreenerResult) -> List[str]:
-        signals = []
+    def _signal_masks(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """One boolean column per signal, in the order signals are reported"""
+        strong = df.change_24h > 20
+        large_cap = df.market_cap > 10000000000
+        near_ath = df.ath_change_percentage > -10
         
-        if data.change_24h > 20:
-            signals.append('strong_bullish_momentum')
-        elif data.change_24h > 5:
-            signals.append('bullish_momentum')
-        
-        if data.volume_24h > 50000000:
-            signals.append('high_volume')
-        
-        if data.market_cap > 10000000000:
-            signals.append('large_cap')
-        elif data.market_cap < 10000000:
-            signals.append('micro_cap')
-        
-        if data.ath_change_percentage > -10:
-            signals.append('near_ath')
-        elif data.atl_change_percentage < 100:
-            signals.append('near_atl')
-            
-        return signals
+        return {
+            'strong_bullish_momentum': strong,
+            'bullish_momentum': (df.change_24h > 5) & ~strong,
+            'high_volume': df.volume_24h > 50000000,
+            'large_cap': large_cap,
+            'micro_cap': (df.market_cap < 10000000) & ~large_cap,
+            'near_ath': near_ath,
+            'near_atl': (df.atl_change_percentage < 100) & ~near_ath,
+        }
     
-    def _calculate_score(self, data: CryptoScreenerResult, config: Dict) -> float:
-        score = 0.0
-        
-        score += min(abs(data.change_24h) * 2, 50)
-        score += min(np.log(data.volume_24h) * 2, 30) if data.volume_24h > 0 else 0
-        score += min(np.log(data.market_cap) * 1, 20) if data.market_cap > 0 else 0
+    def _generate_signals(self, masks: Dict[str, pd.Series], index: pd.Index) -> List[List[str]]:
+        """Signal names for each row in index, read off the precomputed masks"""
+        labels = np.array(list(masks), dtype=object)
+        flags = np.column_stack([mask.loc[index].to_numpy() for mask in masks.values()])
+        return [labels[row].tolist() for row in flags]
+    
+    def _calculate_score(self, df: pd.DataFrame, masks: Dict[str, pd.Series], config: Dict) -> pd.Series:
+        """Score every row at once: momentum, volume and market cap, capped at 100"""
+        score = (
+            np.minimum(df.change_24h.abs() * 2, 50)
+            + np.minimum(np.log(df.volume_24h.clip(lower=1)) * 2, 30)
+            + np.minimum(np.log(df.market_cap.clip(lower=1)) * 1, 20)
+        )
         
         if 'trending' in config or 'gainers' in config:
-            if 'bullish_momentum' in data.signals:
-                score += 10
-            if 'strong_bullish_momentum' in data.signals:
-                score += 15
+            score += np.where(masks['bullish_momentum'], 10, 0)
+            score += np.where(masks['strong_bullish_momentum'], 15, 0)
         
-        return min(score, 100)
+        return np.minimum(score, 100)
     
     async def cleanup(self):
         if self.session:
@@ -112,7 +112,13 @@ class AuraQuantIntegration {
                 };
                 
                 this.wsConnection.onmessage = (event) => {
-                    this.handleWebSocketMessage(JSON.parse(event.data));
+                    const data = JSON.parse(event.data);
+                    if (data && data.type === 'batch' && Array.isArray(data.items)) {
+                        // Backend folds queued messages into a single batch frame
+                        data.items.forEach(item => this.handleWebSocketMessage(item));
+                        return;
+                    }
+                    this.handleWebSocketMessage(data);
                 };
                 
             } catch (error) {
@@ -457,6 +457,12 @@ class AdvancedWebSocketManager {
                 return;
             }
             
+            if (data && data.type === 'batch' && Array.isArray(data.items)) {
+                // Backend folds queued messages into a single batch frame
+                data.items.forEach(item => this.routeMessage(id, item));
+                return;
+            }
+            
             this.routeMessage(id, data);
             
         } catch (error) {